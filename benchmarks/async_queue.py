@@ -0,0 +1,80 @@
+"""
+Measure producer/consumer throughput on one event loop for AsyncQueue and
+AsyncStack, against asyncio.Queue and against the previous approach of
+calling QueueUsingQueue through run_in_executor.
+
+Run with: python benchmarks/async_queue.py [item_count]
+"""
+import sys
+import os
+import asyncio
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.queue import AsyncQueue, QueueUsingQueue
+from data_structures.stack import AsyncStack
+
+
+async def one_by_one(put, get, count):
+    async def produce():
+        for i in range(count):
+            await put(i)
+
+    async def consume():
+        for _ in range(count):
+            await get()
+
+    await asyncio.gather(produce(), consume())
+
+
+async def batched(container, count, batch):
+    async def produce():
+        for i in range(count):
+            await container.enqueue(i)
+
+    async def consume():
+        received = 0
+        while received < count:
+            received += len(await container.get_many(batch))
+
+    await asyncio.gather(produce(), consume())
+
+
+async def via_executor(count):
+    loop = asyncio.get_running_loop()
+    queue = QueueUsingQueue()
+    for i in range(count):
+        await loop.run_in_executor(None, queue.enqueue, i)
+        await loop.run_in_executor(None, queue.queue.get)
+
+
+def timed(coroutine):
+    start = time.perf_counter()
+    asyncio.run(coroutine)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    capacity = 1_000
+    print(f"{count} items, capacity {capacity}")
+    print(f"{'variant':<40} {'items/s':>12}")
+    queue = asyncio.Queue(capacity)
+    rows = [
+        ("asyncio.Queue", lambda: one_by_one(queue.put, queue.get, count)),
+    ]
+    async_queue = AsyncQueue(capacity)
+    rows.append(("AsyncQueue enqueue/dequeue", lambda: one_by_one(async_queue.enqueue, async_queue.dequeue, count)))
+    async_stack = AsyncStack(capacity)
+    rows.append(("AsyncStack push/pop", lambda: one_by_one(async_stack.push, async_stack.pop, count)))
+    rows.append(("AsyncQueue get_many(100)", lambda: batched(AsyncQueue(capacity), count, 100)))
+    executor_count = count // 10
+    rows.append((f"QueueUsingQueue via executor ({executor_count})", lambda: via_executor(executor_count)))
+    for name, make in rows:
+        items = executor_count if "executor" in name else count
+        print(f"{name:<40} {items / timed(make()):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Measure float throughput of CircularQueue with object storage and with typed storage.
+
+A producer enqueues batches of floats and a consumer dequeues them in
+batches, as a telemetry pipeline would. Object storage copies the items
+out as a list; typed storage copies raw memory in and returns views out.
+
+Run with: python benchmarks/circular_queue.py [item_count] [batch_size]
+"""
+import sys
+import os
+import time
+from array import array
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.imports import np
+from data_structures.queue import CircularQueue
+
+
+def stream(queue, batch, count):
+    start = time.perf_counter()
+    for _ in range(count // len(batch)):
+        queue.enqueue_many(batch)
+        queue.dequeue_many(len(batch))
+    return time.perf_counter() - start
+
+
+def stream_single(queue, batch, count):
+    start = time.perf_counter()
+    for _ in range(count // len(batch)):
+        for value in batch:
+            queue.enqueue(value)
+        for _ in batch:
+            queue.dequeue()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 4096
+    values = [i + 0.5 for i in range(batch_size)]
+    capacity = batch_size * 3 // 2
+    rows = [
+        ("objects, enqueue/dequeue", lambda: stream_single(CircularQueue(capacity), values, count)),
+        ("objects, *_many(list)", lambda: stream(CircularQueue(capacity), values, count)),
+        ("typed d, *_many(list)", lambda: stream(CircularQueue(capacity, dtype="d"), values, count)),
+        ("typed d, *_many(array)", lambda: stream(CircularQueue(capacity, dtype="d"), array("d", values), count)),
+    ]
+    if np is not None:
+        rows.append(("numpy d, *_many(ndarray)",
+                     lambda: stream(CircularQueue(capacity, dtype="d", backend="numpy"), np.array(values), count)))
+    print(f"{count} floats in batches of {batch_size}; NumPy {'available' if np is not None else 'not installed'}")
+    print(f"{'storage, operations':<28} {'seconds':>8} {'M items/s':>10}")
+    for name, run in rows:
+        elapsed = run()
+        print(f"{name:<28} {elapsed:>8.3f} {count / elapsed / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
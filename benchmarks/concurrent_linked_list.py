@@ -0,0 +1,87 @@
+"""
+Compare ConcurrentDoublyLinkedList (hand-over-hand locking) against
+DoublyLinkedListWithTail behind a single coarse lock, with several writer
+threads running a mix of append, prepend, insert_after and delete_by_key.
+
+Under a GIL build only one thread runs Python code at a time, so the extra
+per-node lock traffic usually makes the fine-grained list slower; the
+comparison is meant for free-threaded builds (python3.13t and later) and for
+workloads where threads block inside the critical section.
+
+Run with: python benchmarks/concurrent_linked_list.py [ops_per_thread] [list_size]
+"""
+import sys
+import os
+import time
+from threading import Lock, Thread
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.linked_list import DoublyLinkedListWithTail
+from data_structures.concurrent_linked_list import ConcurrentDoublyLinkedList
+
+
+class CoarseLockedList:
+    """DoublyLinkedListWithTail with every operation behind one lock."""
+
+    def __init__(self, iterable):
+        self._list = DoublyLinkedListWithTail.from_iterable(iterable)
+        self._lock = Lock()
+
+    def append(self, data):
+        with self._lock:
+            self._list.append(data)
+
+    def prepend(self, data):
+        with self._lock:
+            self._list.prepend(data)
+
+    def insert_after(self, prev_node_data, data):
+        with self._lock:
+            self._list.insert_after(prev_node_data, data)
+
+    def delete_by_key(self, key):
+        with self._lock:
+            self._list.delete_by_key(key)
+
+
+def worker(linked_list, worker_id, ops):
+    base = (worker_id + 1) * 10_000_000
+    for i in range(ops):
+        key = base + i
+        if i % 2:
+            linked_list.append(key)
+        else:
+            linked_list.prepend(key)
+        linked_list.insert_after(key, -key)
+        linked_list.delete_by_key(-key)
+        linked_list.delete_by_key(key)
+
+
+def run(factory, threads, ops, list_size):
+    linked_list = factory(range(list_size))
+    workers = [Thread(target=worker, args=(linked_list, i, ops)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops * 4 / elapsed
+
+
+def main():
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    list_size = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, "
+          f"{ops} rounds per thread, {list_size} items to start")
+    print(f"{'threads':>7} {'coarse lock ops/s':>18} {'hand-over-hand ops/s':>21}")
+    for threads in (1, 2, 4, 8):
+        coarse = run(CoarseLockedList, threads, ops, list_size)
+        fine = run(ConcurrentDoublyLinkedList.from_iterable, threads, ops, list_size)
+        print(f"{threads:>7} {coarse:>18,.0f} {fine:>21,.0f}")
+
+
+if __name__ == "__main__":
+    main()
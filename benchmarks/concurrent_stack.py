@@ -0,0 +1,52 @@
+"""
+Measure push/pop throughput of ConcurrentStack against StackUsingLifoQueue
+with 1, 4 and 16 threads that each push and pop the same number of items.
+The LifoQueue baseline pops with a blocking get(), since another thread may
+take the item a worker just pushed.
+
+Run with: python benchmarks/concurrent_stack.py [ops_per_thread]
+"""
+import sys
+import os
+import time
+from threading import Thread
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.stack import ConcurrentStack, StackUsingLifoQueue
+
+
+def lifoqueue_worker(stack, ops):
+    for i in range(ops):
+        stack.push(i)
+        stack.stack.get()
+
+
+def concurrent_worker(stack, ops):
+    for i in range(ops):
+        stack.push(i)
+        stack.pop()
+
+
+def run(stack, worker, threads, ops):
+    workers = [Thread(target=worker, args=(stack, ops)) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return threads * ops * 2 / (time.perf_counter() - start)
+
+
+def main():
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    print(f"{ops} push/pop pairs per thread")
+    print(f"{'threads':>7} {'StackUsingLifoQueue ops/s':>26} {'ConcurrentStack ops/s':>22} {'speed-up':>9}")
+    for threads in (1, 4, 16):
+        baseline = run(StackUsingLifoQueue(), lifoqueue_worker, threads, ops)
+        concurrent = run(ConcurrentStack(), concurrent_worker, threads, ops)
+        print(f"{threads:>7} {baseline:>26,.0f} {concurrent:>22,.0f} {concurrent / baseline:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Compare IndexedPriorityQueue with lazy deletion on heapq and on queue.PriorityQueue
+for a scheduler workload that reprioritizes far more often than it dequeues.
+
+Lazy deletion pushes a new entry on every reprioritization and skips stale
+entries when dequeuing, so its heap grows with the number of updates;
+IndexedPriorityQueue moves the existing entry and stays at one entry per task.
+
+Run with: python benchmarks/indexed_priority_queue.py [task_count] [updates_per_dequeue]
+"""
+import sys
+import os
+import time
+import heapq
+from queue import PriorityQueue
+from random import Random
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.queue import IndexedPriorityQueue
+
+
+def workload(tasks, updates_per_dequeue):
+    rng = Random(25)
+    steps = []
+    for _ in range(tasks):
+        for _ in range(updates_per_dequeue):
+            steps.append((rng.randrange(tasks), rng.random()))
+        steps.append(None)
+    return steps
+
+
+def run_indexed(tasks, steps, thread_safe):
+    queue = IndexedPriorityQueue(thread_safe=thread_safe)
+    for task in range(tasks):
+        queue.enqueue(task, 1.0)
+    largest = 0
+    for step in steps:
+        if step is None:
+            queue.dequeue()
+        elif step[0] in queue:
+            queue.update_priority(*step)
+        largest = max(largest, len(queue.heap))
+    return largest
+
+
+def run_lazy(tasks, steps, push, pop, size):
+    current = {}
+    sequence = 0
+    for task in range(tasks):
+        sequence += 1
+        current[task] = sequence
+        push((1.0, sequence, task))
+    largest = 0
+    for step in steps:
+        if step is None:
+            while True:
+                _, stamp, task = pop()
+                if current.get(task) == stamp:
+                    del current[task]
+                    break
+        elif step[0] in current:
+            sequence += 1
+            current[step[0]] = sequence
+            push((step[1], sequence, step[0]))
+        largest = max(largest, size())
+    return largest
+
+
+def run_heapq(tasks, steps):
+    heap = []
+    return run_lazy(tasks, steps, lambda entry: heapq.heappush(heap, entry), lambda: heapq.heappop(heap), heap.__len__)
+
+
+def run_priorityqueue(tasks, steps):
+    queue = PriorityQueue()
+    return run_lazy(tasks, steps, queue.put, queue.get, queue.qsize)
+
+
+def main():
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    updates = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    steps = workload(tasks, updates)
+    print(f"{tasks} tasks, {updates} reprioritizations per dequeue")
+    print(f"{'implementation':<40} {'seconds':>8} {'peak heap entries':>18}")
+    rows = [
+        ("PriorityQueue + lazy deletion", lambda: run_priorityqueue(tasks, steps)),
+        ("heapq + lazy deletion", lambda: run_heapq(tasks, steps)),
+        ("IndexedPriorityQueue", lambda: run_indexed(tasks, steps, True)),
+        ("IndexedPriorityQueue(thread_safe=False)", lambda: run_indexed(tasks, steps, False)),
+    ]
+    for name, run in rows:
+        start = time.perf_counter()
+        largest = run()
+        print(f"{name:<40} {time.perf_counter() - start:>8.3f} {largest:>18,}")
+
+
+if __name__ == "__main__":
+    main()
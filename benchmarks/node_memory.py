@@ -0,0 +1,81 @@
+"""
+Compare per-node memory and allocation rate of the slotted linked list nodes
+against the previous dict-based node class, with and without a NodePool.
+
+Run with: python benchmarks/node_memory.py [node_count]
+"""
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.linked_list import NodePool, SinglyLinkedListNode, DoublyLinkedListNode, \
+    SinglyLinkedListWithTail, DoublyLinkedListWithTail
+
+
+class DictSinglyLinkedListNode:
+    """The node layout used before __slots__ was introduced."""
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class DictDoublyLinkedListNode:
+    """The node layout used before __slots__ was introduced."""
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+
+
+def bytes_per_node(node_class, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    head = None
+    for _ in range(count):
+        node = node_class(0)
+        node.next = head
+        head = node
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def churn(list_class, pool, count, rounds):
+    """Append then delete from the front repeatedly and return operations per second."""
+    linked_list = list_class(pool=pool)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for i in range(count):
+            linked_list.append(i)
+        for _ in range(count):
+            linked_list.delete_by_position(0)
+    elapsed = time.perf_counter() - start
+    return 2 * count * rounds / elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"Memory per node ({count} nodes):")
+    for name, node_class in [
+        ("dict singly", DictSinglyLinkedListNode),
+        ("slotted singly", SinglyLinkedListNode),
+        ("dict doubly", DictDoublyLinkedListNode),
+        ("slotted doubly", DoublyLinkedListNode),
+    ]:
+        print(f"  {name:<16} {bytes_per_node(node_class, count):6.1f} bytes")
+
+    print("Append/delete churn (operations per second):")
+    for list_class, node_class in [
+        (SinglyLinkedListWithTail, SinglyLinkedListNode),
+        (DoublyLinkedListWithTail, DoublyLinkedListNode),
+    ]:
+        plain = churn(list_class, None, 10_000, 20)
+        pooled = churn(list_class, NodePool(node_class), 10_000, 20)
+        print(f"  {list_class.__name__:<26} no pool {plain:12,.0f}   pool {pooled:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
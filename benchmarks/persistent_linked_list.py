@@ -0,0 +1,62 @@
+"""
+Compare the memory and time needed to keep a snapshot before every change
+when the list is a PersistentLinkedList versus a full copy of a
+SinglyLinkedListWithTail. The copy is made with from_iterable, since
+copy.deepcopy recurses once per node and hits the recursion limit on lists
+of more than a few hundred items.
+
+Run with: python benchmarks/persistent_linked_list.py [item_count] [snapshot_count]
+"""
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.linked_list import SinglyLinkedListWithTail
+from data_structures.persistent_linked_list import PersistentLinkedList
+
+
+def with_full_copies(count, snapshots):
+    linked_list = SinglyLinkedListWithTail.from_iterable(range(count))
+    history = []
+    for i in range(snapshots):
+        history.append(SinglyLinkedListWithTail.from_iterable(linked_list))
+        linked_list.delete_by_position(0)
+        linked_list.prepend(-i)
+    return history
+
+
+def with_persistent(count, snapshots):
+    linked_list = PersistentLinkedList.from_iterable(range(count))
+    history = []
+    for i in range(snapshots):
+        history.append(linked_list)
+        linked_list = linked_list.tail().prepend(-i)
+    return history
+
+
+def measure(function, count, snapshots):
+    tracemalloc.start()
+    start = time.perf_counter()
+    history = function(count, snapshots)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del history
+    return memory, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    snapshots = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    print(f"{count} items, {snapshots} snapshots, one change between snapshots")
+    print(f"{'strategy':<22} {'memory (MiB)':>12} {'time (s)':>9}")
+    for name, function in [("full copy", with_full_copies), ("PersistentLinkedList", with_persistent)]:
+        memory, elapsed = measure(function, count, snapshots)
+        print(f"{name:<22} {memory / 2 ** 20:>12.2f} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
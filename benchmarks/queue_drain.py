@@ -0,0 +1,54 @@
+"""
+Show how the time to drain QueueUsingList grows with its size.
+
+Each queue is filled with enqueue_many and then emptied one dequeue at a
+time. With amortized O(1) dequeue the nanoseconds per item stay flat as the
+queue grows; the old list.pop(0) version is timed on the small sizes for
+comparison, where its per-item cost grows with n.
+
+Run with: python benchmarks/queue_drain.py [largest_size]
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.queue import QueueUsingList, QueueUsingDeque
+
+POP_ZERO_LIMIT = 100_000
+
+
+def drain(queue, count):
+    queue.enqueue_many(range(count))
+    start = time.perf_counter()
+    for _ in range(count):
+        queue.dequeue()
+    return time.perf_counter() - start
+
+
+def drain_pop_zero(count):
+    items = list(range(count))
+    start = time.perf_counter()
+    for _ in range(count):
+        items.pop(0)
+    return time.perf_counter() - start
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    sizes = []
+    size = 10_000
+    while size <= largest:
+        sizes.append(size)
+        size *= 10
+    print(f"{'items':>10} {'QueueUsingList':>16} {'ns/item':>8} {'QueueUsingDeque':>16} {'ns/item':>8} {'list.pop(0)':>12}")
+    for count in sizes:
+        listed = drain(QueueUsingList(), count)
+        deque_based = drain(QueueUsingDeque(), count)
+        pop_zero = f"{drain_pop_zero(count):>11.3f}s" if count <= POP_ZERO_LIMIT else f"{'-':>12}"
+        print(f"{count:>10} {listed:>15.3f}s {listed / count * 1e9:>8.0f} {deque_based:>15.3f}s {deque_based / count * 1e9:>8.0f} {pop_zero}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Measure how fast SharedMemoryQueue fans fixed-size records out to 1..N
+worker processes, compared with multiprocessing.Queue.
+
+The parent produces every record and the workers consume them. Records are
+64-byte rows of eight float64 values. multiprocessing.Queue pickles each
+record and sends it through a pipe; SharedMemoryQueue copies raw bytes into
+shared memory, one record at a time or in batches written from an array.
+
+Run with: python benchmarks/shared_memory_queue.py [record_count] [max_workers]
+"""
+import sys
+import os
+import time
+from array import array
+from multiprocessing import get_context
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.shared_memory_queue import SharedMemoryQueue
+
+FIELDS = 8
+RECORD_SIZE = FIELDS * 8
+BATCH = 256
+CAPACITY = 4096
+
+
+def mp_worker(queue, done):
+    count = 0
+    while queue.get() is not None:
+        count += 1
+    done.put(count)
+
+
+def shm_worker(queue, count, done):
+    received = 0
+    while received < count:
+        queue.dequeue()
+        received += 1
+    done.put(received)
+
+
+def shm_batch_worker(queue, count, done):
+    received = 0
+    while received < count:
+        with queue.read_batch(min(BATCH, count - received)) as views:
+            for view in views:
+                received += view.nbytes // RECORD_SIZE
+    done.put(received)
+
+
+def run_mp(context, count, workers):
+    queue = context.Queue(CAPACITY)
+    done = context.Queue()
+    processes = [context.Process(target=mp_worker, args=(queue, done)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    record = array("d", range(FIELDS))
+    start = time.perf_counter()
+    for _ in range(count):
+        queue.put(record)
+    for _ in processes:
+        queue.put(None)
+    received = sum(done.get() for _ in processes)
+    elapsed = time.perf_counter() - start
+    for process in processes:
+        process.join()
+    return received / elapsed
+
+
+def run_shm(context, count, workers, batched):
+    share = count // workers
+    with SharedMemoryQueue(CAPACITY, RECORD_SIZE, context) as queue:
+        done = context.Queue()
+        target = shm_batch_worker if batched else shm_worker
+        processes = [context.Process(target=target, args=(queue, share, done)) for _ in range(workers)]
+        for process in processes:
+            process.start()
+        start = time.perf_counter()
+        if batched:
+            block = array("d", range(FIELDS)) * BATCH
+            for _ in range(share * workers // BATCH):
+                queue.enqueue_many(block)
+            queue.enqueue_many(array("d", range(FIELDS)) * (share * workers % BATCH))
+        else:
+            record = array("d", range(FIELDS))
+            for _ in range(share * workers):
+                queue.enqueue(record)
+        received = sum(done.get() for _ in processes)
+        elapsed = time.perf_counter() - start
+        for process in processes:
+            process.join()
+    return received / elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    context = get_context()
+    print(f"{count} records of {RECORD_SIZE} bytes, {os.cpu_count()} CPUs, start method {context.get_start_method()}")
+    print(f"{'workers':>7} {'mp.Queue rec/s':>15} {'shm single rec/s':>17} {f'shm batch {BATCH} rec/s':>19}")
+    workers = 1
+    while workers <= max_workers:
+        print(f"{workers:>7} {run_mp(context, count, workers):>15,.0f} "
+              f"{run_shm(context, count, workers, False):>17,.0f} {run_shm(context, count, workers, True):>19,.0f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Measure producer/consumer throughput of SPSCRingBuffer against QueueUsingQueue
+and QueueUsingDeque, with one producer thread and one consumer thread.
+
+QueueUsingQueue is driven through its underlying queue.Queue put() and
+blocking get(). QueueUsingDeque has no blocking dequeue, so its consumer
+polls, yielding the GIL whenever the deque is empty.
+
+Run with: python benchmarks/spsc_ring_buffer.py [item_count] [capacity]
+"""
+import sys
+import os
+import time
+from threading import Thread
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.queue import QueueUsingDeque, QueueUsingQueue, SPSCRingBuffer
+
+BATCH = 256
+
+
+def queue_pair(count, capacity):
+    queue = QueueUsingQueue()
+    queue.queue.maxsize = capacity
+
+    def produce():
+        for i in range(count):
+            queue.queue.put(i)
+
+    def consume():
+        for _ in range(count):
+            queue.queue.get()
+
+    return produce, consume
+
+
+def deque_pair(count, capacity):
+    queue = QueueUsingDeque()
+
+    def produce():
+        for i in range(count):
+            while len(queue.queue) >= capacity:
+                time.sleep(0)
+            queue.enqueue(i)
+
+    def consume():
+        received = 0
+        while received < count:
+            if queue.queue:
+                queue.dequeue()
+                received += 1
+            else:
+                time.sleep(0)
+
+    return produce, consume
+
+
+def ring_pair(count, capacity):
+    buffer = SPSCRingBuffer(capacity)
+
+    def produce():
+        for i in range(count):
+            buffer.enqueue(i)
+
+    def consume():
+        for _ in range(count):
+            buffer.dequeue()
+
+    return produce, consume
+
+
+def ring_batch_pair(count, capacity):
+    buffer = SPSCRingBuffer(capacity)
+
+    def produce():
+        for start in range(0, count, BATCH):
+            buffer.enqueue_many(range(start, min(start + BATCH, count)))
+
+    def consume():
+        received = 0
+        while received < count:
+            batch = buffer.dequeue_many(BATCH)
+            if batch:
+                received += len(batch)
+            else:
+                buffer.dequeue()
+                received += 1
+
+    return produce, consume
+
+
+def run(pair, count, capacity):
+    produce, consume = pair(count, capacity)
+    threads = [Thread(target=produce), Thread(target=consume)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    capacity = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+    print(f"{count} items through a buffer of {capacity}")
+    print(f"{'implementation':<38} {'items/s':>12}")
+    rows = [
+        ("QueueUsingQueue (put/get)", queue_pair),
+        ("QueueUsingDeque (polling)", deque_pair),
+        ("SPSCRingBuffer (enqueue/dequeue)", ring_pair),
+        (f"SPSCRingBuffer (*_many, batch {BATCH})", ring_batch_pair),
+    ]
+    for name, pair in rows:
+        print(f"{name:<38} {run(pair, count, capacity):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
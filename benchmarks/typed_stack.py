@@ -0,0 +1,82 @@
+"""
+Compare memory and bulk throughput of TypedStack against StackUsingList
+and StackUsingDeque for large numbers of ints and floats.
+
+Run with: python benchmarks/typed_stack.py [item_count]
+"""
+import sys
+import os
+import time
+import tracemalloc
+from array import array
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.imports import np
+from data_structures.stack import StackUsingList, StackUsingDeque, TypedStack
+
+
+def memory_of(build):
+    tracemalloc.start()
+    stack = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del stack
+    return memory
+
+
+def fill_one_by_one(stack, values):
+    for value in values:
+        stack.push(value)
+    return stack
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    backends = ["array"] + (["numpy"] if np is not None else [])
+    ints = range(10_000, 10_000 + count)
+    print(f"{count} items; NumPy {'available' if np is not None else 'not installed'}")
+    print(f"{'container':<30} {'bytes/int':>10} {'bytes/float':>12}")
+    rows = [
+        ("StackUsingList", lambda values, dtype: fill_one_by_one(StackUsingList(), values)),
+        ("StackUsingDeque", lambda values, dtype: fill_one_by_one(StackUsingDeque(), values)),
+    ]
+    for backend in backends:
+        rows.append((f"TypedStack({backend}, q/d)", lambda values, dtype, backend=backend: _bulk(values, dtype, backend)))
+    rows.append(("TypedStack(array, i/f)", lambda values, dtype: _bulk(values, {"q": "i", "d": "f"}[dtype], "array")))
+    for name, build in rows:
+        int_bytes = memory_of(lambda: build(ints, "q")) / count
+        float_bytes = memory_of(lambda: build((i + 0.5 for i in range(count)), "d")) / count
+        print(f"{name:<30} {int_bytes:>10.1f} {float_bytes:>12.1f}")
+    print()
+    print(f"{'operation':<42} {'seconds':>8}")
+    stack = StackUsingList()
+    print(f"{'StackUsingList push x n + pop x n':<42} {timed(lambda: _push_pop(stack, ints)):>8.3f}")
+    for backend in backends:
+        typed = TypedStack("q", backend=backend)
+        source = np.arange(10_000, 10_000 + count) if backend == "numpy" else array("q", ints)
+        elapsed = timed(lambda: (typed.push_many(source), typed.pop_many(count)))
+        print(f"{f'TypedStack({backend}) push_many + pop_many':<42} {elapsed:>8.3f}")
+
+
+def _bulk(values, dtype, backend):
+    stack = TypedStack(dtype, backend=backend)
+    stack.push_many(values)
+    return stack
+
+
+def _push_pop(stack, values):
+    for value in values:
+        stack.push(value)
+    for _ in values:
+        stack.pop()
+
+
+if __name__ == "__main__":
+    main()
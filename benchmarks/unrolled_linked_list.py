@@ -0,0 +1,55 @@
+"""
+Compare UnrolledLinkedList against SinglyLinkedListWithTail and
+DoublyLinkedListWithTail on memory, full traversal and positional deletes.
+
+Run with: python benchmarks/unrolled_linked_list.py [item_count]
+"""
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_structures.linked_list import SinglyLinkedListWithTail, DoublyLinkedListWithTail, UnrolledLinkedList
+
+
+def build(factory, count):
+    tracemalloc.start()
+    linked_list = factory(range(count))
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return linked_list, memory
+
+
+def timed(function, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    candidates = [
+        ("SinglyLinkedListWithTail", SinglyLinkedListWithTail.from_iterable),
+        ("DoublyLinkedListWithTail", DoublyLinkedListWithTail.from_iterable),
+    ]
+    for block_size in (16, 64, 256):
+        candidates.append((f"UnrolledLinkedList({block_size})",
+                           lambda items, block_size=block_size: UnrolledLinkedList.from_iterable(items, block_size=block_size)))
+    print(f"{count} items; bytes/item, traverse (ms), 100 middle deletes (ms)")
+    for name, factory in candidates:
+        linked_list, memory = build(factory, count)
+        traverse = timed(lambda: sum(linked_list))
+        start = time.perf_counter()
+        for _ in range(100):
+            linked_list.delete_by_position(linked_list.size // 2)
+        deletes = time.perf_counter() - start
+        print(f"  {name:<26} {memory / count:6.1f} {traverse * 1000:9.1f} {deletes * 1000:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+from .imports import array
+from .linked_list import _SequenceProtocol
+
+NIL = -1
+
+class ArrayDoublyLinkedList(_SequenceProtocol):
+    """
+    A Doubly Linked List whose nodes live in parallel arrays.
+    Slot i holds the data of one node in data[i], and the slot indices of its
+    neighbours in next[i] and prev[i]. Deleted slots are chained through next[]
+    into a free list and reused before the arrays grow.
+    """
+    index_typecode = "q"
+    _reversible = True
+
+    def __init__(self, typecode=None, capacity=16):
+        """
+        Initialize an empty list.
+        Args:
+            typecode: An array module typecode (e.g. "q" or "d") to store the data
+                unboxed, or None to store arbitrary Python objects.
+            capacity: The number of slots to reserve up front.
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.typecode = typecode
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+        self.capacity = 0
+        self._free = NIL
+        self._used = 0
+        self._data = [] if typecode is None else array(typecode)
+        self._next = array(self.index_typecode)
+        self._prev = array(self.index_typecode)
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        """
+        Extend the slot arrays to hold the given number of slots.
+        Args:
+            capacity: The new number of slots.
+        """
+        extra = capacity - self.capacity
+        if self.typecode is None:
+            self._data.extend([None] * extra)
+        else:
+            self._data.frombytes(bytes(extra * self._data.itemsize))
+        blank = array(self.index_typecode, [NIL]) * extra
+        self._next.extend(blank)
+        self._prev.extend(blank)
+        self.capacity = capacity
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Build a list from an iterable in a single linear pass.
+        Args:
+            iterable: The items to store, in order. Generators are consumed lazily.
+            **kwargs: Arguments passed on to the constructor (e.g. typecode, capacity).
+        Returns:
+            ArrayDoublyLinkedList: A new list holding the items.
+        """
+        linked_list = cls(**kwargs)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _reduce_options(self):
+        """
+        Return the constructor arguments needed to rebuild an equivalent list.
+        Returns:
+            dict: Keyword arguments for from_iterable.
+        """
+        return {"typecode": self.typecode}
+
+    def _build_chain(self, iterable):
+        """
+        Store the items of an iterable in a detached chain of slots.
+        If an item is rejected the slots taken so far are released again.
+        Args:
+            iterable: The items to store, in order.
+        Returns:
+            tuple: The first slot, the last slot and the number of slots (NIL, NIL, 0 if empty).
+        Raises:
+            ValueError: If an item is None.
+        """
+        first = last = NIL
+        count = 0
+        try:
+            for data in iterable:
+                if data is None:
+                    raise ValueError("Data cannot be None")
+                slot = self._allocate(data)
+                self._prev[slot] = last
+                self._next[slot] = NIL
+                if last == NIL:
+                    first = slot
+                else:
+                    self._next[last] = slot
+                last = slot
+                count += 1
+        except BaseException:
+            while first != NIL:
+                following = self._next[first]
+                self._release(first)
+                first = following
+            raise
+        return first, last, count
+
+    def extend(self, iterable):
+        """
+        Append every item of an iterable to the end of the list in one pass.
+        Args:
+            iterable: The items to append, in order.
+        Raises:
+            ValueError: If an item is None; the list is then left unchanged.
+        """
+        first, last, count = self._build_chain(iterable)
+        if first == NIL:
+            return
+        if self.tail == NIL:
+            self.head = first
+        else:
+            self._next[self.tail] = first
+            self._prev[first] = self.tail
+        self.tail = last
+        self.size += count
+
+    def extend_left(self, iterable):
+        """
+        Insert every item of an iterable before the head, keeping their order.
+        Args:
+            iterable: The items to prepend, in order.
+        Raises:
+            ValueError: If an item is None; the list is then left unchanged.
+        """
+        first, last, count = self._build_chain(iterable)
+        if first == NIL:
+            return
+        if self.head == NIL:
+            self.tail = last
+        else:
+            self._prev[self.head] = last
+            self._next[last] = self.head
+        self.head = first
+        self.size += count
+
+    def _allocate(self, data):
+        """
+        Take a slot from the free list, or a fresh one, and store data in it.
+        Args:
+            data: The data to be stored in the slot.
+        Returns:
+            int: The slot index.
+        Raises:
+            TypeError: If the data does not fit the typecode; no slot is taken.
+        """
+        slot = self._free
+        if slot != NIL:
+            self._data[slot] = data
+            self._free = self._next[slot]
+        else:
+            if self._used == self.capacity:
+                self._grow(self.capacity * 2)
+            slot = self._used
+            self._data[slot] = data
+            self._used += 1
+        return slot
+
+    def _release(self, slot):
+        """
+        Push an unlinked slot onto the free list.
+        Args:
+            slot: The slot index that was removed from the list.
+        """
+        self._data[slot] = None if self.typecode is None else 0
+        self._prev[slot] = NIL
+        self._next[slot] = self._free
+        self._free = slot
+
+    def _unlink(self, slot):
+        """
+        Unlink the given slot from the list and release it.
+        Args:
+            slot: The slot index to remove.
+        """
+        next_slot = self._next[slot]
+        prev_slot = self._prev[slot]
+        if prev_slot != NIL:
+            self._next[prev_slot] = next_slot
+        else:
+            self.head = next_slot
+        if next_slot != NIL:
+            self._prev[next_slot] = prev_slot
+        else:
+            self.tail = prev_slot
+        self._release(slot)
+        self.size -= 1
+
+    def append(self, data):
+        """
+        Append a new node with the given data to the end of the list.
+        Args:
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        slot = self._allocate(data)
+        self._next[slot] = NIL
+        self._prev[slot] = self.tail
+        if self.tail == NIL:
+            self.head = slot
+        else:
+            self._next[self.tail] = slot
+        self.tail = slot
+        self.size += 1
+
+    def prepend(self, data):
+        """
+        Prepend a new node with the given data to the start of the list.
+        Args:
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        slot = self._allocate(data)
+        self._prev[slot] = NIL
+        self._next[slot] = self.head
+        if self.head == NIL:
+            self.tail = slot
+        else:
+            self._prev[self.head] = slot
+        self.head = slot
+        self.size += 1
+
+    def insert_after(self, prev_node_data, data):
+        """
+        Insert a new node with the given data after the first node holding prev_node_data.
+        Args:
+            prev_node_data: The data of the node after which to insert the new node.
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If either argument is None or prev_node_data is not in the list.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        if prev_node_data is None:
+            raise ValueError("Previous node data cannot be None")
+        values = self._data
+        next_of = self._next
+        current = self.head
+        while current != NIL:
+            if values[current] == prev_node_data:
+                slot = self._allocate(data)
+                next_of = self._next  # _allocate may have grown, and so replaced, the arrays
+                following = next_of[current]
+                next_of[current] = slot
+                self._prev[slot] = current
+                next_of[slot] = following
+                if following != NIL:
+                    self._prev[following] = slot
+                else:
+                    self.tail = slot
+                self.size += 1
+                return
+            current = next_of[current]
+        raise ValueError("The specified node data is not in the list")
+
+    def delete_by_key(self, key):
+        """
+        Delete the first node with the specified key from the list.
+        Args:
+            key: The data of the node to be deleted.
+        Raises:
+            ValueError: If the key is None, the list is empty or the key is not in the list.
+        """
+        if key is None:
+            raise ValueError("Key cannot be None")
+        if self.head == NIL:
+            raise ValueError("The list is empty")
+        values = self._data
+        next_of = self._next
+        current = self.head
+        while current != NIL:
+            if values[current] == key:
+                self._unlink(current)
+                return
+            current = next_of[current]
+        raise ValueError("The key is not in the list")
+
+    def delete_by_position(self, position):
+        """
+        Delete the node at the specified position from the list.
+        Walks from whichever end of the list is closer.
+        Args:
+            position: The position of the node to be deleted (0-based index).
+        Raises:
+            ValueError: If the position is out of bounds.
+        """
+        if position < 0 or position >= self.size:
+            raise ValueError("Position out of bounds")
+        if position <= self.size // 2:
+            current = self.head
+            for _ in range(position):
+                current = self._next[current]
+        else:
+            current = self.tail
+            for _ in range(self.size - 1 - position):
+                current = self._prev[current]
+        self._unlink(current)
+
+    def __iter__(self):
+        """
+        Iterate over the data from the head, without copying.
+        The arrays are looked up on every step, since the list may grow while suspended.
+        Yields:
+            The data of each node in the list.
+        """
+        current = self.head
+        while current != NIL:
+            yield self._data[current]
+            current = self._next[current]
+
+    def __reversed__(self):
+        """
+        Iterate over the data from the tail back to the head.
+        Yields:
+            The data of each node in reverse order.
+        """
+        current = self.tail
+        while current != NIL:
+            yield self._data[current]
+            current = self._prev[current]
+
+    def __str__(self):
+        """
+        Return a string representation of the list, in the same format as DoublyLinkedListWithTail.
+        Returns:
+            str: A string representation of the list.
+        """
+        return " <--> ".join(map(str, self))
+
+def main():
+    adll = ArrayDoublyLinkedList(typecode="q")
+    for i in range(5):
+        adll.append(i)
+    adll.prepend(-1)
+    adll.insert_after(2, 20)
+    adll.delete_by_key(3)
+    adll.delete_by_position(0)
+    print(adll)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+from .imports import asyncio, deque
+
+class _AsyncBuffer:
+    """
+    The waiting logic shared by AsyncStack and AsyncQueue
+    Items are kept in a deque; subclasses choose the deque method that removes the next one.
+    Like asyncio.Queue, coroutines that find the buffer empty (or full) park on
+    a future and are woken one at a time. A woken coroutine re-checks the
+    buffer before touching it, and a cancelled one passes its wake-up on to the
+    next waiter, so cancelling a waiting call never loses or duplicates an item.
+    Instances must only be used from one event loop.
+    """
+    _none_error = "Cannot add None"
+    _full_error = "Cannot add to a full buffer"
+
+    def __init__(self, capacity, take):
+        """
+        Initialize an empty buffer
+        Args:
+            capacity: The maximum number of items, or None for no limit
+            take: The deque method that removes the next item, deque.popleft or deque.pop
+        Raises:
+            ValueError: If the capacity is not positive
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self.items = deque()
+        self._take = take
+        self._getters = deque()
+        self._putters = deque()
+
+    def _wake_next(self, waiters):
+        """
+        Wake the first waiter that is still waiting
+        Args:
+            waiters: The deque of waiting futures
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, blocked):
+        """
+        Park until woken while blocked() holds
+        Args:
+            waiters: The deque to wait in
+            blocked: A function returning True while the caller must keep waiting
+        """
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not blocked() and not waiter.cancelled():
+                    self._wake_next(waiters)
+                raise
+
+    def is_empty(self):
+        """
+        Check if the buffer is empty
+        Returns:
+            True if there are no items, False otherwise
+        """
+        return not self.items
+
+    def is_full(self):
+        """
+        Check if the buffer is full
+        Returns:
+            True if the buffer holds capacity items, False otherwise
+        """
+        return self.capacity is not None and len(self.items) >= self.capacity
+
+    def size(self):
+        """
+        Get the number of items
+        Returns:
+            The number of items
+        """
+        return len(self.items)
+
+    def __len__(self):
+        """
+        Get the number of items
+        Returns:
+            The number of items
+        """
+        return len(self.items)
+
+    def _add_nowait(self, item):
+        """
+        Add an item without waiting and wake one getter
+        Args:
+            item: The item to add
+        Raises:
+            ValueError: If the item is None or the buffer is full
+        """
+        if item is None:
+            raise ValueError(self._none_error)
+        if self.is_full():
+            raise ValueError(self._full_error)
+        self.items.append(item)
+        self._wake_next(self._getters)
+
+    async def _add(self, item):
+        """
+        Add an item, waiting while the buffer is full
+        Args:
+            item: The item to add
+        Raises:
+            ValueError: If the item is None
+        """
+        if item is None:
+            raise ValueError(self._none_error)
+        if self.is_full():
+            await self._wait(self._putters, self.is_full)
+        self.items.append(item)
+        if self._getters:
+            self._wake_next(self._getters)
+
+    def _remove_nowait(self):
+        """
+        Remove the next item without waiting and wake one putter
+        Returns:
+            The next item, or None if the buffer is empty
+        """
+        if not self.items:
+            return None
+        item = self._take(self.items)
+        self._wake_next(self._putters)
+        return item
+
+    async def _remove(self):
+        """
+        Remove the next item, waiting while the buffer is empty
+        Returns:
+            The next item
+        """
+        if not self.items:
+            await self._wait(self._getters, self.is_empty)
+        item = self._take(self.items)
+        if self._putters:
+            self._wake_next(self._putters)
+        if self.items and self._getters:
+            self._wake_next(self._getters)
+        return item
+
+    async def get_many(self, max_items, timeout=None):
+        """
+        Wait for at least one item, then remove up to max_items without waiting again
+        If another consumer takes the item that woke this call, it waits again
+        for the rest of the timeout rather than returning early.
+        Args:
+            max_items: The maximum number of items to return
+            timeout: The maximum number of seconds to wait for the first item, or None
+        Returns:
+            A list of the removed items in removal order; empty if the timeout expired
+        Raises:
+            ValueError: If max_items is not positive
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be positive")
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not self.items:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return []
+            try:
+                await asyncio.wait_for(self._wait(self._getters, self.is_empty), remaining)
+            except asyncio.TimeoutError:
+                return []
+        batch = [self._take(self.items) for _ in range(min(max_items, len(self.items)))]
+        for _ in batch:
+            self._wake_next(self._putters)
+        if self.items:
+            self._wake_next(self._getters)
+        return batch
+
+    def __str__(self):
+        return str(list(self.items))
@@ -0,0 +1,107 @@
+from .imports import array, np
+
+BACKENDS = ("array", "numpy")
+_KINDS = ("bhilq", "BHILQ", "fd")
+
+def new_buffer(typecode, capacity, backend="array"):
+    """
+    Allocate a zero-filled typed buffer.
+    Args:
+        typecode: An array module typecode such as "q", "i" or "d"; NumPy accepts the same codes.
+        capacity: The number of items the buffer holds.
+        backend: "array" for array.array or "numpy" for a numpy.ndarray.
+    Returns:
+        array or numpy.ndarray: The new buffer.
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the numpy backend is requested but NumPy is not installed.
+    """
+    if backend == "array":
+        return array(typecode, bytes(capacity * array(typecode).itemsize))
+    if backend == "numpy":
+        if np is None:
+            raise ImportError("The numpy backend needs NumPy to be installed")
+        return np.zeros(capacity, dtype=typecode)
+    raise ValueError("Backend must be one of " + ", ".join(BACKENDS))
+
+def grow_buffer(buffer, capacity, used):
+    """
+    Copy the used part of a buffer into a new, larger buffer of the same kind.
+    The old buffer is left untouched, so views that still point into it stay valid.
+    Args:
+        buffer: The buffer to grow.
+        capacity: The number of items the new buffer holds.
+        used: The number of leading items to copy.
+    Returns:
+        array or numpy.ndarray: The new buffer.
+    """
+    if isinstance(buffer, array):
+        grown = new_buffer(buffer.typecode, capacity)
+    else:
+        grown = np.zeros(capacity, dtype=buffer.dtype)
+    write(grown, 0, buffer_view(buffer, 0, used))
+    return grown
+
+def buffer_view(buffer, start, stop):
+    """
+    Return a zero-copy view of a range of a buffer.
+    Args:
+        buffer: The buffer.
+        start: The first item.
+        stop: The item after the last one.
+    Returns:
+        memoryview or numpy.ndarray: A view sharing the buffer's memory.
+    """
+    if isinstance(buffer, array):
+        return memoryview(buffer)[start:stop]
+    return buffer[start:stop]
+
+def write(buffer, start, values):
+    """
+    Copy values into a buffer starting at a position, in bulk.
+    Values that expose a buffer of the same item format are copied as raw
+    memory; anything else is converted first.
+    Args:
+        buffer: The buffer to write to; it must have room for the values.
+        start: The position of the first value.
+        values: A sequence, array, memoryview or ndarray of values.
+    Returns:
+        int: The number of values written.
+    Raises:
+        TypeError: If a value does not fit the buffer's type.
+    """
+    if not isinstance(buffer, array):
+        values = np.asarray(values, dtype=buffer.dtype)
+        buffer[start:start + len(values)] = values
+        return len(values)
+    try:
+        source = memoryview(values)
+    except TypeError:
+        source = None
+    if source is None or source.ndim != 1 or not source.c_contiguous or \
+            not _same_layout(source.format, source.itemsize, buffer.typecode, buffer.itemsize):
+        source = memoryview(array(buffer.typecode, values))
+    elif source.format != buffer.typecode:
+        source = source.cast("B").cast(buffer.typecode)
+    count = len(source)
+    with memoryview(buffer) as target:
+        target[start:start + count] = source
+    return count
+
+def _same_layout(format, itemsize, typecode, typecode_itemsize):
+    """
+    Check whether a buffer format stores items exactly like an array typecode.
+    NumPy reports int64 as "l" on most 64-bit platforms while array uses "q";
+    both are signed 8-byte integers, so their memory can be copied directly.
+    Args:
+        format: The struct format of the source buffer.
+        itemsize: The item size of the source buffer.
+        typecode: The array typecode of the target.
+        typecode_itemsize: The item size of the target.
+    Returns:
+        bool: True if the two are the same kind of number with the same size.
+    """
+    if format == typecode:
+        return True
+    format = format.lstrip("@=")
+    return itemsize == typecode_itemsize and any(format in kind and typecode in kind for kind in _KINDS)
@@ -0,0 +1,234 @@
+from .imports import Lock
+from .linked_list import _SequenceProtocol
+
+class ConcurrentDoublyLinkedListNode:
+    """A node in a ConcurrentDoublyLinkedList, guarding its own links with a lock."""
+    __slots__ = ("data", "next", "prev", "lock", "deleted")
+
+    def __init__(self, data):
+        """
+        Initialize the node with data, unset links and its own lock.
+        Args:
+            data: The data to be stored in the node.
+        """
+        self.data = data
+        self.next = None
+        self.prev = None
+        self.lock = Lock()
+        self.deleted = False
+
+# -----------------------------
+
+class ConcurrentDoublyLinkedList(_SequenceProtocol):
+    """
+    A thread-safe Doubly Linked List using hand-over-hand (lock-coupling) locking.
+    Every node owns a lock that guards its next and prev links. Threads always
+    take locks from the head towards the tail, so they cannot deadlock, and
+    writers working on different parts of the list do not block each other.
+    Sentinel nodes at both ends mean no operation has to lock the list itself.
+    """
+    _reversible = False
+
+    def __init__(self):
+        """Initialize an empty list between a head and a tail sentinel."""
+        self._head = ConcurrentDoublyLinkedListNode(None)
+        self._tail = ConcurrentDoublyLinkedListNode(None)
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self._size_lock = Lock()
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Build a list from an iterable.
+        Args:
+            iterable: The items to store, in order.
+        Returns:
+            ConcurrentDoublyLinkedList: A new list holding the items.
+        Raises:
+            ValueError: If an item is None.
+        """
+        linked_list = cls()
+        for data in iterable:
+            linked_list.append(data)
+        return linked_list
+
+    def _resize(self, delta):
+        """
+        Adjust the node count.
+        Args:
+            delta: The number of nodes added (negative for removals).
+        """
+        with self._size_lock:
+            self.size += delta
+
+    def _link_between(self, previous_node, next_node, data):
+        """
+        Link a new node between two adjacent nodes whose locks the caller holds.
+        Args:
+            previous_node: The node before the new one.
+            next_node: The node after the new one.
+            data: The data to be stored in the new node.
+        """
+        new_node = ConcurrentDoublyLinkedListNode(data)
+        new_node.prev = previous_node
+        new_node.next = next_node
+        previous_node.next = new_node
+        next_node.prev = new_node
+        self._resize(1)
+
+    def _lock_first_match(self, data):
+        """
+        Walk the list hand over hand until a node holding data is found.
+        Args:
+            data: The data to look for.
+        Returns:
+            tuple: The matching node's predecessor and the node itself, both locked.
+                If nothing matches, the node is the tail sentinel.
+        """
+        previous_node = self._head
+        previous_node.lock.acquire()
+        current_node = previous_node.next
+        current_node.lock.acquire()
+        while current_node is not self._tail and current_node.data != data:
+            previous_node.lock.release()
+            previous_node = current_node
+            current_node = current_node.next
+            current_node.lock.acquire()
+        return previous_node, current_node
+
+    def append(self, data):
+        """
+        Atomically append a new node with the given data to the end of the list.
+        The last node is read without a lock, so the append retries if another
+        thread changed the end of the list before both locks were taken.
+        Args:
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        tail = self._tail
+        while True:
+            last_node = tail.prev
+            with last_node.lock:
+                with tail.lock:
+                    if not last_node.deleted and last_node.next is tail:
+                        self._link_between(last_node, tail, data)
+                        return
+
+    def prepend(self, data):
+        """
+        Atomically prepend a new node with the given data to the start of the list.
+        Args:
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        with self._head.lock:
+            first_node = self._head.next
+            with first_node.lock:
+                self._link_between(self._head, first_node, data)
+
+    def insert_after(self, prev_node_data, data):
+        """
+        Atomically insert a new node after the first node holding prev_node_data.
+        Args:
+            prev_node_data: The data of the node after which to insert the new node.
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If either argument is None or prev_node_data is not in the list.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        if prev_node_data is None:
+            raise ValueError("Previous node data cannot be None")
+        previous_node, current_node = self._lock_first_match(prev_node_data)
+        previous_node.lock.release()
+        try:
+            if current_node is self._tail:
+                raise ValueError("The specified node data is not in the list")
+            next_node = current_node.next
+            with next_node.lock:
+                self._link_between(current_node, next_node, data)
+        finally:
+            current_node.lock.release()
+
+    def delete_by_key(self, key):
+        """
+        Atomically delete the first node with the specified key from the list.
+        Args:
+            key: The data of the node to be deleted.
+        Raises:
+            ValueError: If the key is None or the key is not in the list.
+        """
+        if key is None:
+            raise ValueError("Key cannot be None")
+        previous_node, current_node = self._lock_first_match(key)
+        try:
+            if current_node is self._tail:
+                raise ValueError("The key is not in the list")
+            next_node = current_node.next
+            with next_node.lock:
+                previous_node.next = next_node
+                next_node.prev = previous_node
+                current_node.deleted = True
+            self._resize(-1)
+        finally:
+            current_node.lock.release()
+            previous_node.lock.release()
+
+    def snapshot(self):
+        """
+        Return a consistent copy of the data in the list.
+        Locks are taken hand over hand but only released once the tail is
+        reached, so the copy reflects the list at a single point in time.
+        Writers behind the walk wait until it finishes.
+        Returns:
+            list: The data of each node, from head to tail.
+        """
+        held = [self._head]
+        self._head.lock.acquire()
+        data = []
+        try:
+            node = self._head.next
+            while True:
+                node.lock.acquire()
+                held.append(node)
+                if node is self._tail:
+                    return data
+                data.append(node.data)
+                node = node.next
+        finally:
+            for node in held:
+                node.lock.release()
+
+    def __iter__(self):
+        """
+        Iterate over a snapshot of the list, so concurrent writers never disturb the iteration.
+        Returns:
+            An iterator over the data of each node at the time of the call.
+        """
+        return iter(self.snapshot())
+
+    def __str__(self):
+        """
+        Return a string representation of a snapshot of the list.
+        Returns:
+            str: A string representation of the list.
+        """
+        return " <--> ".join(map(str, self))
+
+def main():
+    cdll = ConcurrentDoublyLinkedList.from_iterable(range(5))
+    cdll.prepend(-1)
+    cdll.insert_after(2, 20)
+    cdll.delete_by_key(3)
+    print(cdll, len(cdll))
+
+if __name__ == "__main__":
+    main()
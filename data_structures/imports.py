@@ -1,2 +1,26 @@
-from collections import deque
-from queue import LifoQueue, Queue, PriorityQueue
\ No newline at end of file
+import asyncio
+import os
+import pickle
+import struct
+import tempfile
+from array import array
+from collections import deque, namedtuple
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from heapq import merge
+from io import BytesIO
+from itertools import islice
+from mmap import mmap
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from operator import add
+from queue import Empty, LifoQueue, Queue
+from random import Random
+from sys import byteorder, getsizeof
+from threading import Condition, Lock
+from time import monotonic, sleep
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
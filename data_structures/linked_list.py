@@ -1,8 +1,1880 @@
+from .imports import islice, merge
+
 class SinglyLinkedListNode:
     """A SinglyLinkedListNode in a singly linked list."""
+    __slots__ = ("data", "next")
+
+    def __init__(self, data):
+        """
+        Initialize the node with data and next pointer.
+        Args:
+            data: The data to be stored in the node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        self.data = data
+        self.next = None
+
+# -----------------------------
+
+class NodePool:
+    """A free-list of unlinked nodes that linked lists can reuse instead of allocating."""
+    __slots__ = ("node_class", "max_size", "_free", "_size", "_has_prev")
+
+    def __init__(self, node_class, max_size=None):
+        """
+        Initialize an empty pool handing out nodes of the given class.
+        Args:
+            node_class: The node class whose instances are pooled.
+            max_size: The maximum number of free nodes to keep, or None for no limit.
+        Raises:
+            ValueError: If max_size is negative.
+        """
+        if max_size is not None and max_size < 0:
+            raise ValueError("Pool size cannot be negative")
+        self.node_class = node_class
+        self.max_size = max_size
+        self._free = None
+        self._size = 0
+        self._has_prev = hasattr(node_class, "prev")
+
+    def acquire(self, data):
+        """
+        Return a node holding the given data, reusing a free node if one is available.
+        Args:
+            data: The data to be stored in the node.
+        Returns:
+            A detached node of the pool's node class.
+        """
+        node = self._free
+        if node is None:
+            return self.node_class(data)
+        self._free = node.next
+        self._size -= 1
+        node.data = data
+        node.next = None
+        return node
+
+    def release(self, node):
+        """
+        Hand an unlinked node back to the pool.
+        The node must no longer be reachable from any list.
+        Args:
+            node: The node to recycle.
+        """
+        if self.max_size is not None and self._size >= self.max_size:
+            return
+        node.data = None
+        if self._has_prev:
+            node.prev = None
+        node.next = self._free
+        self._free = node
+        self._size += 1
+
+    def __len__(self):
+        """
+        Return the number of free nodes held by the pool.
+        Returns:
+            int: The number of free nodes.
+        """
+        return self._size
+
+# -----------------------------
+
+class LinkedListView:
+    """A lazy, read-only view of a slice of a list. Nothing is copied until it is iterated."""
+    __slots__ = ("_source", "_slice")
+
+    def __init__(self, source, index):
+        """
+        Initialize the view.
+        Args:
+            source: The list being viewed.
+            index: The slice object selecting the items.
+        """
+        self._source = source
+        self._slice = index
+
+    def _range(self):
+        """
+        Return the positions selected by the slice for the list's current length.
+        Returns:
+            range: The selected positions.
+        """
+        return range(len(self._source))[self._slice]
+
+    def __len__(self):
+        """
+        Return the number of items in the view.
+        Returns:
+            int: The number of selected items.
+        """
+        return len(self._range())
+
+    def __iter__(self):
+        """
+        Iterate over the selected items in slice order.
+        Yields:
+            The data of each selected node.
+        """
+        positions = self._range()
+        if not positions:
+            return
+        if positions.step > 0:
+            numbered = enumerate(self._source)
+        else:
+            numbered = zip(range(len(self._source) - 1, -1, -1), reversed(self._source))
+        targets = iter(positions)
+        target = next(targets)
+        for position, data in numbered:
+            if position == target:
+                yield data
+                target = next(targets, None)
+                if target is None:
+                    return
+
+    def __repr__(self):
+        """
+        Return a bounded representation of the view.
+        Returns:
+            str: The class name and the first items of the view.
+        """
+        return _bounded_repr(self, len(self))
+
+def _bounded_repr(sequence, size, limit=10):
+    """
+    Build a representation showing at most limit items of a sequence.
+    Args:
+        sequence: The iterable being represented.
+        size: The number of items in the sequence.
+        limit: The maximum number of items to show.
+    Returns:
+        str: A string like "Name([1, 2, ...], size=1000)".
+    """
+    items = [repr(data) for data in islice(sequence, limit)]
+    if size > limit:
+        items.append("...")
+    return type(sequence).__name__ + "([" + ", ".join(items) + "], size=" + str(size) + ")"
+
+class _SequenceProtocol:
+    """
+    The read-only sequence protocol shared by the list classes.
+    Subclasses provide __iter__ and a size attribute; lists that can walk
+    backwards cheaply set _reversible and provide __reversed__.
+    """
+    __slots__ = ()
+    _reversible = False
+
+    def __len__(self):
+        """
+        Return the number of nodes in the list.
+        Returns:
+            int: The number of nodes in the list.
+        """
+        return self.size
+
+    def length(self):
+        """
+        Return the number of nodes in the list.
+        Returns:
+            int: The number of nodes in the list.
+        """
+        return self.size
+
+    def __reversed__(self):
+        """
+        Iterate over the data from the last node to the first.
+        Lists without back pointers buffer their data first, so this costs O(n) memory.
+        Returns:
+            An iterator over the data in reverse order.
+        """
+        return reversed(list(self))
+
+    def __contains__(self, data):
+        """
+        Check whether any node holds the given data.
+        Args:
+            data: The data to look for.
+        Returns:
+            bool: True if a node's data equals data.
+        """
+        for item in self:
+            if item == data:
+                return True
+        return False
+
+    def __getitem__(self, index):
+        """
+        Return the data at a position, or a lazy view for a slice.
+        Args:
+            index: An int position (negative counts from the end) or a slice.
+        Returns:
+            The data at the position, or a LinkedListView for a slice.
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if isinstance(index, slice):
+            return LinkedListView(self, index)
+        size = len(self)
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError("Position out of bounds")
+        if self._reversible and index > size // 2:
+            return next(islice(reversed(self), size - 1 - index, None))
+        return next(islice(self, index, None))
+
+    def traverse(self):
+        """
+        Traverse the list and return a list of node data as strings.
+        Kept for compatibility; iterate over the list to avoid building the list.
+        Returns:
+            list: A list containing the data of each node, converted with str().
+        """
+        return [str(data) for data in self]
+
+    def __repr__(self):
+        """
+        Return a representation showing at most the first ten items.
+        Returns:
+            str: The class name, the first items and the size.
+        """
+        return _bounded_repr(self, len(self))
+
+    def _reduce_options(self):
+        """
+        Return the constructor arguments needed to rebuild an equivalent list.
+        Returns:
+            dict: Keyword arguments for from_iterable.
+        """
+        return {}
+
+    def __reduce__(self):
+        """
+        Pickle the list as a flat list of its items instead of a chain of nodes,
+        so pickling neither recurses per node nor hits the recursion limit.
+        Returns:
+            tuple: The rebuild function and its arguments.
+        """
+        return _restore_sequence, (type(self), list(self), self._reduce_options())
+
+def _restore_sequence(cls, items, options):
+    """
+    Rebuild a pickled list in a single pass.
+    Args:
+        cls: The list class.
+        items: The items, in order.
+        options: Keyword arguments for from_iterable.
+    Returns:
+        A new list holding the items.
+    """
+    return cls.from_iterable(items, **options)
+
+# -----------------------------
+
+class _KeyIndex:
+    """
+    A hash index from each key to the nodes holding it, kept in list order.
+    The nodes of a key form their own doubly linked chain: buckets maps the
+    key to the [first, last] nodes of the chain, and after and before map
+    each node to its neighbours with the same key. Finding the first node of
+    a key, adding a node at either end of its chain and removing any node are
+    therefore O(1) however many duplicates there are. Singly linked lists also
+    record each node's predecessor in prev, so that a node found through the
+    index can be unlinked without a scan.
+    """
+    __slots__ = ("buckets", "after", "before", "prev")
+
+    def __init__(self):
+        """
+        Initialize an empty index.
+        """
+        self.buckets = {}
+        self.after = {}
+        self.before = {}
+        self.prev = {}
+
+    def first(self, key):
+        """
+        Return the first node holding the key, or None.
+        Args:
+            key: The data to look up.
+        Returns:
+            The first node in list order whose data equals key, or None.
+        """
+        bucket = self.buckets.get(key)
+        return bucket[0] if bucket else None
+
+    def _link(self, first, last, before, after):
+        """
+        Place a run of nodes in their key's chain between two neighbours.
+        Args:
+            first: The first node of the run; its key must already have a bucket.
+            last: The last node of the run, which is first for a single node.
+            before: The node with the same key just before the run, or None.
+            after: The node with the same key just after the run, or None.
+        """
+        bucket = self.buckets[first.data]
+        self.before[first] = before
+        self.after[last] = after
+        if before is None:
+            bucket[0] = first
+        else:
+            self.after[before] = first
+        if after is None:
+            bucket[1] = last
+        else:
+            self.before[after] = last
+
+    def _start(self, node):
+        """
+        Give a node's key a new bucket holding just that node.
+        Args:
+            node: The only node with its key.
+        """
+        self.buckets[node.data] = [node, node]
+        self.before[node] = None
+        self.after[node] = None
+
+    def add_first(self, node):
+        """
+        Register a node that now precedes every other node with the same key.
+        Args:
+            node: The node that was linked in.
+        """
+        bucket = self.buckets.get(node.data)
+        if bucket is None:
+            self._start(node)
+        else:
+            self._link(node, node, None, bucket[0])
+
+    def add_last(self, node):
+        """
+        Register a node that now follows every other node with the same key.
+        Args:
+            node: The node that was linked in.
+        """
+        bucket = self.buckets.get(node.data)
+        if bucket is None:
+            self._start(node)
+        else:
+            self._link(node, node, bucket[1], None)
+
+    def add(self, node, previous_node, stop):
+        """
+        Register a node linked in anywhere in the list.
+        A new key, or a node placed right after one with the same key, is
+        registered in O(1). Otherwise the nodes after the new one are walked
+        until the next node with the same key, so duplicates stay in list order.
+        Args:
+            node: The node that was linked in.
+            previous_node: The node it was linked in after.
+            stop: The node at which the walk ends (None, or the head of a circular list).
+        """
+        bucket = self.buckets.get(node.data)
+        if bucket is None:
+            self._start(node)
+            return
+        if previous_node.data == node.data:
+            self._link(node, node, previous_node, self.after[previous_node])
+            return
+        current_node = node.next
+        while current_node is not stop:
+            if current_node.data == node.data:
+                self._link(node, node, self.before[current_node], current_node)
+                return
+            current_node = current_node.next
+        self._link(node, node, bucket[1], None)
+
+    def remove(self, node):
+        """
+        Forget a node that was unlinked from the list.
+        Args:
+            node: The node that was removed.
+        """
+        before = self.before.pop(node)
+        after = self.after.pop(node)
+        if before is None and after is None:
+            del self.buckets[node.data]
+        else:
+            bucket = self.buckets[node.data]
+            if before is None:
+                bucket[0] = after
+            else:
+                self.after[before] = after
+            if after is None:
+                bucket[1] = before
+            else:
+                self.before[after] = before
+        self.prev.pop(node, None)
+
+    def add_chain(self, first, count, at_front):
+        """
+        Register a run of newly linked nodes that sits before or after every indexed node.
+        Args:
+            first: The first node of the run.
+            count: The number of nodes in the run.
+            at_front: True if the run was linked in front of the existing nodes.
+        """
+        ends = {}
+        current_node = first
+        for _ in range(count):
+            key = current_node.data
+            run = ends.get(key)
+            if run is None:
+                ends[key] = [current_node, current_node]
+                self.before[current_node] = None
+            else:
+                self.after[run[1]] = current_node
+                self.before[current_node] = run[1]
+                run[1] = current_node
+            self.after[current_node] = None
+            current_node = current_node.next
+        for key, run in ends.items():
+            self._splice(key, run, at_front)
+
+    def _splice(self, key, run, at_front):
+        """
+        Join a chain of nodes with one key to the front or back of that key's chain.
+        Args:
+            key: The key of the nodes.
+            run: The [first, last] nodes of the chain, already linked to each other.
+            at_front: True to put the chain before the existing nodes.
+        """
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            self.buckets[key] = run
+        elif at_front:
+            self.after[run[1]] = bucket[0]
+            self.before[bucket[0]] = run[1]
+            bucket[0] = run[0]
+        else:
+            self.after[bucket[1]] = run[0]
+            self.before[run[0]] = bucket[1]
+            bucket[1] = run[1]
+
+    def link_chain(self, previous_node, first, count):
+        """
+        Record predecessors for a run of nodes linked in after previous_node,
+        and for the node that follows the run.
+        Args:
+            previous_node: The node before the run, or None.
+            first: The first node of the run.
+            count: The number of nodes in the run.
+        """
+        current_node = first
+        for _ in range(count):
+            self.prev[current_node] = previous_node
+            previous_node = current_node
+            current_node = current_node.next
+        if current_node is not None:
+            self.prev[current_node] = previous_node
+
+    def merge(self, other, previous_node, first, last):
+        """
+        Take over the index of a run of nodes linked in after previous_node.
+        Each key's chain from the run is joined whole: at the front if the run
+        was prepended, right after previous_node if that holds the key, or else
+        before the key's next node in this list. Those are found by one walk on
+        from the run that stops once every such key is placed; a key met on no
+        later node joins the end of its chain, so appending needs no walk.
+        Args:
+            other: The index of the run.
+            previous_node: The node now before the run, or None if it is the new head.
+            first: The first node of the run.
+            last: The last node of the run.
+        """
+        self.after.update(other.after)
+        self.before.update(other.before)
+        pending = {}
+        for key, run in other.buckets.items():
+            if key not in self.buckets or previous_node is None:
+                self._splice(key, run, True)
+            elif previous_node.data == key:
+                self._link(run[0], run[1], previous_node, self.after[previous_node])
+            else:
+                pending[key] = run
+        current_node = last.next
+        while pending and current_node is not None:
+            run = pending.pop(current_node.data, None)
+            if run is not None:
+                self._link(run[0], run[1], self.before[current_node], current_node)
+            current_node = current_node.next
+        for key, run in pending.items():
+            self._splice(key, run, False)
+        if other.prev:
+            self.prev.update(other.prev)
+            self.prev[first] = previous_node
+            if last.next is not None:
+                self.prev[last.next] = last
+        other.buckets = {}
+        other.after = {}
+        other.before = {}
+        other.prev = {}
+
+    def rotate_run(self, first, count, to_front):
+        """
+        Reorder chains after a ring rotation moved a run of nodes to the other end.
+        The moved nodes of each key are the last ones of its chain (to_front) or
+        the first ones, so each chain is rotated by relinking its two ends.
+        Args:
+            first: The first node of the run.
+            count: The number of nodes in the run.
+            to_front: True if the run moved from the back to the front of the list,
+                False if it moved from the front to the back.
+        """
+        edges = {}
+        current_node = first
+        for _ in range(count):
+            if to_front:
+                edges.setdefault(current_node.data, current_node)
+            else:
+                edges[current_node.data] = current_node
+            current_node = current_node.next
+        for key, edge in edges.items():
+            bucket = self.buckets[key]
+            if to_front:
+                if edge is bucket[0]:
+                    continue
+                new_first, new_last = edge, self.before[edge]
+            else:
+                if edge is bucket[1]:
+                    continue
+                new_first, new_last = self.after[edge], edge
+            self.after[bucket[1]] = bucket[0]
+            self.before[bucket[0]] = bucket[1]
+            self.before[new_first] = None
+            self.after[new_last] = None
+            bucket[0], bucket[1] = new_first, new_last
+
+    def split_off(self, first, count, tracks_prev):
+        """
+        Move a run of nodes that follows every other indexed node into a new index.
+        Because the run comes last, its nodes end the chains of their keys.
+        Args:
+            first: The first node of the run.
+            count: The number of nodes in the run.
+            tracks_prev: Whether predecessors are recorded (singly linked lists).
+        Returns:
+            _KeyIndex: An index holding just the run.
+        """
+        index = _KeyIndex()
+        current_node = first
+        for _ in range(count):
+            key = current_node.data
+            if key not in index.buckets:
+                bucket = self.buckets[key]
+                index.buckets[key] = [current_node, bucket[1]]
+                before = self.before[current_node]
+                if before is None:
+                    del self.buckets[key]
+                else:
+                    bucket[1] = before
+                    self.after[before] = None
+                self.before[current_node] = None
+            index.after[current_node] = self.after.pop(current_node)
+            index.before[current_node] = self.before.pop(current_node)
+            if tracks_prev:
+                index.prev[current_node] = self.prev.pop(current_node)
+            current_node = current_node.next
+        if tracks_prev:
+            index.prev[first] = None
+        return index
+
+# -----------------------------
+
+class _BulkDeletion(_SequenceProtocol):
+    """
+    Single-pass bulk deletion shared by the list classes.
+    Subclasses provide _delete_matching, which walks the list once, unlinks
+    every item a test accepts and returns the number removed.
+    """
+
+    def delete_where(self, predicate):
+        """
+        Delete every item for which predicate returns true, in one pass.
+        If predicate raises, items already deleted stay deleted and the list is
+        left consistent before the exception propagates.
+        Args:
+            predicate: A function taking an item and returning a bool.
+        Returns:
+            int: The number of items deleted.
+        """
+        return self._delete_matching(lambda position, data: predicate(data))
+
+    def delete_keys(self, keys):
+        """
+        Delete every item equal to one of the given keys, in one pass.
+        Args:
+            keys: An iterable of hashable keys.
+        Returns:
+            int: The number of items deleted.
+        """
+        keys = set(keys)
+        if not keys:
+            return 0
+
+        def matches(position, data):
+            try:
+                return data in keys
+            except TypeError:
+                return False
+
+        return self._delete_matching(matches)
+
+    def delete_positions(self, positions):
+        """
+        Delete the items at the given positions, in one pass.
+        Args:
+            positions: An iterable of 0-based positions in strictly increasing order.
+        Returns:
+            int: The number of items deleted.
+        Raises:
+            ValueError: If the positions are not strictly increasing or one is
+                out of bounds; the list is then left unchanged.
+        """
+        positions = list(positions)
+        if not positions:
+            return 0
+        if positions[0] < 0 or positions[-1] >= self.size:
+            raise ValueError("Position out of bounds")
+        for previous, current in zip(positions, positions[1:]):
+            if current <= previous:
+                raise ValueError("Positions must be strictly increasing")
+        targets = iter(positions)
+        state = [next(targets)]
+
+        def matches(position, data):
+            if position != state[0]:
+                return False
+            state[0] = next(targets, -1)
+            return True
+
+        return self._delete_matching(matches)
+
+# -----------------------------
+
+class _LinkedListBase(_BulkDeletion):
+    """Behaviour shared by the node-based linked lists in this module."""
+    node_class = None
+    _index = None
+    _rejects_none = False
+
+    def __iter__(self):
+        """
+        Iterate over the data of each node from the head, without copying.
+        Yields:
+            The data of each node in the list.
+        """
+        current_node = self.head
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.next
+
+    def __reversed__(self):
+        """
+        Iterate over the data from the last node to the first.
+        Doubly linked lists follow prev pointers; singly linked lists buffer their data first.
+        Returns:
+            An iterator over the data in reverse order.
+        """
+        if not self._reversible:
+            return super().__reversed__()
+        return self._iter_backwards()
+
+    def _iter_backwards(self):
+        """
+        Follow prev pointers from the last node to the head.
+        Yields:
+            The data of each node in reverse order.
+        """
+        current_node = self._last_node()
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.prev
+
+    def __contains__(self, data):
+        """
+        Check whether any node holds the given data, using the key index when there is one.
+        Args:
+            data: The data to look for.
+        Returns:
+            bool: True if a node's data equals data.
+        """
+        if self._index is None:
+            return super().__contains__(data)
+        try:
+            return data in self._index.buckets
+        except TypeError:
+            return False
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Build a list from an iterable in a single linear pass.
+        Args:
+            iterable: The items to store, in order. Generators are consumed lazily.
+            **kwargs: Arguments passed on to the list constructor (e.g. pool, indexed).
+        Returns:
+            A new list holding the items.
+        """
+        linked_list = cls(**kwargs)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _build_chain(self, iterable):
+        """
+        Link a detached chain of nodes for the items of an iterable.
+        Args:
+            iterable: The items to store, in order.
+        Returns:
+            tuple: The first node, the last node and the number of nodes (None, None, 0 if empty).
+        Raises:
+            ValueError: If the list rejects None and an item is None.
+        """
+        rejects_none = self._rejects_none
+        doubly = hasattr(self.node_class, "prev")
+        new_node = self._new_node
+        first = last = None
+        count = 0
+        for data in iterable:
+            if rejects_none and data is None:
+                raise ValueError("Data cannot be None")
+            node = new_node(data)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+                if doubly:
+                    node.prev = last
+            last = node
+            count += 1
+        return first, last, count
+
+    def _last_node(self):
+        """
+        Return the last node of the list, walking from the head.
+        Returns:
+            The last node, or None if the list is empty.
+        """
+        current_node = self.head
+        if current_node is None:
+            return None
+        while current_node.next:
+            current_node = current_node.next
+        return current_node
+
+    def extend(self, iterable):
+        """
+        Append every item of an iterable to the end of the list.
+        The new nodes are linked in one pass and attached at once, so the list
+        is left unchanged if an item is rejected.
+        Args:
+            iterable: The items to append, in order.
+        Raises:
+            ValueError: If the list rejects None and an item is None.
+        """
+        first, last, count = self._build_chain(iterable)
+        if first is None:
+            return
+        end = self._last_node()
+        if end is None:
+            self.head = first
+        else:
+            end.next = first
+            if hasattr(first, "prev"):
+                first.prev = end
+        if hasattr(self, "tail"):
+            self.tail = last
+        self.size += count
+        if self._index is not None:
+            self._index.add_chain(first, count, False)
+            if not hasattr(first, "prev"):
+                self._index.link_chain(end, first, count)
+
+    def extend_left(self, iterable):
+        """
+        Insert every item of an iterable before the head, keeping their order.
+        Unlike deque.extendleft the items are not reversed: extend_left([1, 2])
+        on the list 3 gives 1, 2, 3.
+        Args:
+            iterable: The items to prepend, in order.
+        Raises:
+            ValueError: If the list rejects None and an item is None.
+        """
+        first, last, count = self._build_chain(iterable)
+        if first is None:
+            return
+        old_head = self.head
+        last.next = old_head
+        if old_head is not None and hasattr(old_head, "prev"):
+            old_head.prev = last
+        self.head = first
+        if hasattr(self, "tail") and self.tail is None:
+            self.tail = last
+        self.size += count
+        if self._index is not None:
+            self._index.add_chain(first, count, True)
+            if not hasattr(first, "prev"):
+                self._index.link_chain(None, first, count)
+
+    def _delete_matching(self, matches):
+        """
+        Unlink, in one walk from the head, every node that matches accepts.
+        Survivors are relinked into a fresh chain as the walk goes, the chain
+        is closed by _close_chain and the key index is rebuilt.
+        Args:
+            matches: A function taking a position and an item and returning a bool.
+        Returns:
+            int: The number of nodes removed.
+        """
+        doubly = hasattr(self.node_class, "prev")
+        first = last = None
+        kept = 0
+        error = None
+        current_node = self.head
+        for position in range(self.size):
+            following = current_node.next
+            drop = False
+            if error is None:
+                try:
+                    drop = matches(position, current_node.data)
+                except BaseException as exception:
+                    error = exception
+            if drop:
+                self._release_node(current_node)
+            else:
+                if last is None:
+                    first = current_node
+                else:
+                    last.next = current_node
+                    if doubly:
+                        current_node.prev = last
+                last = current_node
+                kept += 1
+            current_node = following
+        removed = self.size - kept
+        if removed:
+            self._close_chain(first, last)
+            self.size = kept
+            self._reindex()
+        if error is not None:
+            raise error
+        return removed
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the list in place with a stable bottom-up merge sort.
+        Nodes are relinked rather than copied, so no node is allocated; the
+        sort takes O(n log n) time and O(1) extra space apart from the cached
+        keys. Equal items keep their order, also when reverse is True.
+        Args:
+            key: A function computing the sort key of an item, called once per item.
+            reverse: Whether to sort in descending order.
+        """
+        if self.size < 2:
+            return
+        first = self.head
+        last = first
+        for _ in range(self.size - 1):
+            last = last.next
+        last.next = None
+        if key is None:
+            sort_key = None
+        else:
+            keys = {}
+            current_node = first
+            while current_node is not None:
+                keys[current_node] = key(current_node.data)
+                current_node = current_node.next
+            sort_key = keys.__getitem__
+        first, last = _merge_sort_chain(first, self.size, sort_key, reverse)
+        if hasattr(first, "prev"):
+            previous_node = None
+            current_node = first
+            while current_node is not None:
+                current_node.prev = previous_node
+                previous_node = current_node
+                current_node = current_node.next
+        self._close_chain(first, last)
+        self._reindex()
+
+    def _close_chain(self, first, last):
+        """
+        Install a relinked chain of nodes as the whole list.
+        Args:
+            first: The first node of the chain, or None if it is empty.
+            last: The last node of the chain, or None if it is empty.
+        """
+        self.head = first
+        if first is not None:
+            last.next = None
+            if hasattr(first, "prev"):
+                first.prev = None
+        if hasattr(self, "tail"):
+            self.tail = last
+
+    def _reduce_options(self):
+        """
+        Return the constructor arguments needed to rebuild an equivalent list.
+        The node pool is not kept.
+        Returns:
+            dict: Keyword arguments for from_iterable.
+        """
+        return {"indexed": True} if self._index is not None else {}
+
+    @property
+    def indexed(self):
+        """
+        Whether the list keeps a hash index of its keys.
+        Returns:
+            bool: True if insert_after and delete_by_key use the index.
+        """
+        return self._index is not None
+
+    def _init_index(self, indexed):
+        """
+        Create the optional key index.
+        Args:
+            indexed: Whether to keep a key index.
+        """
+        self._index = _KeyIndex() if indexed else None
+
+    def _reindex(self):
+        """
+        Rebuild the key index from scratch after a bulk relink, if the list has one.
+        """
+        if self._index is None:
+            return
+        self._index = _KeyIndex()
+        if self.head is not None:
+            self._index.add_chain(self.head, self.size, False)
+            if not hasattr(self.head, "prev"):
+                self._index.link_chain(None, self.head, self.size)
+
+    def _init_pool(self, pool):
+        """
+        Attach an optional node pool to the list.
+        Args:
+            pool: A NodePool for this list's node class, or None.
+        Raises:
+            ValueError: If the pool hands out a different node class.
+        """
+        if pool is not None and pool.node_class is not self.node_class:
+            raise ValueError("The pool does not hold " + self.node_class.__name__ + " nodes")
+        self.pool = pool
+
+    def _new_node(self, data):
+        """
+        Create a node for the given data, taking it from the pool when there is one.
+        Args:
+            data: The data to be stored in the node.
+        Returns:
+            A detached node.
+        """
+        if self.pool is None:
+            return self.node_class(data)
+        return self.pool.acquire(data)
+
+    def _release_node(self, node):
+        """
+        Hand an unlinked node back to the pool, if the list has one.
+        Args:
+            node: The node that was removed from the list.
+        """
+        if self.pool is not None:
+            self.pool.release(node)
+
+# -----------------------------
+
+class _TailedLinkedList(_LinkedListBase):
+    """Splicing and splitting shared by the linear lists that keep a tail pointer."""
+
+    def _last_node(self):
+        """
+        Return the last node of the list.
+        Returns:
+            The tail node, or None if the list is empty.
+        """
+        return self.tail
+
+    def _check_splice(self, other):
+        """
+        Check that other's nodes can be moved into this list.
+        Args:
+            other: The list whose nodes would be moved.
+        Raises:
+            TypeError: If other is not a list of the same class.
+            ValueError: If other is this list.
+        """
+        if type(other) is not type(self):
+            raise TypeError("Can only splice a " + type(self).__name__)
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+
+    def _empty_like(self):
+        """
+        Return an empty list of the same class, pool and indexing.
+        Returns:
+            A new empty list.
+        """
+        return type(self)(pool=self.pool, indexed=self.indexed)
+
+    def _splice_nodes(self, previous_node, other):
+        """
+        Move every node of other in after previous_node and leave other empty.
+        Args:
+            previous_node: The node to splice after, or None to splice before the head.
+            other: A list of the same class.
+        """
+        first, last, count = other.head, other.tail, other.size
+        if first is None:
+            return
+        next_node = self.head if previous_node is None else previous_node.next
+        last.next = next_node
+        if hasattr(first, "prev"):
+            first.prev = previous_node
+            if next_node is not None:
+                next_node.prev = last
+        if previous_node is None:
+            self.head = first
+        else:
+            previous_node.next = first
+        if next_node is None:
+            self.tail = last
+        self.size += count
+        if self._index is not None:
+            index = other._index
+            if index is None:
+                index = _KeyIndex()
+                index.add_chain(first, count, False)
+                if not hasattr(first, "prev"):
+                    index.link_chain(previous_node, first, count)
+            self._index.merge(index, previous_node, first, last)
+        other.head = other.tail = None
+        other.size = 0
+        if other._index is not None:
+            other._index = _KeyIndex()
+
+    def concat(self, other):
+        """
+        Move every node of other to the end of this list in O(1).
+        other is left empty. If this list is indexed, the other list's index is
+        merged in (or built, if the other list has none), which is O(len(other)).
+        Args:
+            other: A list of the same class.
+        Raises:
+            TypeError: If other is not a list of the same class.
+            ValueError: If other is this list.
+        """
+        self._check_splice(other)
+        self._splice_nodes(self.tail, other)
+
+    def splice_after(self, key_or_node, other):
+        """
+        Move every node of other in after the given node, or after the first node holding a key.
+        Given a node of this list the relink is O(1); given a key, finding it is
+        O(1) on indexed lists and a scan otherwise. An indexed list also merges
+        in other's index in O(len(other)), and walks on from the spliced nodes
+        until each key of other that this list also holds meets its next copy,
+        or to the tail if one has no later copy.
+        Args:
+            key_or_node: A node of this list, or the data of the node to splice after.
+            other: A list of the same class; it is left empty.
+        Raises:
+            TypeError: If other is not a list of the same class.
+            ValueError: If other is this list or the key is not in the list.
+        """
+        self._check_splice(other)
+        if isinstance(key_or_node, self.node_class):
+            previous_node = key_or_node
+        elif self._index is not None:
+            previous_node = self._index.first(key_or_node)
+        else:
+            previous_node = self.head
+            while previous_node and previous_node.data != key_or_node:
+                previous_node = previous_node.next
+        if previous_node is None:
+            raise ValueError("The key is not in the list")
+        self._splice_nodes(previous_node, other)
+
+    def _split_nodes(self, node, count):
+        """
+        Cut the list after node and return the detached suffix as a new list.
+        Args:
+            node: The last node to keep, or None to move every node.
+            count: The number of nodes after node.
+        Returns:
+            A new list of the same class holding the suffix.
+        """
+        suffix = self._empty_like()
+        first = self.head if node is None else node.next
+        if first is None:
+            return suffix
+        suffix.head = first
+        suffix.tail = self.tail
+        suffix.size = count
+        if hasattr(first, "prev"):
+            first.prev = None
+        if node is None:
+            self.head = None
+        else:
+            node.next = None
+        self.tail = node
+        self.size -= count
+        if self._index is not None:
+            suffix._index = self._index.split_off(first, count, not hasattr(first, "prev"))
+        return suffix
+
+    def split_at(self, position):
+        """
+        Split the list so that it keeps its first position nodes.
+        Costs O(position) to find the cut, plus O(n - position) on indexed lists.
+        Args:
+            position: The number of nodes to keep, between 0 and size.
+        Returns:
+            A new list of the same class holding the remaining nodes.
+        Raises:
+            ValueError: If the position is out of bounds.
+        """
+        if position < 0 or position > self.size:
+            raise ValueError("Position out of bounds")
+        node = None
+        if position > 0:
+            node = self.head
+            for _ in range(position - 1):
+                node = node.next
+        return self._split_nodes(node, self.size - position)
+
+    def split_after(self, node):
+        """
+        Split the list after the given node, which becomes the new tail.
+        The nodes after it are counted to keep both sizes correct, so this
+        costs O(k) for a suffix of k nodes.
+        Args:
+            node: A node of this list.
+        Returns:
+            A new list of the same class holding the nodes after node.
+        """
+        count = 0
+        current_node = node.next
+        while current_node is not None:
+            count += 1
+            current_node = current_node.next
+        return self._split_nodes(node, count)
+
+# -----------------------------
+
+class SinglyLinkedListWithoutTail(_LinkedListBase):
+    """A Singly Linked List without a tail pointer."""
+    node_class = SinglyLinkedListNode
+    _rejects_none = True
+
+    def __init__(self, pool=None):
+        """
+        Initialize the linked list with head and size.
+        Args:
+            pool: An optional NodePool used to recycle nodes.
+        """
+        self.head = None
+        self.size = 0
+        self._init_pool(pool)
+    
+    def append(self, data):
+        """
+        Append a new node with the given data to the end of the list.
+        Args:
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        new_node = self._new_node(data)
+        if not self.head:
+            self.head = new_node
+            self.size += 1
+            return
+        current_node = self.head
+        while current_node.next:
+            current_node = current_node.next
+        current_node.next = new_node
+        self.size += 1
+    
+    def prepend(self, data):
+        """
+        Prepend a new node with the given data to the start of the list.
+        Args:
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        new_node = self._new_node(data)
+        new_node.next = self.head
+        self.head = new_node
+        self.size += 1
+    
+    def insert_after(self, prev_node_data, data):
+        """
+        Insert a new node with the given data after the specified node.
+        Args:
+            prev_node_data: The data of the node after which to insert the new node.
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the prev_node_data is None or if the data is None.
+        """
+        current_node = self.head
+        while current_node:
+            if current_node.data == prev_node_data:
+                new_node = self._new_node(data)
+                new_node.next = current_node.next
+                current_node.next = new_node
+                self.size += 1
+                return
+            current_node = current_node.next
+        raise ValueError("The previous node data is not in the list")
+
+    def delete_by_key(self, key):
+        """
+        Delete the first node with the specified key from the list.
+        Args:
+            key: The data of the node to be deleted.
+        Raises:
+            ValueError: If the key is None.
+        """
+        current_node = self.head
+        previous_node = None
+        
+        while current_node:
+            if current_node.data == key:
+                # If head node contains the key
+                if previous_node is None:
+                    self.head = current_node.next
+                # Middle or tail node
+                else:  
+                    previous_node.next = current_node.next
+                current_node.next = None
+                self._release_node(current_node)
+                self.size -= 1
+                return
+            previous_node = current_node
+            current_node = current_node.next
+        raise ValueError("The key is not in the list")
+    
+    def delete_by_position(self, position):
+        """
+        Delete the node at the specified position from the list.
+        Args:
+            position: The position of the node to be deleted (0-based index).
+        Raises:
+            ValueError: If the position is out of bounds.
+        """
+        if position < 0 or position >= self.size:
+            raise ValueError("Position out of bounds")
+        
+        current_node = self.head
+        previous_node = None
+        
+        for _ in range(position):
+            previous_node = current_node
+            current_node = current_node.next
+        
+        if previous_node is None:
+            self.head = current_node.next
+        else:
+            previous_node.next = current_node.next
+        
+        current_node.next = None
+        self._release_node(current_node)
+        self.size -= 1
+
+    def length(self):
+        """
+        Return the number of nodes in the linked list.
+        Returns:
+            int: The number of nodes in the list.
+        """
+        return self.size
+
+    def __str__(self):
+        """
+        Return a string representation of the linked list.
+        Returns:
+            str: A string representation of the linked list.
+        """
+        return "(head) -> " + " -> ".join(map(str, self)) + " -> (none)"
+
+# -----------------------------
+
+class SinglyLinkedListWithTail(_TailedLinkedList):
+    """A Singly Linked List with a tail pointer."""
+    node_class = SinglyLinkedListNode
+
+    def __init__(self, pool=None, indexed=False):
+        """
+        Initialize the linked list with head, tail, and size.
+        Args:
+            pool: An optional NodePool used to recycle nodes.
+            indexed: Whether to keep a hash index of keys, making the lookups in
+                insert_after and delete_by_key O(1) even among duplicates. Keys
+                must then be hashable. Inserting a key that already occurs, other
+                than right after one of its copies, also walks to its next copy.
+        """
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self._init_pool(pool)
+        self._init_index(indexed)
+    
+    def append(self, data):
+        """
+        Append a new node with the given data to the end of the list.
+        Args:
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        new_node = self._new_node(data)
+        if self._index is not None:
+            self._index.add_last(new_node)
+            self._index.prev[new_node] = self.tail
+        if not self.head:
+            self.head = new_node
+            self.tail = new_node
+            self.size += 1
+            return
+        self.tail.next = new_node
+        self.tail = new_node
+        self.size += 1
+
+    def prepend(self, data):
+        """
+        Prepend a new node with the given data to the start of the list.
+        Args:
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        new_node = self._new_node(data)
+        if self._index is not None:
+            self._index.add_first(new_node)
+            self._index.prev[new_node] = None
+            if self.head:
+                self._index.prev[self.head] = new_node
+        new_node.next = self.head
+        self.head = new_node
+        if self.size == 0:
+            self.tail = new_node
+        self.size += 1
+    
+    def insert_after(self, prev_node_data, data):
+        """
+        Insert a new node with the given data after the specified node.
+        Args:
+            prev_node_data: The data of the node after which to insert the new node.
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the prev_node_data is None or if the data is None.
+        """
+        if self._index is not None:
+            current_node = self._index.first(prev_node_data)
+        else:
+            current_node = self.head
+            while current_node and current_node.data != prev_node_data:
+                current_node = current_node.next
+        if current_node is None:
+            raise ValueError("The previous node data is not in the list")
+        new_node = self._new_node(data)
+        new_node.next = current_node.next
+        current_node.next = new_node
+        if new_node.next is None:
+            self.tail = new_node
+        if self._index is not None:
+            self._index.prev[new_node] = current_node
+            if new_node.next:
+                self._index.prev[new_node.next] = new_node
+            self._index.add(new_node, current_node, None)
+        self.size += 1
+
+    def _unlink(self, previous_node, current_node):
+        """
+        Unlink a node given its predecessor and release it.
+        Args:
+            previous_node: The node before current_node, or None if it is the head.
+            current_node: The node to remove.
+        """
+        # If head node contains the key
+        if previous_node is None:
+            self.head = current_node.next
+        # Middle or tail node
+        else:
+            previous_node.next = current_node.next
+        if current_node == self.tail:
+            self.tail = previous_node
+        if self._index is not None:
+            self._index.remove(current_node)
+            if current_node.next:
+                self._index.prev[current_node.next] = previous_node
+        current_node.next = None
+        self._release_node(current_node)
+        self.size -= 1
+    
+    def delete_by_key(self, key):
+        """
+        Delete the first node with the specified key from the list.
+        Args:
+            key: The data of the node to be deleted.
+        Raises:
+            ValueError: If the key is None.
+        """
+        if self._index is not None:
+            current_node = self._index.first(key)
+            if current_node is not None:
+                self._unlink(self._index.prev[current_node], current_node)
+                return
+            raise ValueError("The key is not in the list")
+        current_node = self.head
+        previous_node = None
+        
+        while current_node:
+            if current_node.data == key:
+                self._unlink(previous_node, current_node)
+                return
+            previous_node = current_node
+            current_node = current_node.next
+        raise ValueError("The key is not in the list")
+
+    def delete_by_position(self, position):
+        """
+        Delete the node at the specified position from the list.
+        Args:
+            position: The position of the node to be deleted (0-based index).
+        Raises:
+            ValueError: If the position is out of bounds.
+        """
+        if position < 0 or position >= self.size:
+            raise ValueError("Position out of bounds")
+        
+        current_node = self.head
+        previous_node = None
+        
+        for _ in range(position):
+            previous_node = current_node
+            current_node = current_node.next
+        
+        self._unlink(previous_node, current_node)
+
+    def length(self):
+        """
+        Return the number of nodes in the linked list.
+        Returns:
+            int: The number of nodes in the list.
+        """
+        return self.size
+
+    def __str__(self):
+        """
+        Return a string representation of the linked list.
+        Returns:
+            str: A string representation of the linked list.
+        """
+        return "(head) -> " + " -> ".join(map(str, self)) + " -> (tail)"
+
+# -----------------------------
+
+class UnrolledLinkedListNode:
+    """A node of an unrolled linked list, holding up to block_size items."""
+    __slots__ = ("items", "next")
+
+    def __init__(self, items=None):
+        """
+        Initialize the node with a block of items and next pointer.
+        Args:
+            items: The list of items stored in the block.
+        """
+        self.items = [] if items is None else items
+        self.next = None
+
+# -----------------------------
+
+class UnrolledLinkedList(_BulkDeletion):
+    """
+    A Singly Linked List whose nodes each hold a block of up to block_size items.
+    Blocks split when an insert overflows them and merge with their neighbour
+    when a delete leaves them less than half full, so there are roughly
+    n / block_size nodes to allocate and chase instead of n.
+    """
+    def __init__(self, block_size=64):
+        """
+        Initialize the linked list with head, tail, size and block size.
+        Args:
+            block_size: The maximum number of items per node.
+        Raises:
+            ValueError: If the block size is smaller than 2.
+        """
+        if block_size < 2:
+            raise ValueError("Block size must be at least 2")
+        self.block_size = block_size
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Build a list from an iterable, filling blocks in a single pass.
+        Args:
+            iterable: The items to store, in order.
+            **kwargs: Arguments passed on to the constructor (e.g. block_size).
+        Returns:
+            UnrolledLinkedList: A new list holding the items.
+        """
+        linked_list = cls(**kwargs)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _build_blocks(self, iterable):
+        """
+        Pack the items of an iterable into a detached chain of full blocks.
+        Args:
+            iterable: The items to store, in order.
+        Returns:
+            tuple: The first block, the last block and the number of items.
+        Raises:
+            ValueError: If an item is None.
+        """
+        iterator = iter(iterable)
+        first = last = None
+        count = 0
+        while True:
+            items = list(islice(iterator, self.block_size))
+            if not items:
+                break
+            if None in items:
+                raise ValueError("Data cannot be None")
+            block = UnrolledLinkedListNode(items)
+            if last is None:
+                first = block
+            else:
+                last.next = block
+            last = block
+            count += len(items)
+        return first, last, count
+
+    def extend(self, iterable):
+        """
+        Append every item of an iterable to the end of the list.
+        Args:
+            iterable: The items to append, in order.
+        Raises:
+            ValueError: If an item is None; the list is then left unchanged.
+        """
+        first, last, count = self._build_blocks(iterable)
+        if first is None:
+            return
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.size += count
+
+    def extend_left(self, iterable):
+        """
+        Insert every item of an iterable before the head, keeping their order.
+        Args:
+            iterable: The items to prepend, in order.
+        Raises:
+            ValueError: If an item is None; the list is then left unchanged.
+        """
+        first, last, count = self._build_blocks(iterable)
+        if first is None:
+            return
+        last.next = self.head
+        if self.tail is None:
+            self.tail = last
+        self.head = first
+        self.size += count
+
+    def append(self, data):
+        """
+        Append a new item to the end of the list.
+        Args:
+            data: The data to be stored.
+        Raises:
+            ValueError: If the data is None.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        if self.tail is None or len(self.tail.items) >= self.block_size:
+            block = UnrolledLinkedListNode()
+            if self.tail is None:
+                self.head = block
+            else:
+                self.tail.next = block
+            self.tail = block
+        self.tail.items.append(data)
+        self.size += 1
+
+    def prepend(self, data):
+        """
+        Prepend a new item to the start of the list.
+        Args:
+            data: The data to be stored.
+        Raises:
+            ValueError: If the data is None.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        if self.head is None or len(self.head.items) >= self.block_size:
+            block = UnrolledLinkedListNode()
+            block.next = self.head
+            if self.head is None:
+                self.tail = block
+            self.head = block
+        self.head.items.insert(0, data)
+        self.size += 1
+
+    def _find(self, key):
+        """
+        Locate the first occurrence of key.
+        Args:
+            key: The data to look up.
+        Returns:
+            tuple: The previous block, the block and the offset in it, or (None, None, -1).
+        """
+        previous_block = None
+        block = self.head
+        while block:
+            for offset, data in enumerate(block.items):
+                if data == key:
+                    return previous_block, block, offset
+            previous_block = block
+            block = block.next
+        return None, None, -1
+
+    def _split(self, block):
+        """
+        Move the upper half of an overflowing block into a new block after it.
+        Args:
+            block: The block holding more than block_size items.
+        """
+        half = len(block.items) // 2
+        new_block = UnrolledLinkedListNode(block.items[half:])
+        del block.items[half:]
+        new_block.next = block.next
+        block.next = new_block
+        if self.tail is block:
+            self.tail = new_block
+
+    def _rebalance(self, previous_block, block):
+        """
+        Restore the half-full invariant after an item was removed from block.
+        An empty block is unlinked; an underfull one merges with or borrows from the next block.
+        Args:
+            previous_block: The block before block, or None if it is the head.
+            block: The block that lost an item.
+        """
+        if not block.items:
+            if previous_block is None:
+                self.head = block.next
+            else:
+                previous_block.next = block.next
+            if self.tail is block:
+                self.tail = previous_block
+            return
+        half = self.block_size // 2
+        next_block = block.next
+        if len(block.items) >= half or next_block is None:
+            return
+        if len(block.items) + len(next_block.items) <= self.block_size:
+            block.items.extend(next_block.items)
+            block.next = next_block.next
+            if self.tail is next_block:
+                self.tail = block
+        else:
+            needed = half - len(block.items)
+            block.items.extend(next_block.items[:needed])
+            del next_block.items[:needed]
+
+    def insert_after(self, prev_node_data, data):
+        """
+        Insert a new item after the first occurrence of prev_node_data.
+        Args:
+            prev_node_data: The data after which to insert the new item.
+            data: The data to be stored.
+        Raises:
+            ValueError: If the data is None or prev_node_data is not in the list.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        _, block, offset = self._find(prev_node_data)
+        if block is None:
+            raise ValueError("The previous node data is not in the list")
+        block.items.insert(offset + 1, data)
+        if len(block.items) > self.block_size:
+            self._split(block)
+        self.size += 1
+
+    def delete_by_key(self, key):
+        """
+        Delete the first occurrence of the specified key.
+        Args:
+            key: The data to be deleted.
+        Raises:
+            ValueError: If the key is not in the list.
+        """
+        previous_block, block, offset = self._find(key)
+        if block is None:
+            raise ValueError("The key is not in the list")
+        del block.items[offset]
+        self._rebalance(previous_block, block)
+        self.size -= 1
+
+    def delete_by_position(self, position):
+        """
+        Delete the item at the specified position, skipping whole blocks on the way.
+        Args:
+            position: The position of the item to be deleted (0-based index).
+        Raises:
+            ValueError: If the position is out of bounds.
+        """
+        if position < 0 or position >= self.size:
+            raise ValueError("Position out of bounds")
+        previous_block = None
+        block = self.head
+        while position >= len(block.items):
+            position -= len(block.items)
+            previous_block = block
+            block = block.next
+        del block.items[position]
+        self._rebalance(previous_block, block)
+        self.size -= 1
+
+    def _reduce_options(self):
+        """
+        Return the constructor arguments needed to rebuild an equivalent list.
+        Returns:
+            dict: Keyword arguments for from_iterable.
+        """
+        return {"block_size": self.block_size}
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the list in place, stably, keeping every block at its current size.
+        The items are gathered into one Python list, sorted with its O(n log n)
+        merge sort and written back block by block, so no block is allocated.
+        Args:
+            key: A function computing the sort key of an item, called once per item.
+            reverse: Whether to sort in descending order.
+        """
+        items = list(self)
+        items.sort(key=key, reverse=reverse)
+        start = 0
+        block = self.head
+        while block:
+            end = start + len(block.items)
+            block.items[:] = items[start:end]
+            start = end
+            block = block.next
+
+    def _delete_matching(self, matches):
+        """
+        Filter every block in one walk, dropping emptied blocks and merging a
+        block into its predecessor whenever both fit in one block.
+        Args:
+            matches: A function taking a position and an item and returning a bool.
+        Returns:
+            int: The number of items removed.
+        """
+        previous_block = None
+        block = self.head
+        position = 0
+        removed = 0
+        error = None
+        while block:
+            following = block.next
+            if error is None:
+                kept = []
+                for offset, data in enumerate(block.items):
+                    try:
+                        drop = matches(position + offset, data)
+                    except BaseException as exception:
+                        error = exception
+                        kept.extend(block.items[offset:])
+                        break
+                    if not drop:
+                        kept.append(data)
+                position += len(block.items)
+                removed += len(block.items) - len(kept)
+                block.items = kept
+            if previous_block is not None and len(previous_block.items) + len(block.items) <= self.block_size:
+                previous_block.items.extend(block.items)
+                previous_block.next = following
+            elif block.items:
+                if previous_block is None:
+                    self.head = block
+                previous_block = block
+            block = following
+        if previous_block is None:
+            self.head = None
+        self.tail = previous_block
+        self.size -= removed
+        if error is not None:
+            raise error
+        return removed
+
+    def __iter__(self):
+        """
+        Iterate over the items block by block.
+        Yields:
+            Each item in order.
+        """
+        block = self.head
+        while block:
+            yield from block.items
+            block = block.next
+
+    def __getitem__(self, index):
+        """
+        Return the item at a position, skipping whole blocks, or a lazy view for a slice.
+        Args:
+            index: An int position (negative counts from the end) or a slice.
+        Returns:
+            The item at the position, or a LinkedListView for a slice.
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if isinstance(index, slice):
+            return LinkedListView(self, index)
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError("Position out of bounds")
+        block = self.head
+        while index >= len(block.items):
+            index -= len(block.items)
+            block = block.next
+        return block.items[index]
+
+    def __str__(self):
+        """
+        Return a string representation of the linked list.
+        Returns:
+            str: A string representation of the linked list.
+        """
+        return "(head) -> " + " -> ".join(map(str, self)) + " -> (tail)"
+
+# -----------------------------
+
+class DoublyLinkedListNode:
+    __slots__ = ("data", "next", "prev")
+
     def __init__(self, data):
         """
-        Initialize the node with data and next pointer.
+        Initialize the node with data, next pointer, and previous pointer.
         Args:
             data: The data to be stored in the node.
         Raises:
@@ -10,17 +1882,25 @@ class SinglyLinkedListNode:
         """
         self.data = data
         self.next = None
+        self.prev = None
 
 # -----------------------------
 
-class SinglyLinkedListWithoutTail:
-    """A Singly Linked List without a tail pointer."""
-    def __init__(self):
+class DoublyLinkedListWithoutTail(_LinkedListBase):
+    """A Doubly Linked List without a tail pointer."""
+    node_class = DoublyLinkedListNode
+    _rejects_none = True
+    _reversible = True
+
+    def __init__(self, pool=None):
         """
         Initialize the linked list with head and size.
+        Args:
+            pool: An optional NodePool used to recycle nodes.
         """
         self.head = None
         self.size = 0
+        self._init_pool(pool)
     
     def append(self, data):
         """
@@ -32,7 +1912,7 @@ class SinglyLinkedListWithoutTail:
         """
         if data is None:
             raise ValueError("Data cannot be None")
-        new_node = SinglyLinkedListNode(data)
+        new_node = self._new_node(data)
         if not self.head:
             self.head = new_node
             self.size += 1
@@ -41,6 +1921,7 @@ class SinglyLinkedListWithoutTail:
         while current_node.next:
             current_node = current_node.next
         current_node.next = new_node
+        new_node.prev = current_node
         self.size += 1
     
     def prepend(self, data):
@@ -53,9 +1934,12 @@ class SinglyLinkedListWithoutTail:
         """
         if data is None:
             raise ValueError("Data cannot be None")
-        new_node = SinglyLinkedListNode(data)
-        new_node.next = self.head
+        new_node = self._new_node(data)
+        current_node = self.head
         self.head = new_node
+        new_node.next = current_node
+        if current_node:
+            current_node.prev = new_node
         self.size += 1
     
     def insert_after(self, prev_node_data, data):
@@ -65,18 +1949,26 @@ class SinglyLinkedListWithoutTail:
             prev_node_data: The data of the node after which to insert the new node.
             data: The data to be stored in the new node.
         Raises:
-            ValueError: If the prev_node_data is None or if the data is None.
+            ValueError: If the prev_node_data is not found in the list.
         """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        if prev_node_data is None:
+            raise ValueError("Previous node data cannot be None")
         current_node = self.head
         while current_node:
             if current_node.data == prev_node_data:
-                new_node = SinglyLinkedListNode(data)
-                new_node.next = current_node.next
+                new_node = self._new_node(data)
+                next_node = current_node.next
                 current_node.next = new_node
+                new_node.prev = current_node
+                new_node.next = next_node
+                if next_node:
+                    next_node.prev = new_node
                 self.size += 1
                 return
             current_node = current_node.next
-        raise ValueError("The previous node data is not in the list")
+        raise ValueError("The specified node data is not in the list")
 
     def delete_by_key(self, key):
         """
@@ -86,24 +1978,30 @@ class SinglyLinkedListWithoutTail:
         Raises:
             ValueError: If the key is None.
         """
+        if key is None:
+            raise ValueError("Key cannot be None")
+        if not self.head:
+            raise ValueError("The list is empty")
         current_node = self.head
-        previous_node = None
-        
         while current_node:
             if current_node.data == key:
-                # If head node contains the key
-                if previous_node is None:
+                # Case 1: Node to delete is the head
+                if current_node == self.head:
                     self.head = current_node.next
-                # Middle or tail node
-                else:  
-                    previous_node.next = current_node.next
-                current_node.next = None
+                    if self.head:  # Update the new head's prev pointer
+                        self.head.prev = None
+                # Case 2: Node to delete is in the middle or end
+                else:
+                    if current_node.next:  # Update the next node's prev pointer
+                        current_node.next.prev = current_node.prev
+                    if current_node.prev:  # Update the previous node's next pointer
+                        current_node.prev.next = current_node.next
+                self._release_node(current_node)
                 self.size -= 1
                 return
-            previous_node = current_node
             current_node = current_node.next
         raise ValueError("The key is not in the list")
-    
+
     def delete_by_position(self, position):
         """
         Delete the node at the specified position from the list.
@@ -116,142 +2014,447 @@ class SinglyLinkedListWithoutTail:
             raise ValueError("Position out of bounds")
         
         current_node = self.head
-        previous_node = None
         
         for _ in range(position):
-            previous_node = current_node
             current_node = current_node.next
         
-        if previous_node is None:
+        if current_node.prev:
+            current_node.prev.next = current_node.next
+        else:
+            self.head = current_node.next
+        
+        if current_node.next:
+            current_node.next.prev = current_node.prev
+        
+        self._release_node(current_node)
+        self.size -= 1
+
+    def __str__(self):
+        """
+        Return a string representation of the doubly linked list without tail.
+        Returns:
+            str: A string representation of the doubly linked list without tail.
+        """
+        return " <--> ".join(map(str, self))
+
+# -----------------------------
+
+class DoublyLinkedListWithTail(_TailedLinkedList):
+    """A Doubly Linked List with a tail pointer."""
+    node_class = DoublyLinkedListNode
+    _rejects_none = True
+    _reversible = True
+
+    def __init__(self, pool=None, indexed=False):
+        """
+        Initialize the linked list with head, tail, and size.
+        Args:
+            pool: An optional NodePool used to recycle nodes.
+            indexed: Whether to keep a hash index of keys, making the lookups in
+                insert_after and delete_by_key O(1) even among duplicates. Keys
+                must then be hashable. Inserting a key that already occurs, other
+                than right after one of its copies, also walks to its next copy.
+        """
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self._init_pool(pool)
+        self._init_index(indexed)
+    
+    def append(self, data):
+        """
+        Append a new node with the given data to the end of the list.
+        Args:
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        new_node = self._new_node(data)
+        if self._index is not None:
+            self._index.add_last(new_node)
+        if not self.head:
+            self.head = new_node
+            self.tail = new_node
+            self.size += 1
+            return
+        self.tail.next = new_node
+        new_node.prev = self.tail
+        self.tail = new_node
+        self.size += 1
+    
+    def prepend(self, data):
+        """
+        Prepend a new node with the given data to the start of the list.
+        Args:
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        new_node = self._new_node(data)
+        if self._index is not None:
+            self._index.add_first(new_node)
+        new_node.next = self.head
+        if self.head:
+            self.head.prev = new_node
+        self.head = new_node
+        if self.size == 0:
+            self.tail = new_node
+        self.size += 1
+    
+    def insert_after(self, prev_node_data, data):
+        """
+        Insert a new node with the given data after the specified node.
+        Args:
+            prev_node_data: The data of the node after which to insert the new node.
+            data: The data to be stored in the new node.
+        Raises:
+            ValueError: If the prev_node_data is not found in the list.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        if prev_node_data is None:
+            raise ValueError("Previous node data cannot be None")
+        if self._index is not None:
+            current_node = self._index.first(prev_node_data)
+        else:
+            current_node = self.head
+            while current_node and current_node.data != prev_node_data:
+                current_node = current_node.next
+        if current_node is None:
+            raise ValueError("The specified node data is not in the list")
+        new_node = self._new_node(data)
+        next_node = current_node.next
+        current_node.next = new_node
+        new_node.prev = current_node
+        new_node.next = next_node
+        if next_node:
+            next_node.prev = new_node
+        else:
+            self.tail = new_node
+        if self._index is not None:
+            self._index.add(new_node, current_node, None)
+        self.size += 1
+
+    def _unlink(self, current_node):
+        """
+        Unlink a node from the list and release it.
+        Args:
+            current_node: The node to remove.
+        """
+        if current_node.prev:
+            current_node.prev.next = current_node.next
+        else:
             self.head = current_node.next
+        
+        if current_node.next:
+            current_node.next.prev = current_node.prev
         else:
-            previous_node.next = current_node.next
+            self.tail = current_node.prev
         
-        current_node.next = None
+        if self._index is not None:
+            self._index.remove(current_node)
+        self._release_node(current_node)
+        self.size -= 1
+    
+    def append_node(self, node):
+        """
+        Link a detached node to the end of the list in O(1).
+        Callers that keep their own references to nodes (such as LRUCache)
+        use this with remove_node and move_to_end to avoid searching by key.
+        Args:
+            node: A node that is not part of any list.
+        """
+        node.prev = self.tail
+        node.next = None
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        if self._index is not None:
+            self._index.add_last(node)
+        self.size += 1
+
+    def remove_node(self, node):
+        """
+        Unlink a node of this list in O(1).
+        Args:
+            node: A node currently in the list.
+        """
+        self._unlink(node)
+
+    def move_to_end(self, node):
+        """
+        Move a node of this list to the end in O(1), without reallocating it.
+        Args:
+            node: A node currently in the list.
+        """
+        if node is self.tail:
+            return
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        node.next.prev = node.prev
+        if self._index is not None:
+            self._index.remove(node)
         self.size -= 1
+        self.append_node(node)
+
+    def delete_by_key(self, key):
+        """
+        Delete the first node with the specified key from the list.
+        Args:
+            key: The data of the node to be deleted.
+        Raises:
+            ValueError: If the key is None.
+        """
+        if key is None:
+            raise ValueError("Key cannot be None")
+        if not self.head:
+            raise ValueError("The list is empty")
+        if self._index is not None:
+            current_node = self._index.first(key)
+        else:
+            current_node = self.head
+            while current_node and current_node.data != key:
+                current_node = current_node.next
+        if current_node is None:
+            raise ValueError("The key is not in the list")
+        self._unlink(current_node)
+
+    def delete_by_position(self, position):
+        """
+        Delete the node at the specified position from the list.
+        Args:
+            position: The position of the node to be deleted (0-based index).
+        Raises:
+            ValueError: If the position is out of bounds.
+        """
+        if position < 0 or position >= self.size:
+            raise ValueError("Position out of bounds")
+        
+        current_node = self.head
+        
+        for _ in range(position):
+            current_node = current_node.next
+        
+        self._unlink(current_node)
+    
+    def __str__(self):
+        """
+        Return a string representation of the doubly linked list with tail.
+        Returns:
+            str: A string representation of the doubly linked list with tail.
+        """
+        return " <--> ".join(map(str, self))
+
+class CircularSinglyLinkedListNode:
+    __slots__ = ("data", "next")
+
+    def __init__(self, data):
+        """
+        Initialize the node with data and next pointer.
+        Args:
+            data: The data to be stored in the node.
+        Raises:
+            ValueError: If the data is None.
+        """
+        self.data = data
+        self.next = None
+    
+class CircularSinglyLinkedListWithoutTail(_LinkedListBase):
+    node_class = CircularSinglyLinkedListNode
 
-    def traverse(self):
+    def __init__(self, pool=None, indexed=False):
         """
-        Traverse the linked list and return a list of node data.
-        Returns:
-            list: A list containing the data of each node in the linked list.
+        Initialize the circular linked list with head and size.
+        Args:
+            pool: An optional NodePool used to recycle nodes.
+            indexed: Whether to keep a hash index of keys, making the lookups in
+                insert_after and delete_by_key O(1) even among duplicates. Keys
+                must then be hashable. Inserting a key that already occurs, other
+                than right after one of its copies, also walks to its next copy.
         """
-        if not self.head:
-            return []
-        current_node = self.head
-        nodes = []
-        nodes.append(str(current_node.data))
-        while current_node.next:
-            current_node = current_node.next
-            nodes.append(str(current_node.data))
-        return nodes
-    
-    def length(self):
+        self.head = None
+        self.size = 0
+        self._init_pool(pool)
+        self._init_index(indexed)
+
+    def _close_chain(self, first, last):
         """
-        Return the number of nodes in the linked list.
-        Returns:
-            int: The number of nodes in the list.
+        Install a relinked chain of nodes as the whole ring.
+        Args:
+            first: The first node of the chain, or None if it is empty.
+            last: The last node of the chain, or None if it is empty.
         """
-        return self.size
+        self.head = first
+        if first is not None:
+            last.next = first
 
-    def __str__(self):
+    def _last_node(self):
         """
-        Return a string representation of the linked list.
+        Return the node whose next pointer closes the ring.
         Returns:
-            str: A string representation of the linked list.
+            The last node, or None if the list is empty.
         """
-        return "(head) -> " + " -> ".join(self.traverse()) + " -> (none)"
+        if not self.head:
+            return None
+        if self._index is not None:
+            return self._index.prev[self.head]
+        current_node = self.head
+        while current_node.next != self.head:
+            current_node = current_node.next
+        return current_node
 
-# -----------------------------
+    def extend(self, iterable):
+        """
+        Append every item of an iterable to the end of the ring in one pass.
+        Args:
+            iterable: The items to append, in order.
+        """
+        self._splice_chain(iterable, False)
 
-class SinglyLinkedListWithTail:
-    """A Singly Linked List with a tail pointer."""
-    def __init__(self):
+    def extend_left(self, iterable):
         """
-        Initialize the linked list with head, tail, and size.
+        Insert every item of an iterable before the head, keeping their order.
+        Args:
+            iterable: The items to prepend, in order.
         """
-        self.head = None
-        self.tail = None
-        self.size = 0
-    
-    def append(self, data):
+        self._splice_chain(iterable, True)
+
+    def _splice_chain(self, iterable, at_front):
         """
-        Append a new node with the given data to the end of the list.
+        Link the items of an iterable into the ring between the last node and the head.
         Args:
-            data: The data to be stored in the new node.
-        Raises:
-            ValueError: If the data is None.
+            iterable: The items to insert, in order.
+            at_front: True to make the first item the new head.
         """
-        new_node = SinglyLinkedListNode(data)
-        if not self.head:
-            self.head = new_node
-            self.tail = new_node
-            self.size += 1
+        first, last, count = self._build_chain(iterable)
+        if first is None:
             return
-        self.tail.next = new_node
-        self.tail = new_node
-        self.size += 1
+        end = self._last_node()
+        if end is None:
+            self.head = first
+        else:
+            end.next = first
+        last.next = self.head
+        if at_front:
+            self.head = first
+        self.size += count
+        if self._index is not None:
+            self._index.add_chain(first, count, at_front)
+            self._index.link_chain(end, first, count)
 
-    def prepend(self, data):
+    def _link_after(self, previous_node, new_node):
         """
-        Prepend a new node with the given data to the start of the list.
+        Link a new node into the ring after previous_node, or as the only node.
         Args:
-            data: The data to be stored in the new node.
-        Raises:
-            ValueError: If the data is None.
+            previous_node: The node to insert after, or None if the list is empty.
+            new_node: The node to link in.
         """
-        new_node = SinglyLinkedListNode(data)
-        new_node.next = self.head
-        self.head = new_node
-        if self.size == 0:
-            self.tail = new_node
+        if previous_node is None:
+            self.head = new_node
+            new_node.next = new_node
+        else:
+            new_node.next = previous_node.next
+            previous_node.next = new_node
+        if self._index is not None:
+            self._index.prev[new_node] = new_node if previous_node is None else previous_node
+            self._index.prev[new_node.next] = new_node
         self.size += 1
     
+    def append(self, data):
+        new_node = self._new_node(data)
+        self._link_after(self._last_node(), new_node)
+        if self._index is not None:
+            self._index.add_last(new_node)
+    
+    def prepend(self, data):
+        new_node = self._new_node(data)
+        self._link_after(self._last_node(), new_node)
+        self.head = new_node
+        if self._index is not None:
+            self._index.add_first(new_node)
+    
     def insert_after(self, prev_node_data, data):
         """
-        Insert a new node with the given data after the specified node.
+        Insert a new node with the given data after the first node holding prev_node_data.
         Args:
             prev_node_data: The data of the node after which to insert the new node.
             data: The data to be stored in the new node.
         Raises:
-            ValueError: If the prev_node_data is None or if the data is None.
+            ValueError: If the prev_node_data is not in the list.
+        """
+        current_node = self._find(prev_node_data)
+        if current_node is None:
+            raise ValueError("The previous node data is not in the list")
+        new_node = self._new_node(data)
+        self._link_after(current_node, new_node)
+        if self._index is not None:
+            self._index.add(new_node, current_node, self.head)
+
+    def _find(self, key):
         """
+        Return the first node holding key, or None.
+        Args:
+            key: The data to look up.
+        Returns:
+            The first node whose data equals key, or None.
+        """
+        if self._index is not None:
+            return self._index.first(key)
         current_node = self.head
-        while current_node:
-            if current_node.data == prev_node_data:
-                new_node = SinglyLinkedListNode(data)
-                new_node.next = current_node.next
-                current_node.next = new_node
-                if new_node.next is None:
-                    self.tail = new_node
-                self.size += 1
-                return
+        for _ in range(self.size):
+            if current_node.data == key:
+                return current_node
             current_node = current_node.next
-        raise ValueError("The previous node data is not in the list")
-    
+        return None
+
+    def _unlink(self, previous_node, current_node):
+        """
+        Unlink a node given its predecessor in the ring and release it.
+        Args:
+            previous_node: The node whose next pointer is current_node.
+            current_node: The node to remove.
+        """
+        if self._index is not None:
+            self._index.remove(current_node)
+        if current_node.next is current_node:
+            self.head = None
+        else:
+            previous_node.next = current_node.next
+            if current_node is self.head:
+                self.head = current_node.next
+            if self._index is not None:
+                self._index.prev[current_node.next] = previous_node
+        current_node.next = None
+        self._release_node(current_node)
+        self.size -= 1
+
     def delete_by_key(self, key):
         """
         Delete the first node with the specified key from the list.
         Args:
             key: The data of the node to be deleted.
         Raises:
-            ValueError: If the key is None.
+            ValueError: If the key is not in the list.
         """
+        if self._index is not None:
+            current_node = self._index.first(key)
+            if current_node is None:
+                raise ValueError("The key is not in the list")
+            self._unlink(self._index.prev[current_node], current_node)
+            return
+        previous_node = self._last_node()
         current_node = self.head
-        previous_node = None
-        
-        while current_node:
+        for _ in range(self.size):
             if current_node.data == key:
-                # If head node contains the key
-                if previous_node is None:
-                    self.head = current_node.next
-                # Middle or tail node
-                else:  
-                    previous_node.next = current_node.next
-                if current_node == self.tail:
-                    self.tail = previous_node
-                current_node.next = None
-                self.size -= 1
+                self._unlink(previous_node, current_node)
                 return
             previous_node = current_node
             current_node = current_node.next
@@ -267,60 +2470,59 @@ class SinglyLinkedListWithTail:
         """
         if position < 0 or position >= self.size:
             raise ValueError("Position out of bounds")
-        
-        current_node = self.head
-        previous_node = None
-        
-        for _ in range(position):
-            previous_node = current_node
-            current_node = current_node.next
-        
-        if previous_node is None:
-            self.head = current_node.next
-        else:
-            previous_node.next = current_node.next
-        
-        if current_node == self.tail:
-            self.tail = previous_node
-        
-        current_node.next = None
-        self.size -= 1
+        if position == 0:
+            self._unlink(self._last_node(), self.head)
+            return
+        previous_node = self.head
+        for _ in range(position - 1):
+            previous_node = previous_node.next
+        self._unlink(previous_node, previous_node.next)
 
-    def traverse(self):
+    def __iter__(self):
         """
-        Traverse the linked list and return a list of node data.
-        Returns:
-            list: A list containing the data of each node in the linked list.
+        Iterate over the data of each node once, starting at the head.
+        Yields:
+            The data of each node in the ring.
         """
-        if not self.head:
-            return []
         current_node = self.head
-        nodes = []
-        nodes.append(str(current_node.data))
-        while current_node.next:
+        for _ in range(self.size):
+            yield current_node.data
             current_node = current_node.next
-            nodes.append(str(current_node.data))
-        return nodes
-    
-    def length(self):
+
+    def cycle(self):
         """
-        Return the number of nodes in the linked list.
-        Returns:
-            int: The number of nodes in the list.
+        Yield the data round-robin forever, starting at the head.
+        The generator stops when the list becomes empty. Deleting the item that
+        was just yielded is safe; other changes made while cycling are not.
+        Yields:
+            The data of each node, wrapping around the ring.
         """
-        return self.size
+        current_node = self.head
+        while self.head is not None:
+            following = current_node.next
+            yield current_node.data
+            if self.head is None:
+                return
+            current_node = following
 
-    def __str__(self):
+    def loop_3_times(self):
         """
-        Return a string representation of the linked list.
-        Returns:
-            str: A string representation of the linked list.
+        Print the ring three times over. Kept for compatibility; use cycle() instead.
         """
-        return "(head) -> " + " -> ".join(self.traverse()) + " -> (tail)"
-
-# -----------------------------
+        if not self.head:
+            return
+        for data in islice(self.cycle(), 3 * self.size):
+            print(data, end=" -> ")
+        print("...")
+    
+    def __str__(self):
+        if not self.head:
+            return "(head) -> (none)"
+        return "(head) -> " + " -> ".join(map(str, self)) + " -> (head)"
+  
+class CircularDoublyLinkedListNode:
+    __slots__ = ("data", "next", "prev")
 
-class DoublyLinkedListNode:
     def __init__(self, data):
         """
         Initialize the node with data, next pointer, and previous pointer.
@@ -335,176 +2537,170 @@ class DoublyLinkedListNode:
 
 # -----------------------------
 
-class DoublyLinkedListWithoutTail:
-    """A Doubly Linked List without a tail pointer."""
-    def __init__(self):
-        """
-        Initialize the linked list with head and size.
-        """
-        self.head = None
-        self.size = 0
-    
-    def append(self, data):
-        """
-        Append a new node with the given data to the end of the list.
-        Args:
-            data: The data to be stored in the new node.
-        Raises:
-            ValueError: If the data is None.
-        """
-        if data is None:
-            raise ValueError("Data cannot be None")
-        new_node = DoublyLinkedListNode(data)
-        if not self.head:
-            self.head = new_node
-            self.size += 1
-            return
-        current_node = self.head
-        while current_node.next:
-            current_node = current_node.next
-        current_node.next = new_node
-        new_node.prev = current_node
-        self.size += 1
-    
-    def prepend(self, data):
-        """
-        Prepend a new node with the given data to the start of the list.
-        Args:
-            data: The data to be stored in the new node.
-        Raises:
-            ValueError: If the data is None.
-        """
-        if data is None:
-            raise ValueError("Data cannot be None")
-        new_node = DoublyLinkedListNode(data)
-        current_node = self.head
-        self.head = new_node
-        new_node.next = current_node
-        if current_node:
-            current_node.prev = new_node
-        self.size += 1
-    
-    def insert_after(self, prev_node_data, data):
-        """
-        Insert a new node with the given data after the specified node.
+class _CircularLinkedList(_LinkedListBase):
+    """
+    A circular linked list tracked by its tail, so the head is always tail.next
+    and both append and prepend are O(1).
+    """
+    def __init__(self, pool=None, indexed=False):
+        """
+        Initialize the circular linked list with tail and size.
         Args:
-            prev_node_data: The data of the node after which to insert the new node.
-            data: The data to be stored in the new node.
-        Raises:
-            ValueError: If the prev_node_data is not found in the list.
+            pool: An optional NodePool used to recycle nodes.
+            indexed: Whether to keep a hash index of keys, making the lookups in
+                insert_after and delete_by_key O(1) even among duplicates. Keys
+                must then be hashable. Inserting a key that already occurs, other
+                than right after one of its copies, also walks to its next copy.
         """
-        if data is None:
-            raise ValueError("Data cannot be None")
-        if prev_node_data is None:
-            raise ValueError("Previous node data cannot be None")
-        current_node = self.head
-        while current_node:
-            if current_node.data == prev_node_data:
-                new_node = DoublyLinkedListNode(data)
-                next_node = current_node.next
-                current_node.next = new_node
-                new_node.prev = current_node
-                new_node.next = next_node
-                if next_node:
-                    next_node.prev = new_node
-                self.size += 1
-                return
-            current_node = current_node.next
-        raise ValueError("The specified node data is not in the list")
+        self.tail = None
+        self.size = 0
+        self._init_pool(pool)
+        self._init_index(indexed)
 
-    def delete_by_key(self, key):
-        """
-        Delete the first node with the specified key from the list.
-        Args:
-            key: The data of the node to be deleted.
-        Raises:
-            ValueError: If the key is None.
+    @property
+    def head(self):
         """
-        if key is None:
-            raise ValueError("Key cannot be None")
-        if not self.head:
-            raise ValueError("The list is empty")
-        current_node = self.head
-        while current_node:
-            if current_node.data == key:
-                # Case 1: Node to delete is the head
-                if current_node == self.head:
-                    self.head = current_node.next
-                    if self.head:  # Update the new head's prev pointer
-                        self.head.prev = None
-                # Case 2: Node to delete is in the middle or end
-                else:
-                    if current_node.next:  # Update the next node's prev pointer
-                        current_node.next.prev = current_node.prev
-                    if current_node.prev:  # Update the previous node's next pointer
-                        current_node.prev.next = current_node.next
-                return
-            current_node = current_node.next
-        raise ValueError("The key is not in the list")
+        The first node of the ring.
+        Returns:
+            The node after the tail, or None if the list is empty.
+        """
+        return self.tail.next if self.tail is not None else None
 
-    def delete_by_position(self, position):
+    def _last_node(self):
         """
-        Delete the node at the specified position from the list.
+        Return the last node of the ring.
+        Returns:
+            The tail node, or None if the list is empty.
+        """
+        return self.tail
+
+    def _close_chain(self, first, last):
+        """
+        Install a relinked chain of nodes as the whole ring.
         Args:
-            position: The position of the node to be deleted (0-based index).
-        Raises:
-            ValueError: If the position is out of bounds.
+            first: The first node of the chain, or None if it is empty.
+            last: The last node of the chain, or None if it is empty.
+        """
+        self.tail = last
+        if first is not None:
+            last.next = first
+            if hasattr(first, "prev"):
+                first.prev = last
+
+    def __iter__(self):
+        """
+        Iterate over the data of each node once, starting at the head.
+        Yields:
+            The data of each node in the ring.
         """
-        if position < 0 or position >= self.size:
-            raise ValueError("Position out of bounds")
-        
         current_node = self.head
-        
-        for _ in range(position):
+        for _ in range(self.size):
+            yield current_node.data
             current_node = current_node.next
-        
-        if current_node.prev:
-            current_node.prev.next = current_node.next
-        else:
-            self.head = current_node.next
-        
-        if current_node.next:
-            current_node.next.prev = current_node.prev
-        
-        self.size -= 1
 
-    def traverse(self):
+    def _iter_backwards(self):
         """
-        Traverse the linked list and return a list of node data.
-        Returns:
-            list: A list containing the data of each node in the linked list.
+        Follow prev pointers once around the ring, starting at the tail.
+        Yields:
+            The data of each node in reverse order.
+        """
+        current_node = self.tail
+        for _ in range(self.size):
+            yield current_node.data
+            current_node = current_node.prev
+
+    def cycle(self):
+        """
+        Yield the data round-robin forever, starting at the head.
+        The generator stops when the list becomes empty. Deleting the item that
+        was just yielded is safe; other changes made while cycling are not.
+        Yields:
+            The data of each node, wrapping around the ring.
         """
-        if not self.head:
-            return []
         current_node = self.head
-        nodes = []
-        while current_node:
-            nodes.append(str(current_node.data))
-            current_node = current_node.next
-        return nodes
+        while self.tail is not None:
+            following = current_node.next
+            yield current_node.data
+            if self.tail is None:
+                return
+            current_node = following
 
-    def __str__(self):
+    def _find_with_previous(self, key):
         """
-        Return a string representation of the doubly linked list without tail.
+        Locate the first node holding key together with its predecessor.
+        Args:
+            key: The data to look up.
         Returns:
-            str: A string representation of the doubly linked list without tail.
-        """
-        return str(" <--> ".join(self.traverse()))
+            tuple: The previous node and the node, or (None, None) if key is not in the list.
+        """
+        if self._index is not None:
+            current_node = self._index.first(key)
+            if current_node is None:
+                return None, None
+            if self._reversible:
+                return current_node.prev, current_node
+            return self._index.prev[current_node], current_node
+        previous_node = self.tail
+        for _ in range(self.size):
+            current_node = previous_node.next
+            if current_node.data == key:
+                return previous_node, current_node
+            previous_node = current_node
+        return None, None
 
-# -----------------------------
+    def _link_after(self, previous_node, new_node):
+        """
+        Link a new node into the ring after previous_node, or as the only node.
+        The tail is not moved, except when the list was empty.
+        Args:
+            previous_node: The node to insert after, or None if the list is empty.
+            new_node: The node to link in.
+        """
+        if previous_node is None:
+            new_node.next = new_node
+            if self._reversible:
+                new_node.prev = new_node
+            self.tail = new_node
+            previous_node = new_node
+        else:
+            next_node = previous_node.next
+            new_node.next = next_node
+            previous_node.next = new_node
+            if self._reversible:
+                new_node.prev = previous_node
+                next_node.prev = new_node
+        if self._index is not None and not self._reversible:
+            self._index.prev[new_node] = previous_node
+            self._index.prev[new_node.next] = new_node
+        self.size += 1
 
-class DoublyLinkedListWithTail:
-    def __init__(self):
+    def _unlink(self, previous_node, current_node):
         """
-        Initialize the linked list with head, tail, and size.
+        Unlink a node given its predecessor in the ring and release it.
+        Args:
+            previous_node: The node whose next pointer is current_node.
+            current_node: The node to remove.
         """
-        self.head = None
-        self.tail = None
-        self.size = 0
-    
+        if self._index is not None:
+            self._index.remove(current_node)
+        if current_node.next is current_node:
+            self.tail = None
+        else:
+            next_node = current_node.next
+            previous_node.next = next_node
+            if self._reversible:
+                next_node.prev = previous_node
+            elif self._index is not None:
+                self._index.prev[next_node] = previous_node
+            if current_node is self.tail:
+                self.tail = previous_node
+        current_node.next = None
+        self._release_node(current_node)
+        self.size -= 1
+
     def append(self, data):
         """
-        Append a new node with the given data to the end of the list.
+        Append a new node with the given data after the tail in O(1).
         Args:
             data: The data to be stored in the new node.
         Raises:
@@ -512,20 +2708,15 @@ class DoublyLinkedListWithTail:
         """
         if data is None:
             raise ValueError("Data cannot be None")
-        new_node = DoublyLinkedListNode(data)
-        if not self.head:
-            self.head = new_node
-            self.tail = new_node
-            self.size += 1
-            return
-        self.tail.next = new_node
-        new_node.prev = self.tail
+        new_node = self._new_node(data)
+        self._link_after(self.tail, new_node)
         self.tail = new_node
-        self.size += 1
-    
+        if self._index is not None:
+            self._index.add_last(new_node)
+
     def prepend(self, data):
         """
-        Prepend a new node with the given data to the start of the list.
+        Prepend a new node with the given data before the head in O(1).
         Args:
             data: The data to be stored in the new node.
         Raises:
@@ -533,80 +2724,49 @@ class DoublyLinkedListWithTail:
         """
         if data is None:
             raise ValueError("Data cannot be None")
-        new_node = DoublyLinkedListNode(data)
-        new_node.next = self.head
-        if self.head:
-            self.head.prev = new_node
-        self.head = new_node
-        if self.size == 0:
-            self.tail = new_node
-        self.size += 1
-    
+        new_node = self._new_node(data)
+        self._link_after(self.tail, new_node)
+        if self._index is not None:
+            self._index.add_first(new_node)
+
     def insert_after(self, prev_node_data, data):
         """
-        Insert a new node with the given data after the specified node.
+        Insert a new node with the given data after the first node holding prev_node_data.
         Args:
             prev_node_data: The data of the node after which to insert the new node.
             data: The data to be stored in the new node.
         Raises:
-            ValueError: If the prev_node_data is not found in the list.
+            ValueError: If the data is None or prev_node_data is not in the list.
         """
         if data is None:
             raise ValueError("Data cannot be None")
-        if prev_node_data is None:
-            raise ValueError("Previous node data cannot be None")
-        current_node = self.head
-        while current_node:
-            if current_node.data == prev_node_data:
-                new_node = DoublyLinkedListNode(data)
-                next_node = current_node.next
-                current_node.next = new_node
-                new_node.prev = current_node
-                new_node.next = next_node
-                if next_node:
-                    next_node.prev = new_node
-                else:
-                    self.tail = new_node
-                self.size += 1
-                return
-            current_node = current_node.next
-        raise ValueError("The specified node data is not in the list")
-    
+        _, current_node = self._find_with_previous(prev_node_data)
+        if current_node is None:
+            raise ValueError("The previous node data is not in the list")
+        new_node = self._new_node(data)
+        self._link_after(current_node, new_node)
+        if current_node is self.tail:
+            self.tail = new_node
+        if self._index is not None:
+            self._index.add(new_node, current_node, self.head)
+
     def delete_by_key(self, key):
         """
         Delete the first node with the specified key from the list.
         Args:
             key: The data of the node to be deleted.
         Raises:
-            ValueError: If the key is None.
+            ValueError: If the key is not in the list.
         """
-        if key is None:
-            raise ValueError("Key cannot be None")
-        if not self.head:
-            raise ValueError("The list is empty")
-        current_node = self.head
-        while current_node:
-            if current_node.data == key:
-                # Case 1: Node to delete is the head
-                if current_node == self.head:
-                    self.head = current_node.next
-                    if self.head:
-                        self.head.prev = None
-                # Case 2: Node to delete is in the middle or end
-                else:
-                    if current_node.next:
-                        current_node.next.prev = current_node.prev
-                    if current_node.prev:
-                        current_node.prev.next = current_node.next
-                    else:
-                        self.tail = current_node.prev
-                return
-            current_node = current_node.next
-        raise ValueError("The key is not in the list")
+        previous_node, current_node = self._find_with_previous(key)
+        if current_node is None:
+            raise ValueError("The key is not in the list")
+        self._unlink(previous_node, current_node)
 
     def delete_by_position(self, position):
         """
         Delete the node at the specified position from the list.
+        Doubly linked rings walk from whichever end is closer.
         Args:
             position: The position of the node to be deleted (0-based index).
         Raises:
@@ -614,167 +2774,211 @@ class DoublyLinkedListWithTail:
         """
         if position < 0 or position >= self.size:
             raise ValueError("Position out of bounds")
-        
-        current_node = self.head
-        
+        if self._reversible and position > self.size // 2:
+            current_node = self.tail
+            for _ in range(self.size - 1 - position):
+                current_node = current_node.prev
+            self._unlink(current_node.prev, current_node)
+            return
+        previous_node = self.tail
         for _ in range(position):
-            current_node = current_node.next
-        
-        if current_node.prev:
-            current_node.prev.next = current_node.next
-        else:
-            self.head = current_node.next
-        
-        if current_node.next:
-            current_node.next.prev = current_node.prev
-        else:
-            self.tail = current_node.prev
-        
-        self.size -= 1
-    
-    def traverse(self):
+            previous_node = previous_node.next
+        self._unlink(previous_node, previous_node.next)
+
+    def extend(self, iterable):
         """
-        Traverse the linked list and return a list of node data.
-        Returns:
-            list: A list containing the data of each node in the linked list.
+        Append every item of an iterable after the tail in one pass.
+        Args:
+            iterable: The items to append, in order.
+        Raises:
+            ValueError: If an item is None; the list is then left unchanged.
         """
-        if not self.head:
-            return []
-        current_node = self.head
-        nodes = []
-        while current_node:
-            nodes.append(str(current_node.data))
-            current_node = current_node.next
-        return nodes
-    
-    def __str__(self):
+        self._splice_chain(iterable, False)
+
+    def extend_left(self, iterable):
         """
-        Return a string representation of the doubly linked list with tail.
-        Returns:
-            str: A string representation of the doubly linked list with tail.
+        Insert every item of an iterable before the head, keeping their order.
+        Args:
+            iterable: The items to prepend, in order.
+        Raises:
+            ValueError: If an item is None; the list is then left unchanged.
         """
-        return str(" <--> ".join(self.traverse()))
+        self._splice_chain(iterable, True)
 
-class CircularSinglyLinkedListNode:
-    def __init__(self, data):
+    def _splice_chain(self, iterable, at_front):
         """
-        Initialize the node with data and next pointer.
+        Link the items of an iterable into the ring between the tail and the head.
         Args:
-            data: The data to be stored in the node.
-        Raises:
-            ValueError: If the data is None.
+            iterable: The items to insert, in order.
+            at_front: True to insert before the head, False to insert after the tail.
         """
-        self.data = data
-        self.next = None
-    
-class CircularSinglyLinkedListWithoutTail:
-    def __init__(self):
-        self.head = None
-        self.size = 0
-    
-    def append(self, data):
-        new_node = CircularSinglyLinkedListNode(data)
-        if not self.head:
-            self.head = new_node
-            self.head.next = new_node
-            self.size += 1
+        first, last, count = self._build_chain(iterable)
+        if first is None:
             return
-        current_node = self.head
-        while True:
-            if current_node.next == self.head:
-                current_node.next = new_node
-                new_node.next = self.head
-                self.size += 1
-                return
-            current_node = current_node.next
-    
-    def prepend(self, data):
-        new_node = CircularSinglyLinkedListNode(data)
-        if not self.head:
-            self.head = new_node
-            self.head.next = new_node
-            self.size += 1
+        end = self.tail
+        head = first if end is None else end.next
+        last.next = head
+        if end is not None:
+            end.next = first
+        if self._reversible:
+            first.prev = last if end is None else end
+            head.prev = last
+        if not at_front or end is None:
+            self.tail = last
+        self.size += count
+        if self._index is not None:
+            self._index.add_chain(first, count, at_front)
+            if not self._reversible:
+                self._index.link_chain(end, first, count)
+
+    def rotate(self, k=1):
+        """
+        Rotate the ring k steps to the right, like deque.rotate: rotate(1)
+        moves the last item to the front and rotate(-1) moves the first item
+        to the back. Only the tail pointer moves; no node is relinked.
+        Doubly linked rings walk min(k, n - k) steps. Singly linked rings can
+        only walk forwards, so they take (n - k) mod n steps.
+        Args:
+            k: The number of steps to rotate; negative values rotate left.
+        """
+        if self.size < 2:
             return
-        current_node = self.head
-        while current_node.next != self.head:
-            current_node = current_node.next
-        current_node.next = new_node
-        new_node.next = self.head
-        self.head = new_node
-        self.size += 1
-    
-    def insert_after(self, prev_node_data, data):
-        new_node = CircularSinglyLinkedListNode(data)
-        current_node = self.head
-        while True:
-            if current_node.data == prev_node_data:
-                if current_node.next != self.head:
-                    new_node.next = current_node.next
-                else:
-                    new_node.next = self.head
-                current_node.next = new_node
-                return
-            current_node = current_node.next
+        steps = -k % self.size
+        if steps == 0:
+            return
+        if self._reversible and steps > self.size // 2:
+            moved = self.size - steps
+            for _ in range(moved):
+                self.tail = self.tail.prev
+            if self._index is not None:
+                self._index.rotate_run(self.head, moved, True)
+            return
+        first = self.head
+        for _ in range(steps):
+            self.tail = self.tail.next
+        if self._index is not None:
+            self._index.rotate_run(first, steps, False)
 
+    def __str__(self):
+        """
+        Return a string representation of the circular linked list.
+        Returns:
+            str: A string representation of the circular linked list.
+        """
+        if self.tail is None:
+            return "(head) -> (none)"
+        return "(head) -> " + " -> ".join(map(str, self)) + " -> (head)"
 
+# -----------------------------
 
-    def delete_by_key(self, key):
-        pass
+class CircularSinglyLinkedListWithTail(_CircularLinkedList):
+    """A Circular Singly Linked List with a tail pointer."""
+    node_class = CircularSinglyLinkedListNode
+    _rejects_none = True
 
-    def delete_by_position(self, position):
-        pass
+# -----------------------------
 
+class CircularDoublyLinkedListWithTail(_CircularLinkedList):
+    """A Circular Doubly Linked List with a tail pointer."""
+    node_class = CircularDoublyLinkedListNode
+    _rejects_none = True
+    _reversible = True
 
+def _merge_runs(left, right, sort_key, reverse):
+    """
+    Merge two sorted, None-terminated chains, preferring left on ties.
+    Args:
+        left: The first node of the earlier run.
+        right: The first node of the later run.
+        sort_key: A function mapping a node to its key, or None to compare data.
+        reverse: Whether the runs are in descending order.
+    Returns:
+        tuple: The first and last node of the merged run.
+    """
+    first = last = None
+    while left is not None and right is not None:
+        if sort_key is None:
+            left_key, right_key = left.data, right.data
+        else:
+            left_key, right_key = sort_key(left), sort_key(right)
+        if (left_key < right_key) if reverse else (right_key < left_key):
+            node, right = right, right.next
+        else:
+            node, left = left, left.next
+        if last is None:
+            first = node
+        else:
+            last.next = node
+        last = node
+    rest = left if left is not None else right
+    if last is None:
+        first = last = rest
+    else:
+        last.next = rest
+    while last.next is not None:
+        last = last.next
+    return first, last
 
-    def traverse(self):
-        if not self.head:
-            return []
-        current_node = self.head
-        nodes = []
-        while True:
-            nodes.append(str(current_node.data))
-            if current_node.next == self.head:
-                break
-            current_node = current_node.next
-        return nodes
-    
-    def loop_3_times(self):
-        if not self.head:
-            return
-        current_node = self.head
-        count = 0
-        while count < 3:
-            print(current_node.data, end=" -> ")
-            if current_node.next == self.head:
-                count += 1
-            current_node = current_node.next
-        print("...")
-    
-    def __str__(self):
-        if not self.head:
-            return "(head) -> (none)"
-        current_node = self.head
-        nodes = []
-        while True:
-            nodes.append(str(current_node.data))
-            if current_node.next == self.head:
-                break
-            current_node = current_node.next
-        return "(head) -> " + " -> ".join(nodes) + " -> (head)"
-  
-class CircularDoublyLinkedListNode:
-    def __init__(self, data):
-        """
-        Initialize the node with data, next pointer, and previous pointer.
-        Args:
-            data: The data to be stored in the node.
-        Raises:
-            ValueError: If the data is None.
-        """
-        self.data = data
-        self.next = None
-        self.prev = None
+def _merge_sort_chain(first, count, sort_key, reverse):
+    """
+    Sort a None-terminated chain by merging runs of width 1, 2, 4, ... in place.
+    Args:
+        first: The first node of the chain.
+        count: The number of nodes in the chain.
+        sort_key: A function mapping a node to its key, or None to compare data.
+        reverse: Whether to sort in descending order.
+    Returns:
+        tuple: The first and last node of the sorted chain.
+    """
+    width = 1
+    last = None
+    while width < count:
+        remaining = first
+        first = last = None
+        while remaining is not None:
+            left = remaining
+            right = _cut_run(left, width)
+            remaining = _cut_run(right, width)
+            run_first, run_last = _merge_runs(left, right, sort_key, reverse)
+            if last is None:
+                first = run_first
+            else:
+                last.next = run_first
+            last = run_last
+        width *= 2
+    return first, last
+
+def _cut_run(node, width):
+    """
+    Detach the first width nodes of a chain from the rest.
+    Args:
+        node: The first node of the chain, or None.
+        width: The number of nodes to keep in the run.
+    Returns:
+        The first node after the run, or None.
+    """
+    for _ in range(width - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
 
+def merge_sorted(*lists, key=None, reverse=False):
+    """
+    Lazily merge lists that are already sorted, using a heap of k cursors.
+    Each item costs O(log k), and ties are taken from earlier lists first.
+    Args:
+        *lists: Sorted lists (or any sorted iterables).
+        key: The key function the lists were sorted with.
+        reverse: Whether the lists are sorted in descending order.
+    Returns:
+        A generator over every item in sorted order.
+    """
+    return merge(*lists, key=key, reverse=reverse)
 
 def main():
     sllwot = SinglyLinkedListWithoutTail()
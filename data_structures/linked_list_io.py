@@ -0,0 +1,99 @@
+from .imports import array, byteorder, BytesIO, pickle, struct
+from .linked_list import DoublyLinkedListWithTail
+
+MAGIC = b"DSLL"
+VERSION = 1
+_HEADER = struct.Struct("<4sBcBQI")
+_OBJECTS = b"\0"
+
+def dump(linked_list, file, typecode=None):
+    """
+    Write a list to a binary file as a header followed by a flat array of its items.
+    With a typecode the items are stored unboxed as an array module array;
+    without one they are stored as a single pickled Python list. Either way
+    the nodes themselves are never pickled, so there is no per-node recursion.
+    Args:
+        linked_list: Any list class from this package that provides from_iterable.
+        file: A binary file object opened for writing.
+        typecode: An array module typecode for numeric items, or None. Defaults
+            to the list's own typecode when it has one (ArrayDoublyLinkedList).
+    Raises:
+        TypeError: If an item does not fit the typecode.
+    """
+    if typecode is None:
+        typecode = getattr(linked_list, "typecode", None)
+    metadata = pickle.dumps((type(linked_list), linked_list._reduce_options()), pickle.HIGHEST_PROTOCOL)
+    if typecode is None:
+        payload = pickle.dumps(list(linked_list), pickle.HIGHEST_PROTOCOL)
+    else:
+        payload = memoryview(array(typecode, linked_list))
+    header = _HEADER.pack(MAGIC, VERSION, (typecode or "\0").encode(), byteorder == "big", len(linked_list), len(metadata))
+    file.write(header)
+    file.write(metadata)
+    file.write(payload)
+
+def dumps(linked_list, typecode=None):
+    """
+    Serialize a list to bytes in the format written by dump.
+    Args:
+        linked_list: The list to serialize.
+        typecode: An array module typecode for numeric items, or None.
+    Returns:
+        bytes: The serialized list.
+    """
+    buffer = BytesIO()
+    dump(linked_list, buffer, typecode)
+    return buffer.getvalue()
+
+def load(file):
+    """
+    Read a list written by dump, rebuilding it in a single pass.
+    Like pickle, this must only be used on trusted files.
+    Args:
+        file: A binary file object opened for reading.
+    Returns:
+        A new list of the class that was dumped.
+    Raises:
+        ValueError: If the file is not in this format or is truncated.
+    """
+    header = file.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValueError("The file is truncated")
+    magic, version, typecode, big_endian, count, metadata_size = _HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("The file is not a serialized linked list")
+    cls, options = pickle.loads(file.read(metadata_size))
+    if typecode == _OBJECTS:
+        items = pickle.load(file)
+    else:
+        items = array(typecode.decode())
+        data = file.read(count * items.itemsize)
+        if len(data) != count * items.itemsize:
+            raise ValueError("The file is truncated")
+        items.frombytes(data)
+        if big_endian != (byteorder == "big"):
+            items.byteswap()
+    if len(items) != count:
+        raise ValueError("The file is truncated")
+    return cls.from_iterable(items, **options)
+
+def loads(data):
+    """
+    Rebuild a list from bytes produced by dumps.
+    Args:
+        data: The serialized list.
+    Returns:
+        A new list of the class that was dumped.
+    Raises:
+        ValueError: If the data is not in this format or is truncated.
+    """
+    return load(BytesIO(data))
+
+def main():
+    dllwt = DoublyLinkedListWithTail.from_iterable(range(100_000))
+    data = dumps(dllwt, typecode="q")
+    copy = loads(data)
+    print(type(copy).__name__, len(data), copy.length(), copy[-1])
+
+if __name__ == "__main__":
+    main()
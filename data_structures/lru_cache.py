@@ -0,0 +1,302 @@
+from .imports import getsizeof, Lock, monotonic, namedtuple, wraps
+from .linked_list import DoublyLinkedListNode, DoublyLinkedListWithTail
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "expirations", "entries", "bytes"])
+
+class _CacheEntry:
+    """The payload of one recency-list node: a key, its value and bookkeeping."""
+    __slots__ = ("key", "value", "size", "expires_at")
+
+    def __init__(self, key, value, size, expires_at):
+        """
+        Initialize the entry.
+        Args:
+            key: The cache key.
+            value: The cached value.
+            size: The number of bytes charged for the value.
+            expires_at: The timer reading after which the entry is stale, or None.
+        """
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+    def __str__(self):
+        """
+        Return a string representation of the entry.
+        Returns:
+            str: The key and value.
+        """
+        return f"{self.key!r}: {self.value!r}"
+
+# -----------------------------
+
+class LRUCache:
+    """
+    A least-recently-used cache made of a dict and a DoublyLinkedListWithTail.
+    The dict maps each key to its node, and the list keeps the nodes from least
+    to most recently used, so get, put and evict are all O(1). The cache can be
+    bounded by entry count, by bytes, or both, and entries can expire after a
+    time to live. All operations are guarded by a lock, so one cache can be
+    shared between threads.
+    """
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None, sizeof=getsizeof, timer=monotonic):
+        """
+        Initialize an empty cache.
+        Args:
+            max_entries: The maximum number of entries, or None for no limit.
+            max_bytes: The maximum total size of the values, or None for no limit.
+            ttl: The default number of seconds an entry stays valid, or None to never expire.
+            sizeof: A function returning the size of a value in bytes. The default,
+                sys.getsizeof, does not follow references inside containers.
+            timer: A function returning the current time in seconds, used for TTLs.
+        Raises:
+            ValueError: If a limit or the TTL is not positive.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("Capacity must be positive")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("Capacity must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._timer = timer
+        self._nodes = {}
+        self._order = DoublyLinkedListWithTail()
+        self._lock = Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _is_expired(self, entry, now):
+        """
+        Check whether an entry has outlived its TTL.
+        Args:
+            entry: The entry to check.
+            now: The current timer reading.
+        Returns:
+            bool: True if the entry is stale.
+        """
+        return entry.expires_at is not None and now >= entry.expires_at
+
+    def _remove(self, node):
+        """
+        Drop a node from both the dict and the recency list.
+        Args:
+            node: The node to remove.
+        """
+        entry = node.data
+        del self._nodes[entry.key]
+        self._order.remove_node(node)
+        self.bytes -= entry.size
+
+    def _evict(self):
+        """Remove least recently used entries until the cache is within its limits."""
+        while (self.max_entries is not None and self._order.size > self.max_entries) or \
+                (self.max_bytes is not None and self.bytes > self.max_bytes):
+            self._remove(self._order.head)
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        """
+        Return the value for key and mark it as most recently used.
+        Args:
+            key: The key to look up.
+            default: The value returned when the key is missing or expired.
+        Returns:
+            The cached value, or default.
+        """
+        with self._lock:
+            node = self._nodes.get(key)
+            if node is not None and self._is_expired(node.data, self._timer()):
+                self._remove(node)
+                self.expirations += 1
+                node = None
+            if node is None:
+                self.misses += 1
+                return default
+            self._order.move_to_end(node)
+            self.hits += 1
+            return node.data.value
+
+    def put(self, key, value, ttl=None):
+        """
+        Store a value, replacing any previous value for the key, and evict as needed.
+        Args:
+            key: The key, which must be hashable.
+            value: The value to cache.
+            ttl: The number of seconds this entry stays valid, overriding the cache default.
+        Raises:
+            ValueError: If the TTL is not positive or the value alone exceeds max_bytes.
+        """
+        if ttl is None:
+            ttl = self.ttl
+        elif ttl <= 0:
+            raise ValueError("TTL must be positive")
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise ValueError("The value is larger than the cache")
+        with self._lock:
+            expires_at = None if ttl is None else self._timer() + ttl
+            node = self._nodes.get(key)
+            if node is not None:
+                entry = node.data
+                self.bytes += size - entry.size
+                entry.value = value
+                entry.size = size
+                entry.expires_at = expires_at
+                self._order.move_to_end(node)
+            else:
+                node = DoublyLinkedListNode(_CacheEntry(key, value, size, expires_at))
+                self._nodes[key] = node
+                self._order.append_node(node)
+                self.bytes += size
+            self._evict()
+
+    def delete(self, key):
+        """
+        Remove the entry for a key.
+        Args:
+            key: The key to remove.
+        Raises:
+            ValueError: If the key is not in the cache.
+        """
+        with self._lock:
+            node = self._nodes.get(key)
+            if node is None:
+                raise ValueError("The key is not in the cache")
+            self._remove(node)
+
+    def expire(self):
+        """
+        Remove every expired entry now, instead of waiting for them to be looked up.
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock:
+            now = self._timer()
+            stale = [node for node in self._nodes.values() if self._is_expired(node.data, now)]
+            for node in stale:
+                self._remove(node)
+            self.expirations += len(stale)
+            return len(stale)
+
+    def clear(self):
+        """Remove every entry; the counters are kept."""
+        with self._lock:
+            self._nodes.clear()
+            self._order = DoublyLinkedListWithTail()
+            self.bytes = 0
+
+    def info(self):
+        """
+        Return the hit, miss, eviction and expiration counters and the current usage.
+        Returns:
+            CacheInfo: A snapshot of the statistics.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.expirations, len(self._nodes), self.bytes)
+
+    def __contains__(self, key):
+        """
+        Check whether a key has an unexpired entry, without changing its recency.
+        Args:
+            key: The key to look for.
+        Returns:
+            bool: True if the key is cached and not expired.
+        """
+        with self._lock:
+            node = self._nodes.get(key)
+            return node is not None and not self._is_expired(node.data, self._timer())
+
+    def __len__(self):
+        """
+        Return the number of entries, including expired ones not yet removed.
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._nodes)
+
+    def __iter__(self):
+        """
+        Iterate over the keys from least to most recently used.
+        Returns:
+            An iterator over a copy of the keys.
+        """
+        with self._lock:
+            return iter([entry.key for entry in self._order])
+
+    def __str__(self):
+        """
+        Return a string representation of the cache, least recently used first.
+        Returns:
+            str: A string representation of the cache.
+        """
+        with self._lock:
+            return "{" + ", ".join(map(str, self._order)) + "}"
+
+_MISSING = object()
+
+def cached(max_entries=128, max_bytes=None, ttl=None, typed=False, sizeof=getsizeof, timer=monotonic):
+    """
+    Decorate a function so its results are kept in an LRUCache.
+    Unlike functools.lru_cache this supports byte limits and TTLs, and the cache
+    is reachable as wrapper.cache for statistics. Arguments must be hashable.
+    Concurrent misses for the same arguments may each call the function, and
+    results larger than max_bytes are returned without being cached.
+    Args:
+        max_entries: The maximum number of cached results, or None for no limit.
+        max_bytes: The maximum total size of the results, or None for no limit.
+        ttl: The number of seconds a result stays valid, or None to never expire.
+        typed: Whether arguments of different types (e.g. 1 and 1.0) are cached separately.
+        sizeof: A function returning the size of a result in bytes.
+        timer: A function returning the current time in seconds.
+    Returns:
+        A decorator that wraps a function with the cache.
+    """
+    def decorator(function):
+        cache = LRUCache(max_entries, max_bytes, ttl, sizeof, timer)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_MISSING,) + tuple(sorted(kwargs.items()))
+            if typed:
+                key += tuple(type(value) for value in args)
+                key += tuple(type(value) for _, value in sorted(kwargs.items()))
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                try:
+                    cache.put(key, result)
+                except ValueError:
+                    pass
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+def main():
+    cache = LRUCache(max_entries=3)
+    for key in "abcd":
+        cache.put(key, ord(key))
+    cache.get("b")
+    print(cache, cache.info())
+
+    @cached(max_entries=32)
+    def fibonacci(n):
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    print(fibonacci(80), fibonacci.cache_info())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+from .imports import array, mmap, os, struct, tempfile
+from .array_linked_list import ArrayDoublyLinkedList, NIL
+
+MAGIC = b"DSML"
+_HEADER = struct.Struct("=4sc3x6q")
+_HEADER_SIZE = 64
+_INDEX_SIZE = 8
+
+class _HeaderField:
+    """An integer attribute stored in the file header instead of the instance."""
+
+    def __init__(self, position):
+        """
+        Initialize the field.
+        Args:
+            position: The index of the field among the header integers.
+        """
+        self.position = position
+
+    def __get__(self, instance, owner):
+        """
+        Read the field from the mapped header.
+        Returns:
+            int: The stored value.
+        """
+        if instance is None:
+            return self
+        return instance._header[self.position]
+
+    def __set__(self, instance, value):
+        """
+        Write the field to the mapped header.
+        Args:
+            value: The new value.
+        """
+        instance._header[self.position] = value
+
+# -----------------------------
+
+class MappedDoublyLinkedList(ArrayDoublyLinkedList):
+    """
+    An ArrayDoublyLinkedList whose slot arrays and bookkeeping live in a memory-mapped file.
+    Opening an existing file maps it without reading or deserializing the
+    nodes; pages are loaded by the operating system as slots are touched, and
+    every change is made in place in the file. The file holds a 64-byte header
+    followed by the data, next and prev arrays, each capacity slots long, and
+    grows by doubling like ArrayDoublyLinkedList. Only numeric typecodes are
+    supported, since Python objects cannot be stored in a file-backed array.
+    """
+    head = _HeaderField(0)
+    tail = _HeaderField(1)
+    size = _HeaderField(2)
+    capacity = _HeaderField(3)
+    _free = _HeaderField(4)
+    _used = _HeaderField(5)
+
+    def __init__(self, path, typecode="q", capacity=16):
+        """
+        Open the list stored at path, creating an empty one if the file does not exist.
+        Args:
+            path: The file that holds the list.
+            typecode: An array module typecode for the data; must match an existing file.
+            capacity: The number of slots to reserve when creating the file.
+        Raises:
+            ValueError: If the typecode is None or does not match the file,
+                the capacity is not positive, or the file is not a mapped list or is truncated.
+        """
+        if typecode is None:
+            raise ValueError("A mapped list needs a numeric typecode")
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.path = path
+        self.typecode = typecode
+        self._itemsize = array(typecode).itemsize
+        try:
+            self._file = open(path, "r+b")
+        except FileNotFoundError:
+            self._file = open(path, "w+b")
+            self._file.write(_HEADER.pack(MAGIC, typecode.encode(), NIL, NIL, 0, capacity, NIL, 0))
+            self._file.truncate(self._file_size(capacity))
+            self._map()
+            self._fill(0, capacity)
+            return
+        header = self._file.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+            self._file.close()
+            raise ValueError("The file is not a mapped linked list")
+        _, stored_typecode, _, _, _, stored_capacity, _, _ = _HEADER.unpack(header)
+        if stored_typecode.decode() != typecode:
+            self._file.close()
+            raise ValueError("The file stores typecode " + stored_typecode.decode())
+        if stored_capacity < 1 or os.fstat(self._file.fileno()).st_size < self._file_size(stored_capacity):
+            self._file.close()
+            raise ValueError("The file is truncated")
+        self._map()
+
+    def _file_size(self, capacity):
+        """
+        Compute the file size needed for the given number of slots.
+        Args:
+            capacity: The number of slots.
+        Returns:
+            int: The size in bytes.
+        """
+        return self._next_offset(capacity) + 2 * capacity * _INDEX_SIZE
+
+    def _next_offset(self, capacity):
+        """
+        Compute where the next array starts, aligned to 8 bytes after the data array.
+        Args:
+            capacity: The number of slots.
+        Returns:
+            int: The byte offset of the next array.
+        """
+        return _HEADER_SIZE + (capacity * self._itemsize + 7) // 8 * 8
+
+    def _map(self):
+        """Map the file and cast the header and slot arrays over it."""
+        self._mmap = mmap(self._file.fileno(), 0)
+        view = memoryview(self._mmap)
+        self._header = view[_HEADER.size - 6 * _INDEX_SIZE:_HEADER.size].cast("q")
+        capacity = self._header[3]
+        next_offset = self._next_offset(capacity)
+        prev_offset = next_offset + capacity * _INDEX_SIZE
+        self._data = view[_HEADER_SIZE:_HEADER_SIZE + capacity * self._itemsize].cast(self.typecode)
+        self._next = view[next_offset:prev_offset].cast("q")
+        self._prev = view[prev_offset:prev_offset + capacity * _INDEX_SIZE].cast("q")
+
+    def _unmap(self):
+        """Release the views and the mapping, which must happen before the file is resized."""
+        for view in (self._header, self._data, self._next, self._prev):
+            view.release()
+        self._mmap.close()
+
+    def _fill(self, start, stop):
+        """
+        Reset the slots in a range to zero data and NIL links.
+        Args:
+            start: The first slot.
+            stop: The slot after the last one.
+        """
+        blank = array("q", [NIL]) * (stop - start)
+        self._next[start:stop] = blank
+        self._prev[start:stop] = blank
+        self._data[start:stop] = array(self.typecode, bytes((stop - start) * self._itemsize))
+
+    def _grow(self, capacity):
+        """
+        Enlarge the file to hold the given number of slots.
+        The next and prev arrays are moved up to their new offsets, prev first
+        because it moves furthest, and the new slots are blanked.
+        Args:
+            capacity: The new number of slots.
+        """
+        old_capacity = self.capacity
+        old_next = self._next_offset(old_capacity)
+        old_prev = old_next + old_capacity * _INDEX_SIZE
+        new_next = self._next_offset(capacity)
+        new_prev = new_next + capacity * _INDEX_SIZE
+        self._unmap()
+        self._file.truncate(self._file_size(capacity))
+        self._mmap = mmap(self._file.fileno(), 0)
+        self._mmap.move(new_prev, old_prev, old_capacity * _INDEX_SIZE)
+        self._mmap.move(new_next, old_next, old_capacity * _INDEX_SIZE)
+        struct.pack_into("=q", self._mmap, _HEADER.size - 3 * _INDEX_SIZE, capacity)
+        self._mmap.close()
+        self._map()
+        self._fill(old_capacity, capacity)
+
+    def _reduce_options(self):
+        """
+        Mapped lists cannot be rebuilt from their items alone.
+        Raises:
+            TypeError: Always; copy the list with ArrayDoublyLinkedList.from_iterable instead.
+        """
+        raise TypeError("A MappedDoublyLinkedList is stored in its file; open it again by path")
+
+    def __reduce__(self):
+        """
+        Pickle the list as a reference to its file, flushing it first.
+        Returns:
+            tuple: The class and the arguments that reopen the file.
+        """
+        self.flush()
+        return type(self), (self.path, self.typecode)
+
+    def flush(self):
+        """Write the changed pages back to the file."""
+        self._mmap.flush()
+
+    def close(self):
+        """Flush the list and close its file; the list cannot be used afterwards."""
+        if self._file.closed:
+            return
+        self.flush()
+        self._unmap()
+        self._file.close()
+
+    def __enter__(self):
+        """
+        Use the list as a context manager that closes it on exit.
+        Returns:
+            MappedDoublyLinkedList: The list itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the list."""
+        self.close()
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "list.bin")
+    with MappedDoublyLinkedList.from_iterable(range(40), path=path) as mdll:
+        mdll.delete_by_key(3)
+        mdll.insert_after(2, 20)
+    with MappedDoublyLinkedList(path) as mdll:
+        print(mdll.length(), mdll.capacity, list(mdll[:6]))
+    os.remove(path)
+
+if __name__ == "__main__":
+    main()
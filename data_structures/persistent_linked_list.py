@@ -0,0 +1,196 @@
+from .imports import islice
+from .linked_list import _SequenceProtocol
+
+class PersistentLinkedListNode:
+    """An immutable cons cell that also records the length of the list it starts."""
+    __slots__ = ("data", "next", "size")
+
+    def __init__(self, data, next_node):
+        """
+        Initialize the cell in front of an existing chain.
+        Args:
+            data: The data to be stored in the cell.
+            next_node: The first cell of the rest of the list, or None.
+        """
+        self.data = data
+        self.next = next_node
+        self.size = 1 if next_node is None else next_node.size + 1
+
+# -----------------------------
+
+class PersistentLinkedList(_SequenceProtocol):
+    """
+    An immutable Singly Linked List whose versions share structure.
+    prepend, tail and drop return new lists that reuse the existing cells,
+    so keeping an old version around (a snapshot) costs O(1) time and memory;
+    only the cells a new version adds are allocated. Every cell records the
+    length of the list it starts, so length() is O(1).
+    """
+    __slots__ = ("head",)
+
+    def __init__(self, head=None):
+        """
+        Wrap a chain of cells; with no argument, create the empty list.
+        Args:
+            head: The first cell of an existing chain, or None.
+        """
+        object.__setattr__(self, "head", head)
+
+    def __setattr__(self, name, value):
+        """
+        Refuse attribute assignment, since lists are immutable.
+        Raises:
+            AttributeError: Always.
+        """
+        raise AttributeError("PersistentLinkedList is immutable")
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Build a list from an iterable.
+        The items are buffered so the chain can be built back to front.
+        Args:
+            iterable: The items to store, in order.
+        Returns:
+            PersistentLinkedList: A new list holding the items.
+        """
+        head = None
+        for data in reversed(list(iterable)):
+            head = PersistentLinkedListNode(data, head)
+        return cls(head)
+
+    @property
+    def size(self):
+        """
+        The number of items in the list, read from the first cell in O(1).
+        Returns:
+            int: The number of items.
+        """
+        return 0 if self.head is None else self.head.size
+
+    def first(self):
+        """
+        Return the first item.
+        Returns:
+            The data of the first cell.
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if self.head is None:
+            raise ValueError("The list is empty")
+        return self.head.data
+
+    def prepend(self, data):
+        """
+        Return a new list with data in front of this one, in O(1).
+        Args:
+            data: The data to be stored in the new cell.
+        Returns:
+            PersistentLinkedList: The new version; this list is unchanged.
+        """
+        return PersistentLinkedList(PersistentLinkedListNode(data, self.head))
+
+    def tail(self):
+        """
+        Return the list without its first item, in O(1).
+        Returns:
+            PersistentLinkedList: A list sharing every cell after the first.
+        Raises:
+            ValueError: If the list is empty.
+        """
+        if self.head is None:
+            raise ValueError("The list is empty")
+        return PersistentLinkedList(self.head.next)
+
+    def drop(self, count):
+        """
+        Return the list without its first count items, in O(count).
+        Args:
+            count: The number of items to skip; larger counts give the empty list.
+        Returns:
+            PersistentLinkedList: A list sharing the remaining cells.
+        Raises:
+            ValueError: If count is negative.
+        """
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+        current_node = self.head
+        for _ in range(count):
+            if current_node is None:
+                break
+            current_node = current_node.next
+        return PersistentLinkedList(current_node)
+
+    def take(self, count):
+        """
+        Return a list of the first count items, in O(count).
+        A prefix cannot share cells, because each cell points to the rest of
+        this list, so the taken cells are copied; taking everything returns self.
+        Args:
+            count: The number of items to keep.
+        Returns:
+            PersistentLinkedList: A list of at most count items.
+        Raises:
+            ValueError: If count is negative.
+        """
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+        if count >= self.size:
+            return self
+        return PersistentLinkedList.from_iterable(islice(self, count))
+
+    def __iter__(self):
+        """
+        Iterate over the data from the head.
+        Yields:
+            The data of each cell in the list.
+        """
+        current_node = self.head
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.next
+
+    def __eq__(self, other):
+        """
+        Compare two lists item by item, stopping early at a shared cell.
+        Args:
+            other: The object to compare with.
+        Returns:
+            bool: True if other is a PersistentLinkedList holding equal items.
+        """
+        if not isinstance(other, PersistentLinkedList):
+            return NotImplemented
+        if self.size != other.size:
+            return False
+        left, right = self.head, other.head
+        while left is not right:
+            if left.data != right.data:
+                return False
+            left, right = left.next, right.next
+        return True
+
+    def __hash__(self):
+        """
+        Hash the items, so lists of hashable items can be used as keys.
+        Returns:
+            int: The hash of the items as a tuple.
+        """
+        return hash(tuple(self))
+
+    def __str__(self):
+        """
+        Return a string representation of the list, in the same format as SinglyLinkedListWithTail.
+        Returns:
+            str: A string representation of the list.
+        """
+        return "(head) -> " + " -> ".join(map(str, self)) + " -> (tail)"
+
+def main():
+    base = PersistentLinkedList.from_iterable(range(5))
+    snapshot = base
+    changed = base.tail().prepend(-1)
+    print(snapshot, changed, changed.drop(2), changed.take(2), changed.length())
+    print(changed.drop(1).head is base.drop(1).head)
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,30 @@
-from .imports import deque, Queue, PriorityQueue
+from .imports import add, deque, Lock, monotonic, nullcontext, Queue, sleep
+from .async_buffer import _AsyncBuffer
+from .stack import AggregateStack
+from .buffers import buffer_view, new_buffer, write
 
 class QueueUsingList:
     """
     A queue implementation using a list
+    Dequeued slots are not removed from the front of the list, which would
+    shift every remaining item. Instead a head index moves past them, and the
+    dead prefix is deleted in one slice once it is at least compact_threshold
+    items long and at least as long as the live part. Each item is then moved
+    at most a constant number of times on average, so dequeue is amortized O(1).
     """
-    def __init__(self):
+    def __init__(self, compact_threshold=1024):
         """
         Initialize the queue
+        Args:
+            compact_threshold: The dead prefix length below which the list is never compacted
+        Raises:
+            ValueError: If the threshold is not positive
         """
+        if compact_threshold < 1:
+            raise ValueError("Compaction threshold must be positive")
         self.queue = []
+        self.head = 0
+        self.compact_threshold = compact_threshold
     
     def enqueue(self, item):
         """
@@ -22,6 +38,27 @@ class QueueUsingList:
             raise ValueError("Cannot enqueue None to queue")
         self.queue.append(item)
     
+    def enqueue_many(self, items):
+        """
+        Add several items to the back of the queue in one call
+        Args:
+            items: The items to add, in order
+        Raises:
+            ValueError: If an item is None; nothing is added then
+        """
+        items = list(items)
+        if any(item is None for item in items):
+            raise ValueError("Cannot enqueue None to queue")
+        self.queue.extend(items)
+    
+    def _compact(self):
+        """
+        Delete the dead prefix if it is long enough to pay for moving the live items
+        """
+        if self.head >= self.compact_threshold and 2 * self.head >= len(self.queue):
+            del self.queue[:self.head]
+            self.head = 0
+    
     def dequeue(self):
         """
         Remove and return the item at the front of the queue
@@ -32,7 +69,30 @@ class QueueUsingList:
         """
         if self.is_empty():
             raise ValueError("Cannot dequeue from an empty queue")
-        return self.queue.pop(0)
+        item = self.queue[self.head]
+        self.queue[self.head] = None
+        self.head += 1
+        self._compact()
+        return item
+    
+    def dequeue_many(self, n):
+        """
+        Remove n items from the front of the queue in one call
+        Args:
+            n: The number of items to remove
+        Returns:
+            A list of the removed items, the former front first
+        Raises:
+            ValueError: If n is negative or larger than the queue
+        """
+        if n < 0 or n > self.size():
+            raise ValueError("Cannot dequeue more items than the queue holds")
+        stop = self.head + n
+        items = self.queue[self.head:stop]
+        self.queue[self.head:stop] = [None] * n
+        self.head = stop
+        self._compact()
+        return items
     
     def peek(self):
         """
@@ -44,7 +104,7 @@ class QueueUsingList:
         """
         if self.is_empty():
             raise ValueError("Cannot peek from an empty queue")
-        return self.queue[0]
+        return self.queue[self.head]
     
     def is_empty(self):
         """
@@ -52,7 +112,7 @@ class QueueUsingList:
         Returns:
             True if the queue is empty, False otherwise
         """
-        return self.size == 0
+        return self.size() == 0
     
     def size(self):
         """
@@ -60,10 +120,10 @@ class QueueUsingList:
         Returns:
             The size of the queue
         """
-        return len(self.queue)
+        return len(self.queue) - self.head
     
     def __str__(self):
-        return str(self.queue)
+        return str(self.queue[self.head:])
 
 # -----------------------------
 
@@ -89,6 +149,19 @@ class QueueUsingDeque:
             raise ValueError("Cannot enqueue None to queue")
         self.queue.append(item)
     
+    def enqueue_many(self, items):
+        """
+        Add several items to the back of the queue in one call
+        Args:
+            items: The items to add, in order
+        Raises:
+            ValueError: If an item is None; nothing is added then
+        """
+        items = list(items)
+        if any(item is None for item in items):
+            raise ValueError("Cannot enqueue None to queue")
+        self.queue.extend(items)
+    
     def dequeue(self):
         """
         Remove and return the item at the front of the queue
@@ -101,6 +174,21 @@ class QueueUsingDeque:
             raise ValueError("Cannot dequeue from an empty queue")
         return self.queue.popleft()
 
+    def dequeue_many(self, n):
+        """
+        Remove n items from the front of the queue in one call
+        Args:
+            n: The number of items to remove
+        Returns:
+            A list of the removed items, the former front first
+        Raises:
+            ValueError: If n is negative or larger than the queue
+        """
+        if n < 0 or n > len(self.queue):
+            raise ValueError("Cannot dequeue more items than the queue holds")
+        popleft = self.queue.popleft
+        return [popleft() for _ in range(n)]
+
     def peek(self):
         """
         Show the item at the front of the queue without removing it
@@ -119,7 +207,7 @@ class QueueUsingDeque:
         Returns:
             True if the queue is empty, False otherwise
         """
-        return self.size == 0
+        return self.size() == 0
     
     def size(self):
         """
@@ -156,6 +244,24 @@ class QueueUsingQueue:
             raise ValueError("Cannot enqueue None to queue")
         self.queue.put(item)
     
+    def enqueue_many(self, items):
+        """
+        Add several items while holding the queue's lock once
+        Args:
+            items: The items to add, in order
+        Raises:
+            ValueError: If an item is None; nothing is added then
+        """
+        items = list(items)
+        if any(item is None for item in items):
+            raise ValueError("Cannot enqueue None to queue")
+        if not items:
+            return
+        with self.queue.mutex:
+            self.queue.queue.extend(items)
+            self.queue.unfinished_tasks += len(items)
+            self.queue.not_empty.notify(len(items))
+    
     def dequeue(self):
         """
         Remove and return the item at the front of the queue
@@ -168,6 +274,25 @@ class QueueUsingQueue:
             raise ValueError("Cannot dequeue from an empty queue")
         return self.queue.get()
 
+    def dequeue_many(self, n):
+        """
+        Remove n items while holding the queue's lock once
+        Args:
+            n: The number of items to remove
+        Returns:
+            A list of the removed items, the former front first
+        Raises:
+            ValueError: If n is negative or larger than the queue
+        """
+        with self.queue.mutex:
+            if n < 0 or n > len(self.queue.queue):
+                raise ValueError("Cannot dequeue more items than the queue holds")
+            popleft = self.queue.queue.popleft
+            items = [popleft() for _ in range(n)]
+            if n:
+                self.queue.not_full.notify(n)
+        return items
+
     def peek(self):
         """
         Show the item at the front of the queue without removing it
@@ -203,36 +328,144 @@ class QueueUsingQueue:
 
 class CircularQueue:
     """
-    A circular queue implementation using a list
+    A circular queue implementation using a list or a typed buffer
+    By default items are Python objects in a list and enqueueing to a full
+    queue raises. With growable=True a full queue instead doubles its storage,
+    copying the items in order so the new buffer starts unwrapped at slot 0.
+    With a dtype the items are unboxed numbers in an array.array or NumPy
+    buffer, and dequeue_many returns zero-copy views instead of a list.
     """
-    def __init__(self, capacity):
+    def __init__(self, capacity, growable=False, dtype=None, backend="array"):
         """
         Initialize the circular queue
         Args:
             capacity: The capacity of the circular queue
+            growable: Whether a full queue doubles its capacity instead of raising
+            dtype: An array module typecode such as "d" for typed storage, or None for objects
+            backend: "array" for array.array storage or "numpy" for a NumPy buffer; used with dtype
+        Raises:
+            ValueError: If the capacity is not positive or the backend is unknown
+            ImportError: If the numpy backend is requested but NumPy is not installed
         """
-        self.queue = [None] * capacity
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.growable = growable
+        self.dtype = dtype
+        self.backend = backend
+        self.queue = self._new_storage(capacity)
         self.capacity = capacity
         self.front = 0
         self.rear = 0
         self.size = 0
 
+    def _new_storage(self, capacity):
+        """
+        Allocate empty storage of the queue's kind
+        Args:
+            capacity: The number of slots
+        Returns:
+            A list of None slots, or a zero-filled typed buffer
+        """
+        if self.dtype is None:
+            return [None] * capacity
+        return new_buffer(self.dtype, capacity, self.backend)
+
+    def _spans(self, n):
+        """
+        Locate the first n items, which occupy at most two runs of slots
+        Args:
+            n: The number of items from the front
+        Returns:
+            A list of (start, stop) slot ranges in queue order
+        """
+        first = min(n, self.capacity - self.front)
+        spans = [(self.front, self.front + first)]
+        if n > first:
+            spans.append((0, n - first))
+        return spans
+
+    def _resize(self, capacity):
+        """
+        Move the items in order to new storage starting at slot 0
+        Views returned earlier by dequeue_many keep pointing at the old storage.
+        Args:
+            capacity: The new number of slots
+        """
+        storage = self._new_storage(capacity)
+        position = 0
+        for start, stop in self._spans(self.size):
+            if self.dtype is None:
+                storage[position:position + stop - start] = self.queue[start:stop]
+            else:
+                write(storage, position, buffer_view(self.queue, start, stop))
+            position += stop - start
+        self.queue = storage
+        self.capacity = capacity
+        self.front = 0
+        self.rear = self.size % capacity
+
+    def _reserve(self, extra):
+        """
+        Make room for extra more items, growing the storage if the queue is growable
+        Args:
+            extra: The number of items about to be enqueued
+        Raises:
+            ValueError: If the items do not fit and the queue cannot grow
+        """
+        needed = self.size + extra
+        if needed <= self.capacity:
+            return
+        if not self.growable:
+            if extra == 1:
+                raise ValueError("Cannot enqueue to a full queue")
+            raise ValueError("Cannot enqueue more items than the queue has room for")
+        self._resize(max(needed, 2 * self.capacity))
+
     def enqueue(self, item):
         """
         Add an item to the queue
         Args:
             item: The item to add to the queue
         Raises:
-            ValueError: If the item is None
+            ValueError: If the item is None, or the queue is full and cannot grow
+            TypeError: If the item does not fit the dtype
         """
         if item is None:
             raise ValueError("Cannot enqueue None to queue")
         if self.is_full():
-            raise ValueError("Cannot enqueue to a full queue")
+            self._reserve(1)
         self.queue[self.rear] = item
         self.rear = (self.rear + 1) % self.capacity
         self.size += 1
     
+    def enqueue_many(self, items):
+        """
+        Add several items with at most two slice assignments
+        With a dtype, arrays, memoryviews and ndarrays of the same type are copied as raw memory.
+        Args:
+            items: The items to add, in order
+        Raises:
+            ValueError: If an item is None or the items do not fit; nothing is added then
+            TypeError: If an item does not fit the dtype
+        """
+        if self.dtype is None:
+            items = list(items)
+            if any(item is None for item in items):
+                raise ValueError("Cannot enqueue None to queue")
+        elif not hasattr(items, "__len__"):
+            items = list(items)
+        count = len(items)
+        self._reserve(count)
+        first = min(count, self.capacity - self.rear)
+        if self.dtype is None:
+            self.queue[self.rear:self.rear + first] = items[:first]
+            self.queue[:count - first] = items[first:]
+        else:
+            write(self.queue, self.rear, items[:first])
+            write(self.queue, 0, items[first:])
+        self.rear = (self.rear + count) % self.capacity
+        self.size += count
+    
     def dequeue(self):
         """
         Remove and return the item at the front of the queue
@@ -244,11 +477,41 @@ class CircularQueue:
         if self.is_empty():
             raise ValueError("Cannot dequeue from an empty queue")
         item = self.queue[self.front]
-        self.queue[self.front] = None
+        if self.dtype is None:
+            self.queue[self.front] = None
         self.front = (self.front + 1) % self.capacity
         self.size -= 1
         return item
     
+    def dequeue_many(self, n):
+        """
+        Remove n items from the front with at most two slice reads
+        Without a dtype the items are returned as a list and their slots are
+        cleared. With a dtype nothing is copied: the result is a tuple of at
+        most two memoryviews (array backend) or ndarray views (numpy backend)
+        of the buffer, in queue order. Later enqueues overwrite the slots they
+        show; copy them (e.g. with tolist() or copy()) to keep the values.
+        Args:
+            n: The number of items to remove
+        Returns:
+            A list of the removed items, or a tuple of views of them, the former front first
+        Raises:
+            ValueError: If n is negative or larger than the queue
+        """
+        if n < 0 or n > self.size:
+            raise ValueError("Cannot dequeue more items than the queue holds")
+        spans = self._spans(n) if n else []
+        if self.dtype is None:
+            items = []
+            for start, stop in spans:
+                items += self.queue[start:stop]
+                self.queue[start:stop] = [None] * (stop - start)
+        else:
+            items = tuple(buffer_view(self.queue, start, stop) for start, stop in spans)
+        self.front = (self.front + n) % self.capacity
+        self.size -= n
+        return items
+    
     def peek(self):
         """
         Peek at the item at the front of the queue
@@ -277,15 +540,711 @@ class CircularQueue:
         """
         return self.size == self.capacity
     
+    def __len__(self):
+        """
+        Get the size of the queue
+        Returns:
+            The size of the queue
+        """
+        return self.size
+
     def __str__(self):
-        return str(self.queue)
-    
+        items = []
+        for start, stop in self._spans(self.size):
+            if self.dtype is None:
+                items += self.queue[start:stop]
+            else:
+                items += buffer_view(self.queue, start, stop).tolist()
+        return str(items)
+
+# -----------------------------
+
+class SPSCRingBuffer:
+    """
+    A ring buffer that passes items from exactly one producer thread to exactly one consumer thread
+    Like CircularQueue it stores items in a fixed list of slots, but instead of
+    a shared size it keeps two ever-increasing counters: tail, written only by
+    the producer, and head, written only by the consumer. The producer fills a
+    slot before publishing the new tail and the consumer clears a slot before
+    publishing the new head, so neither side needs a lock; this relies on
+    CPython storing attributes and list slots atomically. A side only waits
+    when the buffer is full (producer) or empty (consumer): it first yields the
+    GIL spin times, then sleeps with exponential backoff up to max_sleep.
+    Using more than one producer or consumer thread corrupts the buffer.
+    """
+    def __init__(self, capacity, spin=100, max_sleep=0.001):
+        """
+        Initialize an empty, open buffer
+        Args:
+            capacity: The number of slots
+            spin: How many times a blocked call yields before it starts sleeping
+            max_sleep: The longest single sleep, in seconds, of a blocked call
+        Raises:
+            ValueError: If the capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.queue = [None] * capacity
+        self.capacity = capacity
+        self.head = 0
+        self.tail = 0
+        self.spin = spin
+        self.max_sleep = max_sleep
+        self.closed = False
+
+    def _has_room(self):
+        return self.tail - self.head < self.capacity
+
+    def _readable(self):
+        return self.tail != self.head or self.closed
+
+    def _wait(self, ready, timeout):
+        """
+        Wait until ready() holds, yielding first and then sleeping with backoff
+        Args:
+            ready: A function returning True once the caller can proceed
+            timeout: The maximum number of seconds to wait, or None to wait forever
+        Returns:
+            True if ready() holds, False if the timeout expired first
+        """
+        for _ in range(self.spin):
+            if ready():
+                return True
+            sleep(0)
+        deadline = None if timeout is None else monotonic() + timeout
+        delay = 1e-6
+        while not ready():
+            if deadline is not None and monotonic() >= deadline:
+                return False
+            sleep(delay)
+            delay = min(2 * delay, self.max_sleep)
+        return True
+
+    def enqueue(self, item, timeout=None):
+        """
+        Add an item, waiting while the buffer is full; call only from the producer thread
+        Args:
+            item: The item to add to the buffer
+            timeout: The maximum number of seconds to wait, or None to wait forever
+        Raises:
+            ValueError: If the item is None, the buffer is closed or the timeout expires
+        """
+        if item is None:
+            raise ValueError("Cannot enqueue None to queue")
+        if self.closed:
+            raise ValueError("Cannot enqueue to a closed queue")
+        tail = self.tail
+        if tail - self.head == self.capacity and not self._wait(self._has_room, timeout):
+            raise ValueError("Timed out waiting for room")
+        self.queue[tail % self.capacity] = item
+        self.tail = tail + 1
+
+    def try_enqueue(self, item):
+        """
+        Add an item without waiting; call only from the producer thread
+        Args:
+            item: The item to add to the buffer
+        Raises:
+            ValueError: If the item is None, or the buffer is closed or full
+        """
+        if item is None:
+            raise ValueError("Cannot enqueue None to queue")
+        if self.closed:
+            raise ValueError("Cannot enqueue to a closed queue")
+        tail = self.tail
+        if tail - self.head == self.capacity:
+            raise ValueError("Cannot enqueue to a full queue")
+        self.queue[tail % self.capacity] = item
+        self.tail = tail + 1
+
+    def enqueue_many(self, items, timeout=None):
+        """
+        Add several items with slice assignments, waiting for room as needed; call only from the producer thread
+        Each time room appears, as many items as fit are published at once.
+        Args:
+            items: The items to add, in order
+            timeout: The maximum number of seconds to wait for room each time, or None
+        Raises:
+            ValueError: If an item is None or the buffer is closed, in which case
+                nothing is added, or if the timeout expires, in which case the
+                items added before it stay in the buffer
+        """
+        items = list(items)
+        if any(item is None for item in items):
+            raise ValueError("Cannot enqueue None to queue")
+        if self.closed:
+            raise ValueError("Cannot enqueue to a closed queue")
+        written = 0
+        while written < len(items):
+            if not self._has_room() and not self._wait(self._has_room, timeout):
+                raise ValueError("Timed out waiting for room")
+            tail = self.tail
+            count = min(len(items) - written, self.capacity - (tail - self.head))
+            start = tail % self.capacity
+            first = min(count, self.capacity - start)
+            self.queue[start:start + first] = items[written:written + first]
+            self.queue[:count - first] = items[written + first:written + count]
+            written += count
+            self.tail = tail + count
+
+    def dequeue(self, timeout=None):
+        """
+        Remove and return the oldest item, waiting while the buffer is empty; call only from the consumer thread
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait forever
+        Returns:
+            The oldest item
+        Raises:
+            ValueError: If the timeout expires, or the buffer is closed and empty
+        """
+        head = self.head
+        if head == self.tail:
+            if not self._wait(self._readable, timeout):
+                raise ValueError("Timed out waiting for an item")
+            if head == self.tail:
+                raise ValueError("Cannot dequeue from a closed, empty queue")
+        slot = head % self.capacity
+        item = self.queue[slot]
+        self.queue[slot] = None
+        self.head = head + 1
+        return item
+
+    def try_dequeue(self):
+        """
+        Remove and return the oldest item without waiting; call only from the consumer thread
+        Returns:
+            The oldest item, or None if the buffer is empty
+        """
+        head = self.head
+        if head == self.tail:
+            return None
+        slot = head % self.capacity
+        item = self.queue[slot]
+        self.queue[slot] = None
+        self.head = head + 1
+        return item
+
+    def dequeue_many(self, max_items):
+        """
+        Remove up to max_items with at most two slice reads, without waiting; call only from the consumer thread
+        Args:
+            max_items: The maximum number of items to remove
+        Returns:
+            A list of the removed items, the oldest first
+        Raises:
+            ValueError: If max_items is negative
+        """
+        if max_items < 0:
+            raise ValueError("Cannot dequeue a negative number of items")
+        head = self.head
+        count = min(max_items, self.tail - head)
+        start = head % self.capacity
+        first = min(count, self.capacity - start)
+        items = self.queue[start:start + first] + self.queue[:count - first]
+        self.queue[start:start + first] = [None] * first
+        self.queue[:count - first] = [None] * (count - first)
+        self.head = head + count
+        return items
+
+    def close(self):
+        """
+        Refuse further enqueues and let a waiting consumer finish; call only from the producer thread
+        Items already in the buffer can still be dequeued.
+        """
+        self.closed = True
+
+    def is_empty(self):
+        """
+        Check if the buffer is empty
+        Returns:
+            True if the buffer is empty, False otherwise
+        """
+        return self.tail == self.head
+
+    def is_full(self):
+        """
+        Check if the buffer is full
+        Returns:
+            True if the buffer is full, False otherwise
+        """
+        return self.tail - self.head == self.capacity
+
+    def size(self):
+        """
+        Get the number of items; only a snapshot while the other thread is running
+        Returns:
+            The number of items in the buffer
+        """
+        return self.tail - self.head
+
+    def __len__(self):
+        """
+        Get the number of items; only a snapshot while the other thread is running
+        Returns:
+            The number of items in the buffer
+        """
+        return self.tail - self.head
+
+    def __str__(self):
+        head, tail = self.head, self.tail
+        return str([self.queue[position % self.capacity] for position in range(head, tail)])
+
+# -----------------------------
+
+class _FrontAggregateStack(AggregateStack):
+    """An AggregateStack that folds each new item in front of the items below it"""
+
+    def _combine(self, below, item):
+        return self.function(item, below)
+
+# -----------------------------
+
+class AggregateQueue:
+    """
+    A queue that keeps the min, max and a running aggregate of its items
+    Items are enqueued onto a back stack and dequeued from a front stack; when
+    the front stack runs out the back stack is poured into it. Both stacks are
+    AggregateStacks, so min(), max() and aggregate() combine two stored values
+    in O(1), and enqueue and dequeue are amortized O(1). The aggregate function
+    must be associative; it is applied front to back and need not be commutative.
+    Items must be mutually comparable unless track_extrema is False, in which
+    case min() and max() are unavailable.
+    """
+    def __init__(self, function=add, track_extrema=True):
+        """
+        Initialize the queue
+        Args:
+            function: An associative function of two arguments, applied front to back
+            track_extrema: Whether to keep the min and max, which requires comparable items
+        """
+        self.function = function
+        self.track_extrema = track_extrema
+        self._front = _FrontAggregateStack(function, track_extrema)
+        self._back = AggregateStack(function, track_extrema)
+
+    def enqueue(self, item):
+        """
+        Add an item to the queue
+        Args:
+            item: The item to add to the queue
+        Raises:
+            ValueError: If the item is None
+        """
+        if item is None:
+            raise ValueError("Cannot enqueue None to queue")
+        self._back.push(item)
+
+    def _refill(self):
+        """
+        Move every item from the back stack to the front stack if the front stack is empty
+        """
+        if self._front.is_empty():
+            while not self._back.is_empty():
+                self._front.push(self._back.pop())
+
+    def dequeue(self):
+        """
+        Remove and return the item at the front of the queue
+        Returns:
+            The item at the front of the queue
+        Raises:
+            ValueError: If the queue is empty
+        """
+        if self.is_empty():
+            raise ValueError("Cannot dequeue from an empty queue")
+        self._refill()
+        return self._front.pop()
+
+    def peek(self):
+        """
+        Peek at the item at the front of the queue
+        Returns:
+            The item at the front of the queue
+        Raises:
+            ValueError: If the queue is empty
+        """
+        if self.is_empty():
+            raise ValueError("Cannot peek from an empty queue")
+        self._refill()
+        return self._front.peek()
+
+    def _combined(self, front_value, back_value, combine):
+        """
+        Merge the values of the two stacks, skipping an empty stack
+        Args:
+            front_value: A function returning the front stack's value
+            back_value: A function returning the back stack's value
+            combine: A function merging the front value with the back value
+        Returns:
+            The merged value
+        Raises:
+            ValueError: If the queue is empty
+        """
+        if self.is_empty():
+            raise ValueError("Cannot aggregate an empty queue")
+        if self._back.is_empty():
+            return front_value()
+        if self._front.is_empty():
+            return back_value()
+        return combine(front_value(), back_value())
+
+    def min(self):
+        """
+        Get the smallest item in the queue in O(1)
+        Returns:
+            The smallest item
+        Raises:
+            ValueError: If the queue is empty or does not track extrema
+        """
+        if not self.track_extrema:
+            raise ValueError("Queue was created with track_extrema=False")
+        return self._combined(self._front.min, self._back.min, min)
+
+    def max(self):
+        """
+        Get the largest item in the queue in O(1)
+        Returns:
+            The largest item
+        Raises:
+            ValueError: If the queue is empty or does not track extrema
+        """
+        if not self.track_extrema:
+            raise ValueError("Queue was created with track_extrema=False")
+        return self._combined(self._front.max, self._back.max, max)
+
+    def aggregate(self):
+        """
+        Get the function folded over every item, front to back, in O(1)
+        Returns:
+            The aggregate of the items
+        Raises:
+            ValueError: If the queue is empty
+        """
+        return self._combined(self._front.aggregate, self._back.aggregate, self.function)
+
+    def is_empty(self):
+        """
+        Check if the queue is empty
+        Returns:
+            True if the queue is empty, False otherwise
+        """
+        return self._front.is_empty() and self._back.is_empty()
+
+    def size(self):
+        """
+        Get the size of the queue
+        Returns:
+            The size of the queue
+        """
+        return self._front.size() + self._back.size()
+
+    def __str__(self):
+        return str(self._front.stack[::-1] + self._back.stack)
+
+# -----------------------------
+
+class AsyncQueue(_AsyncBuffer):
+    """
+    An asyncio queue whose dequeue waits while it is empty and whose enqueue waits while it is full
+    Waiting coroutines are woken in arrival order, and cancelling a waiting
+    enqueue or dequeue is safe. Use it from a single event loop; it is not thread-safe.
+    """
+    _none_error = "Cannot enqueue None to queue"
+    _full_error = "Cannot enqueue to a full queue"
+
+    def __init__(self, capacity=None):
+        """
+        Initialize the queue
+        Args:
+            capacity: The maximum number of items, or None for no limit
+        Raises:
+            ValueError: If the capacity is not positive
+        """
+        super().__init__(capacity, deque.popleft)
+
+    async def enqueue(self, item):
+        """
+        Add an item to the queue, waiting while the queue is full
+        Args:
+            item: The item to add to the queue
+        Raises:
+            ValueError: If the item is None
+        """
+        await self._add(item)
+
+    def try_enqueue(self, item):
+        """
+        Add an item to the queue without waiting
+        Args:
+            item: The item to add to the queue
+        Raises:
+            ValueError: If the item is None or the queue is full
+        """
+        self._add_nowait(item)
+
+    async def dequeue(self):
+        """
+        Remove and return the item at the front of the queue, waiting while the queue is empty
+        Returns:
+            The item at the front of the queue
+        """
+        return await self._remove()
+
+    def try_dequeue(self):
+        """
+        Remove and return the item at the front of the queue without waiting
+        Returns:
+            The item at the front of the queue, or None if the queue is empty
+        """
+        return self._remove_nowait()
+
+    def peek(self):
+        """
+        Peek at the item at the front of the queue
+        Returns:
+            The item at the front of the queue
+        Raises:
+            ValueError: If the queue is empty
+        """
+        if not self.items:
+            raise ValueError("Cannot peek from an empty queue")
+        return self.items[0]
+
+# -----------------------------
+
+class IndexedPriorityQueue:
+    """
+    A priority queue whose items can be reprioritized or removed in place
+    Items sit in a binary min-heap of [priority, sequence, item] entries, and
+    a dict maps each item to its entry's index, so an item is found in O(1)
+    and moved to its new place in O(log n) instead of being pushed again and
+    skipped later. Lower priorities are dequeued first; the sequence number
+    makes items of equal priority leave in the order they were enqueued (or
+    last reprioritized) and means items themselves are never compared. Items
+    must be hashable and unique. By default every operation takes a lock;
+    with thread_safe=False no lock is taken, for single-threaded use.
+    """
+    def __init__(self, thread_safe=True):
+        """
+        Initialize the queue
+        Args:
+            thread_safe: Whether operations take a lock, so several threads can share the queue
+        """
+        self.heap = []
+        self.positions = {}
+        self._sequence = 0
+        self._lock = Lock() if thread_safe else nullcontext()
+
+    def _sift_up(self, index):
+        """
+        Move an entry towards the root past every larger parent
+        The entry is held aside while parents move down into the hole, so
+        each level costs one list write and one dict write instead of a swap.
+        Args:
+            index: The entry's position in the heap
+        """
+        heap, positions = self.heap, self.positions
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            above = heap[parent]
+            if not entry < above:
+                break
+            heap[index] = above
+            positions[above[2]] = index
+            index = parent
+        heap[index] = entry
+        positions[entry[2]] = index
+
+    def _sift_down(self, index):
+        """
+        Move an entry towards the leaves past every smaller child
+        Args:
+            index: The entry's position in the heap
+        """
+        heap, positions = self.heap, self.positions
+        size = len(heap)
+        entry = heap[index]
+        child = 2 * index + 1
+        while child < size:
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            below = heap[child]
+            if not below < entry:
+                break
+            heap[index] = below
+            positions[below[2]] = index
+            index = child
+            child = 2 * index + 1
+        heap[index] = entry
+        positions[entry[2]] = index
+
+    def _next_sequence(self):
+        self._sequence += 1
+        return self._sequence
+
+    def _position(self, item):
+        """
+        Find an item's place in the heap
+        Args:
+            item: The item to look up
+        Returns:
+            The index of the item's entry
+        Raises:
+            ValueError: If the item is not in the queue
+        """
+        try:
+            return self.positions[item]
+        except KeyError:
+            raise ValueError("The item is not in the queue") from None
+
+    def _delete(self, index):
+        """
+        Remove the entry at a position by moving the last entry into its place
+        Args:
+            index: The position to empty
+        Returns:
+            The removed entry
+        """
+        heap = self.heap
+        entry = heap[index]
+        del self.positions[entry[2]]
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            self._sift_down(index)
+            self._sift_up(index)
+        return entry
+
+    def enqueue(self, item, priority):
+        """
+        Add an item with a priority in O(log n)
+        Args:
+            item: The item to add to the queue
+            priority: The item's priority; lower priorities are dequeued first
+        Raises:
+            ValueError: If the item is None or already in the queue
+        """
+        if item is None:
+            raise ValueError("Cannot enqueue None to queue")
+        with self._lock:
+            if item in self.positions:
+                raise ValueError("The item is already in the queue")
+            self.positions[item] = len(self.heap)
+            self.heap.append([priority, self._next_sequence(), item])
+            self._sift_up(len(self.heap) - 1)
+
+    def dequeue(self):
+        """
+        Remove and return the item with the lowest priority in O(log n)
+        Returns:
+            The item with the lowest priority, the earliest enqueued among equals
+        Raises:
+            ValueError: If the queue is empty
+        """
+        with self._lock:
+            if not self.heap:
+                raise ValueError("Cannot dequeue from an empty queue")
+            return self._delete(0)[2]
+
+    def peek(self):
+        """
+        Peek at the item with the lowest priority in O(1)
+        Returns:
+            The item that dequeue would return
+        Raises:
+            ValueError: If the queue is empty
+        """
+        with self._lock:
+            if not self.heap:
+                raise ValueError("Cannot peek from an empty queue")
+            return self.heap[0][2]
+
+    def priority(self, item):
+        """
+        Get an item's priority in O(1)
+        Args:
+            item: The item to look up
+        Returns:
+            The item's current priority
+        Raises:
+            ValueError: If the item is not in the queue
+        """
+        with self._lock:
+            return self.heap[self._position(item)][0]
+
+    def update_priority(self, item, priority):
+        """
+        Change an item's priority in O(log n), moving it behind items that already have that priority
+        Args:
+            item: The item to reprioritize
+            priority: The item's new priority
+        Raises:
+            ValueError: If the item is not in the queue
+        """
+        with self._lock:
+            index = self._position(item)
+            self.heap[index][0] = priority
+            self.heap[index][1] = self._next_sequence()
+            self._sift_down(index)
+            self._sift_up(index)
+
+    def remove(self, item):
+        """
+        Remove an item wherever it is in the queue in O(log n)
+        Args:
+            item: The item to remove
+        Raises:
+            ValueError: If the item is not in the queue
+        """
+        with self._lock:
+            self._delete(self._position(item))
+
+    def __contains__(self, item):
+        """
+        Check whether an item is in the queue in O(1)
+        Args:
+            item: The item to look for
+        Returns:
+            True if the item is in the queue, False otherwise
+        """
+        return item in self.positions
+
+    def is_empty(self):
+        """
+        Check if the queue is empty
+        Returns:
+            True if the queue is empty, False otherwise
+        """
+        return not self.heap
+
+    def size(self):
+        """
+        Get the size of the queue
+        Returns:
+            The size of the queue
+        """
+        return len(self.heap)
+
+    def __len__(self):
+        """
+        Get the size of the queue
+        Returns:
+            The size of the queue
+        """
+        return len(self.heap)
+
+    def __str__(self):
+        with self._lock:
+            entries = sorted(self.heap)
+        return str([(item, priority) for priority, _, item in entries])
+
 def main():
     queueusinglist = QueueUsingList()
     queueusingdeque = QueueUsingDeque()
     queueusingqueue = QueueUsingQueue()
     circularqueue = CircularQueue(5)
-    priorityqueue = PriorityQueue()
+    indexedpriorityqueue = IndexedPriorityQueue()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
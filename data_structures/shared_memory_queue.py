@@ -0,0 +1,415 @@
+from .imports import contextmanager, get_context, monotonic, SharedMemory, struct
+
+MAGIC = b"DSSQ"
+_HEADER = struct.Struct("=4s4x5q")
+_HEADER_SIZE = 64
+_HEAD, _TAIL, _CAPACITY, _RECORD_SIZE, _WAITERS = range(5)
+
+def _attach_queue(name, put_lock, get_lock, changed):
+    """
+    Rebuild a queue in another process from the pieces pickled by __reduce__.
+    Args:
+        name: The name of the shared memory block.
+        put_lock: The lock that serializes producers.
+        get_lock: The lock that serializes consumers.
+        changed: The condition blocked callers wait on.
+    Returns:
+        SharedMemoryQueue: A queue attached to the existing block.
+    """
+    queue = SharedMemoryQueue.__new__(SharedMemoryQueue)
+    queue._open(SharedMemory(name), False, put_lock, get_lock, changed)
+    return queue
+
+# -----------------------------
+
+class SharedMemoryQueue:
+    """
+    A bounded queue of fixed-size byte records shared by any number of producer and consumer processes.
+    The records live in a multiprocessing.shared_memory block laid out like
+    CircularQueue: a 64-byte header followed by capacity slots of record_size
+    bytes each. Records are copied straight between the caller's buffers and
+    the block, so nothing is pickled or sent through a pipe. The header holds
+    two ever-increasing counters, head and tail; producers serialize on one
+    process-shared lock while they fill slots and advance tail, consumers on
+    another while they empty slots and advance head, so one producer and one
+    consumer never block each other while copying records. A counter is
+    advanced, and read by the other side, only while holding the lock of a
+    shared condition, which guards nothing else; acquiring and releasing it
+    acts as a memory barrier, so a side that sees the other's counter advance
+    also sees the records written or freed before it, even on CPUs that
+    reorder stores.
+    Callers that find the queue full or empty wait on that condition, and
+    advancing a counter notifies it when a waiter is registered in the header.
+    The queue is passed to child processes like a multiprocessing.Queue, as an
+    argument of Process; the creating process unlinks the block when closed.
+    """
+
+    def __init__(self, capacity, record_size, context=None):
+        """
+        Create a queue in a new shared memory block.
+        Args:
+            capacity: The number of records the queue holds.
+            record_size: The size of every record in bytes.
+            context: A multiprocessing context or start method name for the locks, or None for the default.
+        Raises:
+            ValueError: If the capacity or the record size is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        if record_size < 1:
+            raise ValueError("Record size must be positive")
+        if context is None or isinstance(context, str):
+            context = get_context(context)
+        block = SharedMemory(create=True, size=_HEADER_SIZE + capacity * record_size)
+        _HEADER.pack_into(block.buf, 0, MAGIC, 0, 0, capacity, record_size, 0)
+        self._open(block, True, context.Lock(), context.Lock(), context.Condition())
+
+    def _open(self, block, owner, put_lock, get_lock, changed):
+        """
+        Map the header and record area of a shared memory block.
+        Args:
+            block: The SharedMemory block.
+            owner: Whether this instance created the block and must unlink it.
+            put_lock: The lock that serializes producers.
+            get_lock: The lock that serializes consumers.
+            changed: The condition blocked callers wait on.
+        Raises:
+            ValueError: If the block does not hold a queue.
+        """
+        if bytes(block.buf[:4]) != MAGIC:
+            block.close()
+            raise ValueError("The shared memory block is not a queue")
+        self._block = block
+        self._owner = owner
+        self._put_lock = put_lock
+        self._get_lock = get_lock
+        self._changed = changed
+        self._header = block.buf[8:_HEADER.size].cast("q")
+        self.capacity = self._header[_CAPACITY]
+        self.record_size = self._header[_RECORD_SIZE]
+        self._records = block.buf[_HEADER_SIZE:_HEADER_SIZE + self.capacity * self.record_size]
+
+    @property
+    def name(self):
+        """
+        The name of the shared memory block.
+        Returns:
+            str: The block's name.
+        """
+        return self._block.name
+
+    def __reduce__(self):
+        """
+        Pickle the queue as a reference to its block and locks, for passing to a child process.
+        Returns:
+            tuple: The function and arguments that attach to the block.
+        """
+        return _attach_queue, (self.name, self._put_lock, self._get_lock, self._changed)
+
+    def _spans(self, position, count):
+        """
+        Locate count slots starting at a counter value, which occupy at most two runs.
+        Args:
+            position: The head or tail counter of the first slot.
+            count: The number of slots.
+        Returns:
+            list: (start, stop) byte ranges of the record area, in queue order.
+        """
+        start = position % self.capacity
+        first = min(count, self.capacity - start)
+        spans = [(start * self.record_size, (start + first) * self.record_size)]
+        if count > first:
+            spans.append((0, (count - first) * self.record_size))
+        return spans
+
+    def _advance(self, field, value):
+        """
+        Publish a new head or tail counter and wake any waiting callers.
+        Args:
+            field: _HEAD or _TAIL.
+            value: The new counter value.
+        """
+        with self._changed:
+            self._header[field] = value
+            if self._header[_WAITERS]:
+                self._changed.notify_all()
+
+    def _free(self):
+        """
+        Count the free slots; only called by a producer holding the put lock.
+        Returns:
+            int: The number of free slots.
+        """
+        with self._changed:
+            head = self._header[_HEAD]
+        return self.capacity - (self._header[_TAIL] - head)
+
+    def _filled(self):
+        """
+        Count the stored records; only called by a consumer holding the get lock.
+        Returns:
+            int: The number of records.
+        """
+        with self._changed:
+            tail = self._header[_TAIL]
+        return tail - self._header[_HEAD]
+
+    def _wait(self, ready, timeout):
+        """
+        Wait on the shared condition until ready() holds.
+        Args:
+            ready: A function returning True once the caller can proceed.
+            timeout: The maximum number of seconds to wait, or None to wait forever.
+        Returns:
+            bool: True if ready() holds, False if the timeout expired first.
+        """
+        if ready():
+            return True
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._changed:
+            self._header[_WAITERS] += 1
+            try:
+                while not ready():
+                    remaining = None if deadline is None else deadline - monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._changed.wait(remaining)
+            finally:
+                self._header[_WAITERS] -= 1
+        return True
+
+    def _as_bytes(self, records):
+        """
+        View a bytes-like object as raw bytes without copying.
+        Args:
+            records: A bytes-like object holding whole records.
+        Returns:
+            memoryview: A flat byte view.
+        Raises:
+            ValueError: If its size is not a multiple of the record size.
+        """
+        data = memoryview(records).cast("B")
+        if data.nbytes % self.record_size:
+            raise ValueError("Records must be " + str(self.record_size) + " bytes each")
+        return data
+
+    def enqueue(self, record, timeout=None):
+        """
+        Add one record, waiting while the queue is full.
+        Args:
+            record: A bytes-like object of exactly record_size bytes.
+            timeout: The maximum number of seconds to wait, or None to wait forever.
+        Raises:
+            ValueError: If the record has the wrong size or the timeout expires.
+        """
+        data = self._as_bytes(record)
+        if data.nbytes != self.record_size:
+            raise ValueError("Records must be " + str(self.record_size) + " bytes each")
+        with self._put_lock:
+            if not self._wait(self._free, timeout):
+                raise ValueError("Timed out waiting for room")
+            tail = self._header[_TAIL]
+            start, stop = self._spans(tail, 1)[0]
+            self._records[start:stop] = data
+            self._advance(_TAIL, tail + 1)
+
+    def enqueue_many(self, records, timeout=None):
+        """
+        Add a batch of records stored back to back, copying each run of slots in one step.
+        A batch larger than the free room is written in parts as room appears.
+        Args:
+            records: A bytes-like object, such as bytes, an array or an ndarray, holding whole records.
+            timeout: The maximum number of seconds to wait for room each time, or None.
+        Raises:
+            ValueError: If the size is not a multiple of record_size, or the timeout
+                expires, in which case the records added before it stay in the queue.
+        """
+        data = self._as_bytes(records)
+        written = 0
+        with self._put_lock:
+            while written < data.nbytes:
+                if not self._wait(self._free, timeout):
+                    raise ValueError("Timed out waiting for room")
+                tail = self._header[_TAIL]
+                count = min((data.nbytes - written) // self.record_size, self._free())
+                for start, stop in self._spans(tail, count):
+                    self._records[start:stop] = data[written:written + stop - start]
+                    written += stop - start
+                self._advance(_TAIL, tail + count)
+
+    def dequeue(self, timeout=None):
+        """
+        Remove the oldest record, waiting while the queue is empty.
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait forever.
+        Returns:
+            bytes: A copy of the record.
+        Raises:
+            ValueError: If the timeout expires.
+        """
+        with self._get_lock:
+            if not self._wait(self._filled, timeout):
+                raise ValueError("Timed out waiting for an item")
+            head = self._header[_HEAD]
+            start, stop = self._spans(head, 1)[0]
+            record = bytes(self._records[start:stop])
+            self._advance(_HEAD, head + 1)
+        return record
+
+    def dequeue_many(self, max_records, timeout=None):
+        """
+        Wait for at least one record, then remove up to max_records in one copy.
+        Args:
+            max_records: The maximum number of records to remove.
+            timeout: The maximum number of seconds to wait for the first record, or None.
+        Returns:
+            bytes: The records back to back, oldest first; empty if the timeout expired.
+        Raises:
+            ValueError: If max_records is not positive.
+        """
+        with self.read_batch(max_records, timeout) as views:
+            return b"".join(views)
+
+    @contextmanager
+    def read_batch(self, max_records, timeout=None):
+        """
+        Lend up to max_records of the oldest records without copying them.
+        Use it in a with statement. It yields a list of at most two memoryviews
+        of the shared block, oldest first, that can be cast to the record's
+        number type. Other consumers wait until the block ends, and the records
+        are removed only when it ends without an exception. Do not keep the
+        views afterwards: producers overwrite those slots.
+        Args:
+            max_records: The maximum number of records to lend.
+            timeout: The maximum number of seconds to wait for the first record, or None.
+        Yields:
+            list: The views; empty if the timeout expired.
+        Raises:
+            ValueError: If max_records is not positive.
+        """
+        if max_records < 1:
+            raise ValueError("max_records must be positive")
+        with self._get_lock:
+            if not self._wait(self._filled, timeout):
+                yield []
+                return
+            head = self._header[_HEAD]
+            count = min(max_records, self._filled())
+            views = [self._records[start:stop] for start, stop in self._spans(head, count)]
+            try:
+                yield views
+            finally:
+                for view in views:
+                    view.release()
+            self._advance(_HEAD, head + count)
+
+    @contextmanager
+    def write_batch(self, count, timeout=None):
+        """
+        Reserve count free slots and lend them to be filled in place.
+        Use it in a with statement. It yields a list of at most two memoryviews
+        of the shared block, in queue order, together holding count records.
+        Other producers wait until the block ends, and the records are added
+        only when it ends without an exception.
+        Args:
+            count: The number of records to reserve.
+            timeout: The maximum number of seconds to wait for room, or None.
+        Yields:
+            list: The views to fill.
+        Raises:
+            ValueError: If count is not between 1 and the capacity, or the timeout expires.
+        """
+        if count < 1 or count > self.capacity:
+            raise ValueError("Cannot reserve more records than the queue holds")
+        with self._put_lock:
+            if not self._wait(lambda: self._free() >= count, timeout):
+                raise ValueError("Timed out waiting for room")
+            tail = self._header[_TAIL]
+            views = [self._records[start:stop] for start, stop in self._spans(tail, count)]
+            try:
+                yield views
+            finally:
+                for view in views:
+                    view.release()
+            self._advance(_TAIL, tail + count)
+
+    def is_empty(self):
+        """
+        Check if the queue is empty.
+        Returns:
+            bool: True if the queue is empty, False otherwise.
+        """
+        return self.size() == 0
+
+    def is_full(self):
+        """
+        Check if the queue is full.
+        Returns:
+            bool: True if the queue is full, False otherwise.
+        """
+        return self.size() == self.capacity
+
+    def size(self):
+        """
+        Get the number of records; only a snapshot while other processes are running.
+        Returns:
+            int: The number of records in the queue.
+        """
+        with self._changed:
+            return self._header[_TAIL] - self._header[_HEAD]
+
+    def __len__(self):
+        """
+        Get the number of records; only a snapshot while other processes are running.
+        Returns:
+            int: The number of records in the queue.
+        """
+        return self.size()
+
+    def _detach(self):
+        """
+        Release the views and unmap the block, which must happen in that order.
+        Returns:
+            bool: True if the block was mapped until now.
+        """
+        block = getattr(self, "_block", None)
+        if block is None or block.buf is None:
+            return False
+        self._header.release()
+        self._records.release()
+        block.close()
+        return True
+
+    def close(self):
+        """
+        Detach from the shared block, and unlink it if this process created it.
+        The queue cannot be used afterwards.
+        """
+        if self._detach() and self._owner:
+            self._block.unlink()
+
+    def __del__(self):
+        """Detach from the block, without unlinking it, when a queue that was not closed is collected."""
+        self._detach()
+
+    def __enter__(self):
+        """
+        Use the queue as a context manager that closes it on exit.
+        Returns:
+            SharedMemoryQueue: The queue itself.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the queue."""
+        self.close()
+
+def main():
+    with SharedMemoryQueue(capacity=8, record_size=8) as queue:
+        queue.enqueue_many(struct.pack("=4q", 1, 2, 3, 4))
+        with queue.read_batch(3) as views:
+            print([value for view in views for value in view.cast("q")])
+        print(struct.unpack("=q", queue.dequeue()), len(queue))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+from .imports import Random
+from .linked_list import LinkedListView, _SequenceProtocol
+
+MAX_LEVEL = 32
+
+class IndexableSkipListNode:
+    """A node in an indexable skip list."""
+    __slots__ = ("data", "next", "width", "same_prev", "same_next")
+
+    def __init__(self, data, level):
+        """
+        Initialize the node with data and one forward link per level.
+        Args:
+            data: The data to be stored in the node.
+            level: The number of levels the node takes part in.
+        """
+        self.data = data
+        self.next = [None] * level
+        self.width = [1] * level
+        self.same_prev = None
+        self.same_next = None
+
+# -----------------------------
+
+class IndexableSkipList(_SequenceProtocol):
+    """
+    A sequence stored as a skip list whose links record how many positions they span.
+    Summing widths along a search path gives positions, so get, insert and
+    delete_by_position take O(log n) expected time. A hash index maps each
+    item to the first and last nodes of a chain linking its copies in list
+    order, which makes index_of, insert_after and delete_by_key O(log n) as
+    well, so data must be hashable. Inserting an item between two of its
+    copies, other than right after one of them, also walks the bottom level to
+    its next copy.
+    """
+    def __init__(self, seed=None):
+        """
+        Initialize an empty skip list.
+        Args:
+            seed: An optional seed for the level generator, for reproducible layouts.
+        """
+        self.head = IndexableSkipListNode(None, MAX_LEVEL)
+        self.size = 0
+        self._levels = 1
+        self._random = Random(seed)
+        self._index = {}
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Build a skip list from an iterable.
+        Args:
+            iterable: The items to store, in order.
+            **kwargs: Arguments passed on to the constructor (e.g. seed).
+        Returns:
+            IndexableSkipList: A new skip list holding the items.
+        """
+        skip_list = cls(**kwargs)
+        skip_list.extend(iterable)
+        return skip_list
+
+    def _random_level(self):
+        """
+        Draw a node level from a geometric distribution with p = 1/2.
+        Returns:
+            int: A level between 1 and MAX_LEVEL.
+        """
+        bits = self._random.getrandbits(MAX_LEVEL - 1)
+        level = 1
+        while bits & 1:
+            level += 1
+            bits >>= 1
+        return level
+
+    def _predecessors(self, position):
+        """
+        Find, on every active level, the last node before the given position.
+        Args:
+            position: A position between 0 and size.
+        Returns:
+            tuple: The predecessor nodes and their positions, indexed by level.
+        """
+        chain = [None] * self._levels
+        chain_positions = [0] * self._levels
+        node = self.head
+        node_position = -1
+        for level in reversed(range(self._levels)):
+            while node.next[level] is not None and node_position + node.width[level] < position:
+                node_position += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            chain_positions[level] = node_position
+        return chain, chain_positions
+
+    def _position(self, node):
+        """
+        Compute the position of a node by walking forward to the end of the list.
+        Each step follows the node's highest link, mirroring a search in reverse,
+        so the walk takes O(log n) expected steps.
+        Args:
+            node: A node in the list.
+        Returns:
+            int: The 0-based position of the node.
+        """
+        distance = 0
+        while node is not None:
+            top = len(node.next) - 1
+            distance += node.width[top]
+            node = node.next[top]
+        return self.size - distance
+
+    def _first_node(self, data):
+        """
+        Return the node holding the first occurrence of data and its position.
+        Args:
+            data: The data to look up.
+        Returns:
+            tuple: The node and its position, or (None, -1) if data is not in the list.
+        """
+        entry = self._index.get(data)
+        if entry is None:
+            return None, -1
+        return entry[0], self._position(entry[0])
+
+    def _link_copy(self, entry, node, following):
+        """
+        Link a node into the chain of copies of its data.
+        Args:
+            entry: The [first, last] index entry of the data.
+            node: The new node.
+            following: The copy that comes after the node, or None to make it the last.
+        """
+        if following is None:
+            preceding = entry[1]
+            entry[1] = node
+        else:
+            preceding = following.same_prev
+            following.same_prev = node
+        node.same_prev = preceding
+        node.same_next = following
+        if preceding is None:
+            entry[0] = node
+        else:
+            preceding.same_next = node
+
+    def get(self, position):
+        """
+        Return the data at the given position.
+        Args:
+            position: The 0-based position.
+        Returns:
+            The data stored at the position.
+        Raises:
+            ValueError: If the position is out of bounds.
+        """
+        if position < 0 or position >= self.size:
+            raise ValueError("Position out of bounds")
+        node = self.head
+        node_position = -1
+        for level in reversed(range(self._levels)):
+            while node.next[level] is not None and node_position + node.width[level] <= position:
+                node_position += node.width[level]
+                node = node.next[level]
+        return node.data
+
+    def insert(self, position, data):
+        """
+        Insert data so that it ends up at the given position.
+        Args:
+            position: The 0-based position, between 0 and size.
+            data: The data to be stored.
+        Raises:
+            ValueError: If the data is None or the position is out of bounds.
+        """
+        if data is None:
+            raise ValueError("Data cannot be None")
+        if position < 0 or position > self.size:
+            raise ValueError("Position out of bounds")
+        entry = self._index.get(data)
+        following = None
+        if entry is not None and position <= self._position(entry[0]):
+            following = entry[0]
+        elif entry is not None and position <= self._position(entry[1]):
+            following = entry[1]
+        level = self._random_level()
+        if level > self._levels:
+            for new_level in range(self._levels, level):
+                self.head.width[new_level] = self.size + 1
+            self._levels = level
+        chain, chain_positions = self._predecessors(position)
+        new_node = IndexableSkipListNode(data, level)
+        for current_level in range(level):
+            previous_node = chain[current_level]
+            spanned = position - chain_positions[current_level]
+            new_node.next[current_level] = previous_node.next[current_level]
+            new_node.width[current_level] = previous_node.width[current_level] - spanned + 1
+            previous_node.next[current_level] = new_node
+            previous_node.width[current_level] = spanned
+        for current_level in range(level, self._levels):
+            chain[current_level].width[current_level] += 1
+        if entry is None:
+            self._index[data] = [new_node, new_node]
+        else:
+            if following is entry[1] and following is not entry[0]:
+                previous_node = chain[0]
+                if previous_node.data == data:
+                    following = previous_node.same_next
+                else:
+                    following = new_node.next[0]
+                    while following.data != data:
+                        following = following.next[0]
+            self._link_copy(entry, new_node, following)
+        self.size += 1
+
+    def delete_by_position(self, position):
+        """
+        Delete the node at the specified position.
+        Args:
+            position: The position of the node to be deleted (0-based index).
+        Raises:
+            ValueError: If the position is out of bounds.
+        """
+        if position < 0 or position >= self.size:
+            raise ValueError("Position out of bounds")
+        chain, _ = self._predecessors(position)
+        target = chain[0].next[0]
+        for level in range(self._levels):
+            previous_node = chain[level]
+            if level < len(target.next):
+                previous_node.next[level] = target.next[level]
+                previous_node.width[level] += target.width[level] - 1
+            else:
+                previous_node.width[level] -= 1
+        preceding, following = target.same_prev, target.same_next
+        if preceding is None and following is None:
+            del self._index[target.data]
+        else:
+            entry = self._index[target.data]
+            if preceding is None:
+                entry[0] = following
+            else:
+                preceding.same_next = following
+            if following is None:
+                entry[1] = preceding
+            else:
+                following.same_prev = preceding
+        self.size -= 1
+
+    def index_of(self, data):
+        """
+        Return the position of the first node holding data.
+        Args:
+            data: The data to look up.
+        Returns:
+            int: The 0-based position of the first occurrence.
+        Raises:
+            ValueError: If the data is not in the list.
+        """
+        node, position = self._first_node(data)
+        if node is None:
+            raise ValueError("The key is not in the list")
+        return position
+
+    def append(self, data):
+        """
+        Append data to the end of the list.
+        Args:
+            data: The data to be stored.
+        Raises:
+            ValueError: If the data is None.
+        """
+        self.insert(self.size, data)
+
+    def prepend(self, data):
+        """
+        Prepend data to the start of the list.
+        Args:
+            data: The data to be stored.
+        Raises:
+            ValueError: If the data is None.
+        """
+        self.insert(0, data)
+
+    def extend(self, iterable):
+        """
+        Append every item of an iterable to the end of the list.
+        Args:
+            iterable: The items to append, in order.
+        Raises:
+            ValueError: If an item is None.
+        """
+        for data in iterable:
+            self.insert(self.size, data)
+
+    def extend_left(self, iterable):
+        """
+        Insert every item of an iterable before the head, keeping their order.
+        Args:
+            iterable: The items to prepend, in order.
+        Raises:
+            ValueError: If an item is None.
+        """
+        for position, data in enumerate(iterable):
+            self.insert(position, data)
+
+    def insert_after(self, prev_node_data, data):
+        """
+        Insert data after the first node holding prev_node_data.
+        Args:
+            prev_node_data: The data of the node after which to insert.
+            data: The data to be stored.
+        Raises:
+            ValueError: If the data is None or prev_node_data is not in the list.
+        """
+        node, position = self._first_node(prev_node_data)
+        if node is None:
+            raise ValueError("The previous node data is not in the list")
+        self.insert(position + 1, data)
+
+    def delete_by_key(self, key):
+        """
+        Delete the first node holding the specified key.
+        Args:
+            key: The data of the node to be deleted.
+        Raises:
+            ValueError: If the key is not in the list.
+        """
+        node, position = self._first_node(key)
+        if node is None:
+            raise ValueError("The key is not in the list")
+        self.delete_by_position(position)
+
+    def __iter__(self):
+        """
+        Iterate over the data along the bottom level.
+        Yields:
+            The data of each node in order.
+        """
+        node = self.head.next[0]
+        while node is not None:
+            yield node.data
+            node = node.next[0]
+
+    def __contains__(self, data):
+        """
+        Check whether any node holds the given data.
+        Args:
+            data: The data to look for.
+        Returns:
+            bool: True if a node's data equals data.
+        """
+        try:
+            return data in self._index
+        except TypeError:
+            return False
+
+    def __getitem__(self, index):
+        """
+        Return the data at a position in O(log n), or a lazy view for a slice.
+        Args:
+            index: An int position (negative counts from the end) or a slice.
+        Returns:
+            The data at the position, or a LinkedListView for a slice.
+        Raises:
+            IndexError: If the position is out of bounds.
+        """
+        if isinstance(index, slice):
+            return LinkedListView(self, index)
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError("Position out of bounds")
+        return self.get(index)
+
+    def __str__(self):
+        """
+        Return a string representation of the skip list.
+        Returns:
+            str: A string representation of the skip list.
+        """
+        return "(head) -> " + " -> ".join(map(str, self)) + " -> (none)"
+
+def main():
+    skiplist = IndexableSkipList.from_iterable(range(10), seed=1)
+    skiplist.insert(5, 4.5)
+    skiplist.delete_by_position(0)
+    skiplist.insert_after(9, 10)
+    print(skiplist, skiplist.get(4), skiplist.index_of(4.5))
+
+if __name__ == "__main__":
+    main()
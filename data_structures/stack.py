@@ -1,4 +1,6 @@
-from .imports import deque, LifoQueue
+from .imports import add, Condition, deque, Empty, LifoQueue, Lock, monotonic
+from .async_buffer import _AsyncBuffer
+from .buffers import buffer_view, grow_buffer, new_buffer, write
 
 class StackUsingList:
     """
@@ -34,6 +36,38 @@ class StackUsingList:
             raise ValueError("Cannot pop from an empty stack")
         return self.stack.pop()
 
+    def push_many(self, items):
+        """
+        Push several items in one call, the last one ending on top
+        Args:
+            items: The items to push to the stack
+        Raises:
+            ValueError: If an item is None; nothing is pushed then
+        """
+        items = list(items)
+        if any(item is None for item in items):
+            raise ValueError("Cannot push None to stack")
+        self.stack.extend(items)
+    
+    def pop_many(self, n):
+        """
+        Pop n items from the top of the stack in one call
+        Args:
+            n: The number of items to pop
+        Returns:
+            A list of the popped items, the former top first
+        Raises:
+            ValueError: If n is negative or larger than the stack
+        """
+        if n < 0 or n > len(self.stack):
+            raise ValueError("Cannot pop more items than the stack holds")
+        if n == 0:
+            return []
+        items = self.stack[-n:]
+        del self.stack[-n:]
+        items.reverse()
+        return items
+
     def peek(self):
         """
         Peek at the item at the top of the stack
@@ -101,6 +135,34 @@ class StackUsingDeque:
             raise ValueError("Cannot pop from an empty stack")
         return self.stack.pop()
 
+    def push_many(self, items):
+        """
+        Push several items in one call, the last one ending on top
+        Args:
+            items: The items to push to the stack
+        Raises:
+            ValueError: If an item is None; nothing is pushed then
+        """
+        items = list(items)
+        if any(item is None for item in items):
+            raise ValueError("Cannot push None to stack")
+        self.stack.extend(items)
+    
+    def pop_many(self, n):
+        """
+        Pop n items from the top of the stack in one call
+        Args:
+            n: The number of items to pop
+        Returns:
+            A list of the popped items, the former top first
+        Raises:
+            ValueError: If n is negative or larger than the stack
+        """
+        if n < 0 or n > len(self.stack):
+            raise ValueError("Cannot pop more items than the stack holds")
+        pop = self.stack.pop
+        return [pop() for _ in range(n)]
+
     def peek(self):
         """
         Peek at the item at the top of the stack
@@ -119,7 +181,7 @@ class StackUsingDeque:
         Returns:
             True if the stack is empty, False otherwise
         """
-        return self.size == 0
+        return self.size() == 0
     
     def size(self):
         """
@@ -164,15 +226,62 @@ class StackUsingLifoQueue:
         Raises:
             ValueError: If the stack is empty
         """
-        if self.is_empty():
-            raise ValueError("Cannot pop from an empty stack")
-        return self.stack.get()
+        try:
+            return self.stack.get_nowait()
+        except Empty:
+            raise ValueError("Cannot pop from an empty stack") from None
+    
+    def push_many(self, items):
+        """
+        Push several items while holding the queue's lock once
+        Args:
+            items: The items to push to the stack
+        Raises:
+            ValueError: If an item is None; nothing is pushed then
+        """
+        items = list(items)
+        if any(item is None for item in items):
+            raise ValueError("Cannot push None to stack")
+        if not items:
+            return
+        with self.stack.mutex:
+            self.stack.queue.extend(items)
+            self.stack.unfinished_tasks += len(items)
+            self.stack.not_empty.notify(len(items))
+
+    def pop_many(self, n):
+        """
+        Pop n items while holding the queue's lock once
+        Args:
+            n: The number of items to pop
+        Returns:
+            A list of the popped items, the former top first
+        Raises:
+            ValueError: If n is negative or larger than the stack
+        """
+        with self.stack.mutex:
+            if n < 0 or n > len(self.stack.queue):
+                raise ValueError("Cannot pop more items than the stack holds")
+            if n == 0:
+                return []
+            items = self.stack.queue[-n:]
+            del self.stack.queue[-n:]
+            self.stack.not_full.notify(n)
+        items.reverse()
+        return items
     
     def peek(self):
         """
         Peek at the item at the top of the stack
+        Returns:
+            The item at the top of the stack
+        Raises:
+            ValueError: If the stack is empty
         """
-        return self.stack.queue[-1]
+        with self.stack.mutex:
+            if not self.stack.queue:
+                raise ValueError("Cannot peek from an empty stack")
+            return self.stack.queue[-1]
 
     def is_empty(self):
         """
@@ -193,10 +302,537 @@ class StackUsingLifoQueue:
     def __str__(self):
         return str(self.stack.queue)
     
+# -----------------------------
+
+class ConcurrentStack:
+    """
+    A thread-safe stack guarded by a single lock
+    Unlike StackUsingLifoQueue, which goes through queue.LifoQueue's condition
+    variables and task accounting on every call, push and try_pop take one
+    plain lock and only notify when a thread is actually waiting. Blocking pops
+    wait on a condition with an optional timeout, and close() wakes them all.
+    """
+    def __init__(self):
+        """
+        Initialize an empty, open stack
+        """
+        self.stack = []
+        self._lock = Lock()
+        self._not_empty = Condition(self._lock)
+        self._waiting = 0
+        self.closed = False
+
+    def push(self, item):
+        """
+        Push an item to the top of the stack, waking one blocked pop
+        Args:
+            item: The item to push to the stack
+        Raises:
+            ValueError: If the item is None or the stack is closed
+        """
+        if item is None:
+            raise ValueError("Cannot push None to stack")
+        with self._lock:
+            if self.closed:
+                raise ValueError("Cannot push to a closed stack")
+            self.stack.append(item)
+            if self._waiting:
+                self._not_empty.notify()
+
+    def push_many(self, items):
+        """
+        Push several items atomically, the last one ending on top
+        Args:
+            items: The items to push
+        Raises:
+            ValueError: If an item is None or the stack is closed; nothing is pushed then
+        """
+        items = list(items)
+        if any(item is None for item in items):
+            raise ValueError("Cannot push None to stack")
+        with self._lock:
+            if self.closed:
+                raise ValueError("Cannot push to a closed stack")
+            self.stack.extend(items)
+            if self._waiting:
+                self._not_empty.notify(len(items))
+
+    def try_pop(self):
+        """
+        Pop the top item if there is one, without blocking
+        Returns:
+            The item that was popped, or None if the stack is empty
+        """
+        with self._lock:
+            return self.stack.pop() if self.stack else None
+
+    def pop(self, timeout=None):
+        """
+        Pop an item from the top of the stack, waiting for one if it is empty
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait forever
+        Returns:
+            The item that was popped from the stack
+        Raises:
+            ValueError: If the timeout expires, or the stack is closed and empty
+        """
+        with self._lock:
+            if not self.stack:
+                deadline = None if timeout is None else monotonic() + timeout
+                self._waiting += 1
+                try:
+                    while not self.stack:
+                        if self.closed:
+                            raise ValueError("Cannot pop from a closed, empty stack")
+                        remaining = None if deadline is None else deadline - monotonic()
+                        if remaining is not None and remaining <= 0:
+                            raise ValueError("Timed out waiting for an item")
+                        self._not_empty.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            return self.stack.pop()
+
+    def pop_many(self, n):
+        """
+        Pop up to n items atomically, without blocking
+        Args:
+            n: The maximum number of items to pop
+        Returns:
+            A list of the popped items, the former top first
+        Raises:
+            ValueError: If n is negative
+        """
+        if n < 0:
+            raise ValueError("Cannot pop a negative number of items")
+        with self._lock:
+            if n == 0 or not self.stack:
+                return []
+            items = self.stack[-n:]
+            del self.stack[-n:]
+        items.reverse()
+        return items
+
+    def close(self):
+        """
+        Refuse further pushes and wake every blocked pop
+        Items already on the stack can still be popped or drained.
+        """
+        with self._lock:
+            self.closed = True
+            self._not_empty.notify_all()
+
+    def drain(self):
+        """
+        Pop every item atomically
+        Returns:
+            A list of the popped items, the former top first
+        """
+        with self._lock:
+            items = self.stack
+            self.stack = []
+        items.reverse()
+        return items
+
+    def peek(self):
+        """
+        Peek at the item at the top of the stack
+        Returns:
+            The item at the top of the stack
+        Raises:
+            ValueError: If the stack is empty
+        """
+        with self._lock:
+            if not self.stack:
+                raise ValueError("Cannot peek from an empty stack")
+            return self.stack[-1]
+
+    def is_empty(self):
+        """
+        Check if the stack is empty
+        Returns:
+            True if the stack is empty, False otherwise
+        """
+        return not self.stack
+
+    def size(self):
+        """
+        Get the size of the stack
+        Returns:
+            The size of the stack
+        """
+        return len(self.stack)
+
+    def __len__(self):
+        """
+        Get the size of the stack
+        Returns:
+            The size of the stack
+        """
+        return len(self.stack)
+
+    def __str__(self):
+        with self._lock:
+            return str(self.stack)
+
+# -----------------------------
+
+class AsyncStack(_AsyncBuffer):
+    """
+    An asyncio stack whose pop waits while it is empty and whose push waits while it is full
+    Waiting coroutines are woken in arrival order, and cancelling a waiting
+    push or pop is safe. Use it from a single event loop; it is not thread-safe.
+    """
+    _none_error = "Cannot push None to stack"
+    _full_error = "Cannot push to a full stack"
+
+    def __init__(self, capacity=None):
+        """
+        Initialize an empty stack
+        Args:
+            capacity: The maximum number of items, or None for no limit
+        Raises:
+            ValueError: If the capacity is not positive
+        """
+        super().__init__(capacity, deque.pop)
+
+    async def push(self, item):
+        """
+        Push an item to the top of the stack, waiting while the stack is full
+        Args:
+            item: The item to push to the stack
+        Raises:
+            ValueError: If the item is None
+        """
+        await self._add(item)
+
+    def try_push(self, item):
+        """
+        Push an item to the top of the stack without waiting
+        Args:
+            item: The item to push to the stack
+        Raises:
+            ValueError: If the item is None or the stack is full
+        """
+        self._add_nowait(item)
+
+    async def pop(self):
+        """
+        Pop an item from the top of the stack, waiting while the stack is empty
+        Returns:
+            The item that was popped from the stack
+        """
+        return await self._remove()
+
+    def try_pop(self):
+        """
+        Pop the top item if there is one, without waiting
+        Returns:
+            The item that was popped, or None if the stack is empty
+        """
+        return self._remove_nowait()
+
+    def peek(self):
+        """
+        Peek at the item at the top of the stack
+        Returns:
+            The item at the top of the stack
+        Raises:
+            ValueError: If the stack is empty
+        """
+        if not self.items:
+            raise ValueError("Cannot peek from an empty stack")
+        return self.items[-1]
+
+# -----------------------------
+
+class AggregateStack:
+    """
+    A stack that keeps the min, max and a running aggregate of its items
+    Every slot stores the min, max and aggregate of the items from the bottom
+    up to it, so push, pop, min(), max() and aggregate() are all O(1). The
+    aggregate function must be associative (sum, product, gcd, ...). While
+    track_extrema is True every push compares the new item with the current
+    min and max, so items must be mutually comparable; pass track_extrema=False
+    to aggregate unorderable items such as sets under union or dicts under merge.
+    """
+    def __init__(self, function=add, track_extrema=True):
+        """
+        Initialize an empty stack
+        Args:
+            function: An associative function of two arguments, applied bottom to top
+            track_extrema: Whether to keep the min and max, which requires comparable items
+        """
+        self.function = function
+        self.track_extrema = track_extrema
+        self.stack = []
+        self._mins = []
+        self._maxs = []
+        self._aggregates = []
+
+    def _combine(self, below, item):
+        """
+        Fold an item into the aggregate of the items below it
+        Args:
+            below: The aggregate of the items below
+            item: The new top item
+        Returns:
+            The aggregate including the item
+        """
+        return self.function(below, item)
+
+    def push(self, item):
+        """
+        Push an item to the top of the stack
+        Args:
+            item: The item to push to the stack
+        Raises:
+            ValueError: If the item is None
+        """
+        if item is None:
+            raise ValueError("Cannot push None to stack")
+        if self.track_extrema:
+            if self.stack:
+                low, high = self._mins[-1], self._maxs[-1]
+                self._mins.append(item if item < low else low)
+                self._maxs.append(item if item > high else high)
+            else:
+                self._mins.append(item)
+                self._maxs.append(item)
+        self._aggregates.append(self._combine(self._aggregates[-1], item) if self.stack else item)
+        self.stack.append(item)
+
+    def pop(self):
+        """
+        Pop an item from the top of the stack
+        Returns:
+            The item that was popped from the stack
+        Raises:
+            ValueError: If the stack is empty
+        """
+        if not self.stack:
+            raise ValueError("Cannot pop from an empty stack")
+        if self.track_extrema:
+            self._mins.pop()
+            self._maxs.pop()
+        self._aggregates.pop()
+        return self.stack.pop()
+
+    def peek(self):
+        """
+        Peek at the item at the top of the stack
+        Returns:
+            The item at the top of the stack
+        Raises:
+            ValueError: If the stack is empty
+        """
+        if not self.stack:
+            raise ValueError("Cannot peek from an empty stack")
+        return self.stack[-1]
+
+    def min(self):
+        """
+        Get the smallest item on the stack in O(1)
+        Returns:
+            The smallest item
+        Raises:
+            ValueError: If the stack is empty or does not track extrema
+        """
+        if not self.track_extrema:
+            raise ValueError("Stack was created with track_extrema=False")
+        if not self.stack:
+            raise ValueError("Cannot aggregate an empty stack")
+        return self._mins[-1]
+
+    def max(self):
+        """
+        Get the largest item on the stack in O(1)
+        Returns:
+            The largest item
+        Raises:
+            ValueError: If the stack is empty or does not track extrema
+        """
+        if not self.track_extrema:
+            raise ValueError("Stack was created with track_extrema=False")
+        if not self.stack:
+            raise ValueError("Cannot aggregate an empty stack")
+        return self._maxs[-1]
+
+    def aggregate(self):
+        """
+        Get the function folded over every item, bottom to top, in O(1)
+        Returns:
+            The aggregate of the items
+        Raises:
+            ValueError: If the stack is empty
+        """
+        if not self.stack:
+            raise ValueError("Cannot aggregate an empty stack")
+        return self._aggregates[-1]
+
+    def is_empty(self):
+        """
+        Check if the stack is empty
+        Returns:
+            True if the stack is empty, False otherwise
+        """
+        return not self.stack
+
+    def size(self):
+        """
+        Get the size of the stack
+        Returns:
+            The size of the stack
+        """
+        return len(self.stack)
+
+    def __str__(self):
+        return str(self.stack)
+
+# -----------------------------
+
+class TypedStack:
+    """
+    A stack of unboxed numbers stored in a typed buffer
+    Items live in an array.array or a NumPy ndarray of the given typecode, so
+    an int costs its itemsize (8 bytes for "q") instead of a pointer plus an
+    int object. When the buffer is full it is copied into one twice as large,
+    so views handed out by pop_many keep pointing at valid memory.
+    """
+    def __init__(self, dtype="q", backend="array", capacity=16):
+        """
+        Initialize an empty stack
+        Args:
+            dtype: An array module typecode, e.g. "q" for 64-bit ints or "d" for floats
+            backend: "array" for array.array storage or "numpy" for a NumPy buffer
+            capacity: The number of items to reserve up front
+        Raises:
+            ValueError: If the backend is unknown or the capacity is not positive
+            ImportError: If the numpy backend is requested but NumPy is not installed
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.dtype = dtype
+        self.backend = backend
+        self.stack = new_buffer(dtype, capacity, backend)
+        self.count = 0
+
+    def _reserve(self, extra):
+        """
+        Make room for extra more items, doubling the buffer as needed
+        Args:
+            extra: The number of items about to be pushed
+        """
+        needed = self.count + extra
+        if needed > len(self.stack):
+            self.stack = grow_buffer(self.stack, max(needed, 2 * len(self.stack)), self.count)
+
+    def push(self, item):
+        """
+        Push an item to the top of the stack
+        Args:
+            item: The number to push to the stack
+        Raises:
+            ValueError: If the item is None
+            TypeError: If the item does not fit the dtype
+        """
+        if item is None:
+            raise ValueError("Cannot push None to stack")
+        if self.count == len(self.stack):
+            self._reserve(1)
+        self.stack[self.count] = item
+        self.count += 1
+
+    def push_many(self, items):
+        """
+        Push every item of a sequence, array or ndarray, copying them in bulk
+        Args:
+            items: The numbers to push, bottom first
+        Raises:
+            TypeError: If an item does not fit the dtype
+        """
+        if not hasattr(items, "__len__"):
+            items = list(items)
+        self._reserve(len(items))
+        self.count += write(self.stack, self.count, items)
+
+    def pop(self):
+        """
+        Pop an item from the top of the stack
+        Returns:
+            The item that was popped from the stack
+        Raises:
+            ValueError: If the stack is empty
+        """
+        if self.count == 0:
+            raise ValueError("Cannot pop from an empty stack")
+        self.count -= 1
+        return self.stack[self.count]
+
+    def pop_many(self, n):
+        """
+        Pop the top n items at once without copying them
+        The result is a memoryview (array backend) or ndarray view (numpy backend)
+        of the buffer, ordered bottom to top, so its last item was the top of the
+        stack. Later pushes overwrite the slots it shows; copy it (e.g. with
+        tolist() or copy()) to keep the values.
+        Args:
+            n: The number of items to pop
+        Returns:
+            A view of the popped items
+        Raises:
+            ValueError: If n is negative or larger than the stack
+        """
+        if n < 0 or n > self.count:
+            raise ValueError("Cannot pop more items than the stack holds")
+        self.count -= n
+        return buffer_view(self.stack, self.count, self.count + n)
+
+    def peek(self):
+        """
+        Peek at the item at the top of the stack
+        Returns:
+            The item at the top of the stack
+        Raises:
+            ValueError: If the stack is empty
+        """
+        if self.count == 0:
+            raise ValueError("Cannot peek from an empty stack")
+        return self.stack[self.count - 1]
+
+    def is_empty(self):
+        """
+        Check if the stack is empty
+        Returns:
+            True if the stack is empty, False otherwise
+        """
+        return self.count == 0
+
+    def size(self):
+        """
+        Get the size of the stack
+        Returns:
+            The size of the stack
+        """
+        return self.count
+
+    def __len__(self):
+        """
+        Get the size of the stack
+        Returns:
+            The size of the stack
+        """
+        return self.count
+
+    def __str__(self):
+        return str(buffer_view(self.stack, 0, self.count).tolist())
+
 def main():
     stackusinglist = StackUsingList()
     stackusingdeque = StackUsingDeque()
     stackusinglifoqueue = StackUsingLifoQueue()
+    typedstack = TypedStack("q")
+    typedstack.push_many(range(10))
+    print(typedstack.pop_many(3).tolist(), typedstack)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.array_linked_list import ArrayDoublyLinkedList
+
+class TestArrayDoublyLinkedList(unittest.TestCase):
+    def setUp(self):
+        self.dll = ArrayDoublyLinkedList()
+
+    def test_append_and_prepend(self):
+        self.dll.append(1)
+        self.dll.append(2)
+        self.dll.prepend(0)
+        self.assertEqual(str(self.dll), "0 <--> 1 <--> 2")
+        self.assertEqual(self.dll.length(), 3)
+        with self.assertRaises(ValueError):
+            self.dll.append(None)
+
+    def test_insert_after(self):
+        self.dll.append(1)
+        self.dll.append(2)
+        self.dll.insert_after(1, 1.5)
+        self.dll.insert_after(2, 3)
+        self.assertEqual(self.dll.traverse(), ["1", "1.5", "2", "3"])
+        self.dll.append(4)
+        self.assertEqual(str(self.dll), "1 <--> 1.5 <--> 2 <--> 3 <--> 4")
+        with self.assertRaises(ValueError):
+            self.dll.insert_after(9, 10)
+
+    def test_delete(self):
+        for i in range(6):
+            self.dll.append(i)
+        self.dll.delete_by_key(0)
+        self.dll.delete_by_key(5)
+        self.dll.delete_by_position(2)
+        self.dll.delete_by_position(0)
+        self.assertEqual(str(self.dll), "2 <--> 4")
+        self.assertEqual(self.dll.length(), 2)
+        with self.assertRaises(ValueError):
+            self.dll.delete_by_key(7)
+        with self.assertRaises(ValueError):
+            self.dll.delete_by_position(2)
+
+    def test_slots_are_recycled(self):
+        dll = ArrayDoublyLinkedList(typecode="q", capacity=4)
+        for i in range(4):
+            dll.append(i)
+        for i in range(4):
+            dll.delete_by_position(0)
+        for i in range(4):
+            dll.append(i * 10)
+        self.assertEqual(dll.capacity, 4)
+        self.assertEqual(str(dll), "0 <--> 10 <--> 20 <--> 30")
+        dll.append(40)
+        self.assertEqual(dll.capacity, 8)
+
+    def test_wrong_typed_items_do_not_leak_slots(self):
+        dll = ArrayDoublyLinkedList(typecode="q", capacity=4)
+        dll.extend(range(3))
+        with self.assertRaises(TypeError):
+            dll.append("x")
+        dll.append(3)
+        dll.delete_by_position(0)
+        with self.assertRaises(TypeError):
+            dll.prepend("x")
+        dll.append(4)
+        self.assertEqual(dll.capacity, 4)
+        self.assertEqual(str(dll), "1 <--> 2 <--> 3 <--> 4")
+        self.assertEqual(len(dll), 4)
+
+if __name__ == "__main__":
+    unittest.main()
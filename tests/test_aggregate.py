@@ -0,0 +1,82 @@
+import unittest
+import random
+import sys
+import os
+from functools import reduce
+from math import gcd
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.stack import AggregateStack
+from data_structures.queue import AggregateQueue
+
+class TestAggregate(unittest.TestCase):
+    def test_stack_matches_rescan(self):
+        rng = random.Random(5)
+        stack = AggregateStack(gcd)
+        expected = []
+        for _ in range(2000):
+            if expected and rng.random() < 0.45:
+                self.assertEqual(stack.pop(), expected.pop())
+            else:
+                item = rng.randrange(1, 10) * 6
+                stack.push(item)
+                expected.append(item)
+            if expected:
+                self.assertEqual(stack.min(), min(expected))
+                self.assertEqual(stack.max(), max(expected))
+                self.assertEqual(stack.aggregate(), reduce(gcd, expected))
+        self.assertEqual(stack.size(), len(expected))
+
+    def test_queue_matches_rescan(self):
+        rng = random.Random(6)
+        queue = AggregateQueue(lambda left, right: left + right)
+        expected = []
+        for _ in range(2000):
+            if expected and rng.random() < 0.45:
+                self.assertEqual(queue.peek(), expected[0])
+                self.assertEqual(queue.dequeue(), expected.pop(0))
+            else:
+                item = rng.choice("abcdef")
+                queue.enqueue(item)
+                expected.append(item)
+            if expected:
+                self.assertEqual(queue.min(), min(expected))
+                self.assertEqual(queue.max(), max(expected))
+                self.assertEqual(queue.aggregate(), "".join(expected))
+        self.assertEqual(str(queue), str(expected))
+
+    def test_unorderable_monoids(self):
+        stack = AggregateStack(lambda left, right: left | right, track_extrema=False)
+        queue = AggregateQueue(lambda left, right: {**left, **right}, track_extrema=False)
+        for index in range(5):
+            stack.push({index % 3})
+            queue.enqueue({index % 2: index})
+        self.assertEqual(stack.aggregate(), {0, 1, 2})
+        self.assertEqual(stack.pop(), {1})
+        self.assertEqual(stack.aggregate(), {0, 1, 2})
+        self.assertEqual(queue.aggregate(), {0: 4, 1: 3})
+        self.assertEqual(queue.dequeue(), {0: 0})
+        queue.enqueue({2: 5})
+        self.assertEqual(queue.aggregate(), {1: 3, 0: 4, 2: 5})
+        for method in (stack.min, stack.max, queue.min, queue.max):
+            with self.assertRaises(ValueError):
+                method()
+        tracking = AggregateStack(lambda left, right: {**left, **right})
+        tracking.push({0: 0})
+        with self.assertRaises(TypeError):
+            tracking.push({1: 1})
+
+    def test_empty(self):
+        for container in (AggregateStack(), AggregateQueue()):
+            for method in (container.min, container.max, container.aggregate):
+                with self.assertRaises(ValueError):
+                    method()
+        queue = AggregateQueue()
+        queue.enqueue(3)
+        queue.enqueue(4)
+        self.assertEqual(queue.aggregate(), 7)
+        with self.assertRaises(ValueError):
+            AggregateStack().push(None)
+
+if __name__ == "__main__":
+    unittest.main()
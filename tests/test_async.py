@@ -0,0 +1,85 @@
+import unittest
+import asyncio
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.stack import AsyncStack
+from data_structures.queue import AsyncQueue
+
+class TestAsyncStackAndQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_order(self):
+        stack = AsyncStack()
+        queue = AsyncQueue()
+        for item in (1, 2, 3):
+            await stack.push(item)
+            await queue.enqueue(item)
+        self.assertEqual(stack.peek(), 3)
+        self.assertEqual(queue.peek(), 1)
+        self.assertEqual(await stack.pop(), 3)
+        self.assertEqual(await queue.dequeue(), 1)
+        self.assertEqual(await stack.get_many(5), [2, 1])
+        self.assertEqual(await queue.get_many(5), [2, 3])
+        self.assertIsNone(stack.try_pop())
+        self.assertIsNone(queue.try_dequeue())
+        with self.assertRaises(ValueError):
+            await queue.enqueue(None)
+
+    async def test_waits_when_empty_and_full(self):
+        queue = AsyncQueue(capacity=2)
+        consumer = asyncio.create_task(queue.dequeue())
+        await asyncio.sleep(0)
+        self.assertFalse(consumer.done())
+        await queue.enqueue("a")
+        self.assertEqual(await consumer, "a")
+        queue.try_enqueue("b")
+        queue.try_enqueue("c")
+        with self.assertRaises(ValueError):
+            queue.try_enqueue("d")
+        producer = asyncio.create_task(queue.enqueue("d"))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())
+        self.assertEqual(await queue.dequeue(), "b")
+        await producer
+        self.assertEqual(str(queue), "['c', 'd']")
+
+    async def test_cancellation_keeps_items(self):
+        stack = AsyncStack()
+        cancelled = asyncio.create_task(stack.pop())
+        waiting = asyncio.create_task(stack.pop())
+        await asyncio.sleep(0)
+        stack.try_push("x")
+        cancelled.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled
+        self.assertEqual(await asyncio.wait_for(waiting, 1), "x")
+        self.assertTrue(stack.is_empty())
+
+    async def test_get_many_timeout(self):
+        queue = AsyncQueue()
+        self.assertEqual(await queue.get_many(3, timeout=0.01), [])
+        self.assertEqual(len(queue._getters), 0)
+        asyncio.get_running_loop().call_later(0.01, queue.try_enqueue, 7)
+        self.assertEqual(await queue.get_many(3, timeout=1), [7])
+
+    async def test_get_many_keeps_waiting_when_an_item_is_taken(self):
+        queue = AsyncQueue()
+        loop = asyncio.get_running_loop()
+        stolen = []
+
+        def enqueue_and_steal():
+            queue.try_enqueue(1)
+            loop.call_soon(lambda: stolen.append(queue.try_dequeue()))
+
+        loop.call_later(0.01, enqueue_and_steal)
+        loop.call_later(0.05, queue.try_enqueue, 2)
+        start = loop.time()
+        self.assertEqual(await queue.get_many(10, timeout=5), [2])
+        self.assertEqual(stolen[0], 1)
+        self.assertGreaterEqual(loop.time() - start, 0.04)
+        loop.call_later(0.01, enqueue_and_steal)
+        self.assertEqual(await queue.get_many(10, timeout=0.1), [])
+        self.assertEqual(len(queue._getters), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.stack import StackUsingList, StackUsingDeque, StackUsingLifoQueue
+from data_structures.queue import QueueUsingList, QueueUsingDeque, QueueUsingQueue, CircularQueue
+
+STACKS = (StackUsingList, StackUsingDeque, StackUsingLifoQueue)
+QUEUES = (QueueUsingList, QueueUsingDeque, QueueUsingQueue, lambda: CircularQueue(8))
+
+class TestBatchOperations(unittest.TestCase):
+    def test_stacks_match_single_operations(self):
+        for cls in STACKS:
+            with self.subTest(cls=cls.__name__):
+                batched, single = cls(), cls()
+                batched.push_many(range(10))
+                for item in range(10):
+                    single.push(item)
+                self.assertEqual(batched.size(), 10)
+                self.assertEqual(batched.pop_many(4), [single.pop() for _ in range(4)])
+                self.assertEqual(batched.peek(), 5)
+                self.assertEqual(batched.pop_many(0), [])
+                self.assertEqual(batched.pop_many(6), [5, 4, 3, 2, 1, 0])
+                self.assertTrue(batched.is_empty())
+
+    def test_queues_match_single_operations(self):
+        for factory in QUEUES:
+            queue = factory()
+            with self.subTest(cls=type(queue).__name__):
+                queue.enqueue_many(range(6))
+                self.assertEqual(queue.dequeue_many(4), [0, 1, 2, 3])
+                queue.enqueue_many(range(6, 12))
+                self.assertEqual(queue.peek(), 4)
+                self.assertEqual(queue.dequeue_many(0), [])
+                self.assertEqual(queue.dequeue_many(8), list(range(4, 12)))
+                self.assertTrue(queue.is_empty())
+
+    def test_none_rejects_whole_batch(self):
+        for cls in STACKS:
+            stack = cls()
+            with self.assertRaises(ValueError):
+                stack.push_many([1, None, 2])
+            self.assertTrue(stack.is_empty())
+        for factory in QUEUES:
+            queue = factory()
+            with self.assertRaises(ValueError):
+                queue.enqueue_many([1, None, 2])
+            self.assertTrue(queue.is_empty())
+
+    def test_too_many_raises_without_change(self):
+        for cls in STACKS:
+            stack = cls()
+            stack.push_many([1, 2])
+            for n in (3, -1):
+                with self.assertRaises(ValueError):
+                    stack.pop_many(n)
+            self.assertEqual(stack.size(), 2)
+        for factory in QUEUES:
+            queue = factory()
+            queue.enqueue_many([1, 2])
+            for n in (3, -1):
+                with self.assertRaises(ValueError):
+                    queue.dequeue_many(n)
+            self.assertEqual(queue.peek(), 1)
+
+    def test_circular_wraps_and_clears_slots(self):
+        queue = CircularQueue(5)
+        queue.enqueue_many([1, 2, 3, 4])
+        queue.dequeue_many(3)
+        queue.enqueue_many([5, 6, 7])
+        self.assertEqual(queue.queue, [6, 7, None, 4, 5])
+        with self.assertRaises(ValueError):
+            queue.enqueue_many([8, 9])
+        self.assertEqual(queue.size, 4)
+        self.assertEqual(queue.dequeue_many(4), [4, 5, 6, 7])
+        self.assertEqual(queue.queue, [None] * 5)
+
+    def test_is_empty_on_list_and_deque_classes(self):
+        for cls in (StackUsingDeque, QueueUsingList, QueueUsingDeque):
+            container = cls()
+            self.assertTrue(container.is_empty())
+            with self.assertRaises(ValueError):
+                container.peek()
+
+    def test_blocking_get_wakes_after_batch(self):
+        queue = QueueUsingQueue()
+        received = []
+        consumers = [threading.Thread(target=lambda: received.append(queue.queue.get(timeout=5))) for _ in range(3)]
+        for consumer in consumers:
+            consumer.start()
+        queue.enqueue_many([1, 2, 3])
+        for consumer in consumers:
+            consumer.join()
+        self.assertEqual(sorted(received), [1, 2, 3])
+        self.assertEqual(queue.queue.unfinished_tasks, 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.linked_list import SinglyLinkedListWithoutTail, SinglyLinkedListWithTail, \
+    DoublyLinkedListWithoutTail, DoublyLinkedListWithTail, CircularSinglyLinkedListWithoutTail
+from data_structures.array_linked_list import ArrayDoublyLinkedList
+
+class TestBulkConstruction(unittest.TestCase):
+    classes = [SinglyLinkedListWithoutTail, SinglyLinkedListWithTail, DoublyLinkedListWithoutTail,
+               DoublyLinkedListWithTail, CircularSinglyLinkedListWithoutTail, ArrayDoublyLinkedList]
+
+    def test_from_iterable_consumes_generators(self):
+        for cls in self.classes:
+            linked_list = cls.from_iterable(i for i in range(5))
+            self.assertEqual(linked_list.traverse(), ["0", "1", "2", "3", "4"])
+            self.assertEqual(linked_list.size, 5)
+
+    def test_extend_and_extend_left(self):
+        for cls in self.classes:
+            linked_list = cls()
+            linked_list.extend([])
+            linked_list.extend_left([3, 4])
+            linked_list.extend([5, 6])
+            linked_list.extend_left(iter([1, 2]))
+            linked_list.append(7)
+            linked_list.prepend(0)
+            self.assertEqual(linked_list.traverse(), [str(i) for i in range(8)])
+            self.assertEqual(linked_list.size, 8)
+            if hasattr(linked_list, "tail") and cls is not ArrayDoublyLinkedList:
+                self.assertEqual(linked_list.tail.data, 7)
+
+    def test_doubly_prev_pointers(self):
+        for cls in [DoublyLinkedListWithoutTail, DoublyLinkedListWithTail]:
+            linked_list = cls.from_iterable(range(3))
+            linked_list.extend_left([-2, -1])
+            linked_list.extend([3])
+            node = linked_list.head
+            self.assertIsNone(node.prev)
+            while node.next:
+                self.assertIs(node.next.prev, node)
+                node = node.next
+
+    def test_rejected_item_leaves_list_unchanged(self):
+        for cls in [SinglyLinkedListWithoutTail, DoublyLinkedListWithTail, ArrayDoublyLinkedList]:
+            linked_list = cls.from_iterable([1, 2])
+            with self.assertRaises(ValueError):
+                linked_list.extend([3, None])
+            with self.assertRaises(ValueError):
+                linked_list.extend_left([None])
+            self.assertEqual(linked_list.traverse(), ["1", "2"])
+            self.assertEqual(linked_list.size, 2)
+
+    def test_indexed_lists_stay_consistent(self):
+        for cls in [SinglyLinkedListWithTail, DoublyLinkedListWithTail, CircularSinglyLinkedListWithoutTail]:
+            linked_list = cls.from_iterable([1, 2, 1], indexed=True)
+            linked_list.extend_left([1, 3])
+            linked_list.extend([2])
+            linked_list.delete_by_key(1)
+            linked_list.delete_by_key(2)
+            linked_list.delete_by_key(2)
+            linked_list.insert_after(1, 9)
+            self.assertEqual(linked_list.traverse(), ["3", "1", "9", "1"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.linked_list import (
+    SinglyLinkedListWithoutTail, SinglyLinkedListWithTail, UnrolledLinkedList,
+    DoublyLinkedListWithoutTail, DoublyLinkedListWithTail, CircularSinglyLinkedListWithoutTail,
+    CircularSinglyLinkedListWithTail, CircularDoublyLinkedListWithTail, NodePool, DoublyLinkedListNode,
+)
+
+FACTORIES = [
+    SinglyLinkedListWithoutTail.from_iterable,
+    SinglyLinkedListWithTail.from_iterable,
+    lambda items: SinglyLinkedListWithTail.from_iterable(items, indexed=True),
+    lambda items: UnrolledLinkedList.from_iterable(items, block_size=4),
+    DoublyLinkedListWithoutTail.from_iterable,
+    DoublyLinkedListWithTail.from_iterable,
+    lambda items: DoublyLinkedListWithTail.from_iterable(items, indexed=True, pool=NodePool(DoublyLinkedListNode)),
+    CircularSinglyLinkedListWithoutTail.from_iterable,
+    lambda items: CircularSinglyLinkedListWithoutTail.from_iterable(items, indexed=True),
+    CircularSinglyLinkedListWithTail.from_iterable,
+    lambda items: CircularDoublyLinkedListWithTail.from_iterable(items, indexed=True),
+]
+
+class TestBulkDeletion(unittest.TestCase):
+    def check(self, linked_list, expected):
+        self.assertEqual(list(linked_list), expected)
+        self.assertEqual(len(linked_list), len(expected))
+        if linked_list._reversible:
+            self.assertEqual(list(reversed(linked_list)), expected[::-1])
+        if hasattr(linked_list, "tail"):
+            self.assertEqual(linked_list.tail is None, not expected)
+        linked_list.append(99)
+        linked_list.prepend(98)
+        self.assertEqual(list(linked_list), [98] + expected + [99])
+        linked_list.delete_by_key(99)
+        linked_list.delete_by_key(98)
+
+    def test_against_list(self):
+        rng = random.Random(7)
+        for factory in FACTORIES:
+            for size in (0, 1, 5, 30):
+                items = [rng.randrange(6) for _ in range(size)]
+                linked_list = factory(items)
+                self.assertEqual(linked_list.delete_where(lambda x: x % 3 == 0), sum(x % 3 == 0 for x in items))
+                items = [x for x in items if x % 3]
+                self.check(linked_list, items)
+                self.assertEqual(linked_list.delete_keys([1, 7]), items.count(1))
+                items = [x for x in items if x != 1]
+                self.check(linked_list, items)
+                positions = sorted(rng.sample(range(len(items)), len(items) // 2))
+                self.assertEqual(linked_list.delete_positions(positions), len(positions))
+                items = [x for i, x in enumerate(items) if i not in positions]
+                self.check(linked_list, items)
+                self.assertEqual(linked_list.delete_where(lambda x: True), len(items))
+                self.check(linked_list, [])
+
+    def test_invalid_positions(self):
+        for factory in FACTORIES:
+            linked_list = factory(range(5))
+            with self.assertRaises(ValueError):
+                linked_list.delete_positions([1, 1])
+            with self.assertRaises(ValueError):
+                linked_list.delete_positions([3, 5])
+            self.assertEqual(list(linked_list), list(range(5)))
+
+    def test_predicate_error(self):
+        def predicate(x):
+            if x == 6:
+                raise KeyError(x)
+            return x % 2 == 0
+
+        for factory in FACTORIES:
+            linked_list = factory(range(10))
+            with self.assertRaises(KeyError):
+                linked_list.delete_where(predicate)
+            self.check(linked_list, [1, 3, 5, 6, 7, 8, 9])
+
+if __name__ == "__main__":
+    unittest.main()
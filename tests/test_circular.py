@@ -0,0 +1,98 @@
+import unittest
+import random
+import sys
+import os
+from collections import deque
+from itertools import islice
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.linked_list import CircularSinglyLinkedListWithTail, CircularDoublyLinkedListWithTail
+
+class TestCircularLinkedLists(unittest.TestCase):
+    classes = [CircularSinglyLinkedListWithTail, CircularDoublyLinkedListWithTail]
+
+    def test_list_api(self):
+        for cls in self.classes:
+            ring = cls()
+            self.assertEqual(str(ring), "(head) -> (none)")
+            ring.append(1)
+            ring.append(2)
+            ring.prepend(0)
+            ring.insert_after(2, 3)
+            self.assertEqual(str(ring), "(head) -> 0 -> 1 -> 2 -> 3 -> (head)")
+            self.assertIs(ring.tail.next, ring.head)
+            ring.delete_by_key(0)
+            ring.delete_by_position(2)
+            self.assertEqual(ring.traverse(), ["1", "2"])
+            self.assertEqual(ring.length(), 2)
+            with self.assertRaises(ValueError):
+                ring.insert_after(9, 10)
+            with self.assertRaises(ValueError):
+                ring.delete_by_key(9)
+            with self.assertRaises(ValueError):
+                ring.delete_by_position(2)
+            ring.delete_by_key(1)
+            ring.delete_by_key(2)
+            self.assertIsNone(ring.tail)
+
+    def test_rotate_like_deque(self):
+        for cls in self.classes:
+            ring = cls.from_iterable(range(7))
+            expected = deque(range(7))
+            for k in [1, -1, 3, -5, 7, 13, 0, 6]:
+                ring.rotate(k)
+                expected.rotate(k)
+                self.assertEqual(list(ring), list(expected))
+                self.assertEqual(list(reversed(ring)), list(reversed(expected)))
+
+    def test_cycle(self):
+        for cls in self.classes:
+            ring = cls.from_iterable("abc")
+            self.assertEqual("".join(islice(ring.cycle(), 7)), "abcabca")
+            seen = []
+            for worker in ring.cycle():
+                seen.append(worker)
+                if len(seen) > 3:
+                    ring.delete_by_key(worker)
+            self.assertEqual(seen, list("abcabc"))
+            self.assertEqual(list(cls().cycle()), [])
+
+    def test_matches_deque(self):
+        rng = random.Random(3)
+        for cls in self.classes:
+            for indexed in (False, True):
+                ring = cls(indexed=indexed)
+                expected = []
+                for _ in range(1500):
+                    operation = rng.randrange(7)
+                    data = rng.randrange(10)
+                    if operation == 0:
+                        ring.append(data)
+                        expected.append(data)
+                    elif operation == 1:
+                        ring.prepend(data)
+                        expected.insert(0, data)
+                    elif operation == 2 and data in expected:
+                        ring.insert_after(data, -data)
+                        expected.insert(expected.index(data) + 1, -data)
+                    elif operation == 3 and data in expected:
+                        ring.delete_by_key(data)
+                        expected.remove(data)
+                    elif operation == 4 and expected:
+                        position = rng.randrange(len(expected))
+                        ring.delete_by_position(position)
+                        del expected[position]
+                    elif operation == 5:
+                        k = rng.randrange(-10, 10)
+                        ring.rotate(k)
+                        rotated = deque(expected)
+                        rotated.rotate(k)
+                        expected = list(rotated)
+                    else:
+                        ring.extend([data, data])
+                        expected.extend([data, data])
+                    self.assertEqual(list(ring), expected)
+                    self.assertEqual(ring.size, len(expected))
+
+if __name__ == "__main__":
+    unittest.main()
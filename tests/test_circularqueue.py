@@ -0,0 +1,107 @@
+import unittest
+import random
+import sys
+import os
+from array import array
+from collections import deque
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.imports import np
+from data_structures.queue import CircularQueue
+
+class TestCircularQueue(unittest.TestCase):
+    def test_str_shows_items_in_queue_order(self):
+        queue = CircularQueue(4)
+        self.assertEqual(str(queue), "[]")
+        queue.enqueue_many([1, 2, 3, 4])
+        queue.dequeue_many(2)
+        queue.enqueue_many([5, 6])
+        self.assertEqual(str(queue), "[3, 4, 5, 6]")
+        self.assertEqual(len(queue), 4)
+
+    def test_fixed_queue_still_raises_when_full(self):
+        queue = CircularQueue(2)
+        queue.enqueue(1)
+        queue.enqueue(2)
+        with self.assertRaises(ValueError):
+            queue.enqueue(3)
+        with self.assertRaises(ValueError):
+            CircularQueue(0)
+
+    def test_growable_queue_unwraps_on_resize(self):
+        queue = CircularQueue(4, growable=True)
+        queue.enqueue_many([1, 2, 3])
+        queue.dequeue_many(2)
+        queue.enqueue_many([4, 5, 6])
+        queue.enqueue(7)
+        self.assertEqual(queue.capacity, 8)
+        self.assertEqual(queue.front, 0)
+        self.assertEqual(queue.queue[:5], [3, 4, 5, 6, 7])
+        queue.enqueue_many(range(8, 30))
+        self.assertEqual(queue.capacity, 27)
+        self.assertEqual(queue.dequeue_many(queue.size), list(range(3, 30)))
+
+    def test_typed_dequeue_many_returns_two_views_when_wrapped(self):
+        queue = CircularQueue(4, dtype="d")
+        queue.enqueue_many(array("d", [1.5, 2.5, 3.5]))
+        self.assertEqual(queue.dequeue(), 1.5)
+        queue.enqueue_many([4.5, 5.5])
+        segments = queue.dequeue_many(4)
+        self.assertEqual(len(segments), 2)
+        self.assertTrue(all(isinstance(segment, memoryview) for segment in segments))
+        self.assertEqual([segment.tolist() for segment in segments], [[2.5, 3.5, 4.5], [5.5]])
+        self.assertEqual(queue.dequeue_many(0), ())
+        self.assertEqual(str(queue), "[]")
+
+    def test_typed_views_share_memory(self):
+        queue = CircularQueue(4, dtype="q")
+        queue.enqueue_many(range(3))
+        (segment,) = queue.dequeue_many(3)
+        queue.enqueue_many([7, 8])
+        self.assertEqual(segment.tolist(), [8, 1, 2])
+
+    def test_typed_growth_keeps_old_views(self):
+        queue = CircularQueue(2, growable=True, dtype="q")
+        queue.enqueue_many([1, 2])
+        (segment,) = queue.dequeue_many(1)
+        queue.enqueue_many([3, 4, 5])
+        self.assertEqual(segment.tolist(), [1])
+        self.assertEqual(str(queue), "[2, 3, 4, 5]")
+        self.assertEqual(queue.peek(), 2)
+
+    def test_typed_rejects_values_of_the_wrong_type(self):
+        queue = CircularQueue(4, dtype="q")
+        with self.assertRaises(TypeError):
+            queue.enqueue(1.5)
+        with self.assertRaises(ValueError):
+            queue.enqueue(None)
+
+    def test_matches_deque_under_random_operations(self):
+        rng = random.Random(22)
+        for dtype in (None, "q"):
+            queue = CircularQueue(3, growable=True, dtype=dtype)
+            reference = deque()
+            for _ in range(3000):
+                if reference and rng.random() < 0.5:
+                    n = rng.randint(1, len(reference))
+                    removed = queue.dequeue_many(n)
+                    if dtype is not None:
+                        removed = [item for segment in removed for item in segment.tolist()]
+                    self.assertEqual(removed, [reference.popleft() for _ in range(n)])
+                else:
+                    items = [rng.randint(0, 99) for _ in range(rng.randint(1, 5))]
+                    queue.enqueue_many(items)
+                    reference.extend(items)
+            self.assertEqual(str(queue), str(list(reference)))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_backend(self):
+        queue = CircularQueue(4, dtype="d", backend="numpy")
+        queue.enqueue_many(np.arange(3, dtype="d"))
+        queue.dequeue()
+        queue.enqueue_many(np.array([3.0, 4.0]))
+        first, second = queue.dequeue_many(4)
+        self.assertEqual(first.tolist() + second.tolist(), [1.0, 2.0, 3.0, 4.0])
+
+if __name__ == "__main__":
+    unittest.main()
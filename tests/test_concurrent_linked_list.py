@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+from threading import Thread
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.concurrent_linked_list import ConcurrentDoublyLinkedList
+
+class TestConcurrentDoublyLinkedList(unittest.TestCase):
+    def check_links(self, cdll):
+        node = cdll._head
+        count = 0
+        while node.next is not None:
+            self.assertIs(node.next.prev, node)
+            node = node.next
+            count += 1
+        self.assertIs(node, cdll._tail)
+        self.assertEqual(count - 1, cdll.size)
+
+    def test_list_api(self):
+        cdll = ConcurrentDoublyLinkedList.from_iterable([1, 2, 3])
+        cdll.prepend(0)
+        cdll.insert_after(3, 4)
+        cdll.delete_by_key(2)
+        self.assertEqual(list(cdll), [0, 1, 3, 4])
+        self.assertEqual(str(cdll), "0 <--> 1 <--> 3 <--> 4")
+        self.assertEqual(cdll[-1], 4)
+        self.assertIn(3, cdll)
+        with self.assertRaises(ValueError):
+            cdll.delete_by_key(2)
+        with self.assertRaises(ValueError):
+            cdll.insert_after(2, 5)
+        with self.assertRaises(ValueError):
+            cdll.append(None)
+        self.check_links(cdll)
+
+    def test_concurrent_writers(self):
+        cdll = ConcurrentDoublyLinkedList.from_iterable(range(-10, 0))
+
+        def worker(worker_id):
+            base = worker_id * 1000
+            for i in range(300):
+                if i % 3 == 0:
+                    cdll.prepend(base + i)
+                else:
+                    cdll.append(base + i)
+                if i % 2:
+                    cdll.insert_after(base + i, -(base + i) - 1)
+                if i % 5 == 4:
+                    cdll.delete_by_key(base + i - 1)
+
+        threads = [Thread(target=worker, args=(worker_id,)) for worker_id in range(1, 9)]
+        snapshots = []
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            snapshots.append(cdll.snapshot())
+        for thread in threads:
+            thread.join()
+        self.check_links(cdll)
+        expected = set(range(-10, 0))
+        for worker_id in range(1, 9):
+            base = worker_id * 1000
+            expected.update(base + i for i in range(300) if i % 5 != 3)
+            expected.update(-(base + i) - 1 for i in range(1, 300, 2))
+        self.assertEqual(sorted(cdll), sorted(expected))
+        for snapshot in snapshots:
+            self.assertEqual([x for x in snapshot if -10 <= x < 0], list(range(-10, 0)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import sys
+import os
+import time
+from threading import Thread
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.stack import ConcurrentStack, StackUsingLifoQueue
+
+class TestConcurrentStack(unittest.TestCase):
+    def setUp(self):
+        self.stack = ConcurrentStack()
+
+    def test_stack_api(self):
+        self.assertIsNone(self.stack.try_pop())
+        self.stack.push(1)
+        self.stack.push_many([2, 3, 4])
+        self.assertEqual(self.stack.peek(), 4)
+        self.assertEqual(self.stack.pop(), 4)
+        self.assertEqual(self.stack.pop_many(2), [3, 2])
+        self.assertEqual(self.stack.try_pop(), 1)
+        self.assertTrue(self.stack.is_empty())
+        with self.assertRaises(ValueError):
+            self.stack.push_many([5, None])
+        self.assertEqual(self.stack.size(), 0)
+
+    def test_timeout(self):
+        start = time.monotonic()
+        with self.assertRaises(ValueError):
+            self.stack.pop(timeout=0.05)
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_blocking_pop_and_close(self):
+        results = []
+        waiters = [Thread(target=lambda: results.append(self.stack.pop())) for _ in range(2)]
+        closed = []
+
+        def wait_until_closed():
+            try:
+                self.stack.pop()
+            except ValueError:
+                closed.append(True)
+
+        for thread in waiters:
+            thread.start()
+        time.sleep(0.02)
+        self.stack.push_many(["a", "b"])
+        for thread in waiters:
+            thread.join(1)
+        self.assertEqual(sorted(results), ["a", "b"])
+        thread = Thread(target=wait_until_closed)
+        thread.start()
+        time.sleep(0.02)
+        self.stack.push("c")
+        thread.join(1)
+        self.assertFalse(closed)
+        thread = Thread(target=wait_until_closed)
+        thread.start()
+        self.stack.close()
+        thread.join(1)
+        self.assertEqual(closed, [True])
+        with self.assertRaises(ValueError):
+            self.stack.push("d")
+
+    def test_drain_after_close(self):
+        self.stack.push_many(range(5))
+        self.stack.close()
+        self.assertEqual(self.stack.pop(), 4)
+        self.assertEqual(self.stack.drain(), [3, 2, 1, 0])
+        with self.assertRaises(ValueError):
+            self.stack.pop(timeout=1)
+
+    def test_producers_and_consumers(self):
+        consumed = []
+
+        def produce(base):
+            for i in range(2000):
+                self.stack.push(base + i)
+
+        def consume():
+            while True:
+                try:
+                    consumed.append(self.stack.pop())
+                except ValueError:
+                    return
+
+        producers = [Thread(target=produce, args=(base,)) for base in range(0, 8000, 2000)]
+        consumers = [Thread(target=consume) for _ in range(4)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        self.stack.close()
+        for thread in consumers:
+            thread.join()
+        self.assertEqual(sorted(consumed), list(range(8000)))
+
+    def test_lifoqueue_guards(self):
+        stack = StackUsingLifoQueue()
+        with self.assertRaises(ValueError):
+            stack.peek()
+        with self.assertRaises(ValueError):
+            stack.pop()
+        stack.push(1)
+        self.assertEqual(stack.peek(), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import random
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.queue import IndexedPriorityQueue
+
+class TestIndexedPriorityQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = IndexedPriorityQueue()
+
+    def assertHeapValid(self, queue):
+        heap = queue.heap
+        for index in range(1, len(heap)):
+            self.assertFalse(heap[index] < heap[(index - 1) // 2])
+        self.assertEqual(queue.positions, {entry[2]: index for index, entry in enumerate(heap)})
+
+    def test_dequeues_lowest_priority_first(self):
+        for item, priority in (("c", 3), ("a", 1), ("b", 2)):
+            self.queue.enqueue(item, priority)
+        self.assertEqual(self.queue.peek(), "a")
+        self.assertEqual(str(self.queue), "[('a', 1), ('b', 2), ('c', 3)]")
+        self.assertEqual([self.queue.dequeue() for _ in range(3)], ["a", "b", "c"])
+        self.assertTrue(self.queue.is_empty())
+        with self.assertRaises(ValueError):
+            self.queue.dequeue()
+        with self.assertRaises(ValueError):
+            self.queue.peek()
+
+    def test_equal_priorities_leave_in_fifo_order(self):
+        for item in "abcde":
+            self.queue.enqueue(item, 0)
+        self.queue.update_priority("b", 0)
+        self.assertEqual([self.queue.dequeue() for _ in range(5)], ["a", "c", "d", "e", "b"])
+
+    def test_items_are_never_compared(self):
+        first, second = object(), object()
+        self.queue.enqueue(first, 1)
+        self.queue.enqueue(second, 1)
+        self.assertIs(self.queue.dequeue(), first)
+
+    def test_update_priority_and_remove(self):
+        for item in range(10):
+            self.queue.enqueue(item, item)
+        self.queue.update_priority(9, -1)
+        self.queue.update_priority(0, 20)
+        self.queue.remove(5)
+        self.assertNotIn(5, self.queue)
+        self.assertIn(9, self.queue)
+        self.assertEqual(self.queue.priority(0), 20)
+        self.assertHeapValid(self.queue)
+        self.assertEqual([self.queue.dequeue() for _ in range(9)], [9, 1, 2, 3, 4, 6, 7, 8, 0])
+
+    def test_invalid_operations(self):
+        self.queue.enqueue("a", 1)
+        with self.assertRaises(ValueError):
+            self.queue.enqueue("a", 2)
+        with self.assertRaises(ValueError):
+            self.queue.enqueue(None, 2)
+        for operation in (lambda: self.queue.update_priority("b", 1), lambda: self.queue.remove("b"),
+                          lambda: self.queue.priority("b")):
+            with self.assertRaises(ValueError):
+                operation()
+        self.assertEqual(len(self.queue), 1)
+
+    def test_matches_sorted_reference_under_random_operations(self):
+        rng = random.Random(25)
+        queue = IndexedPriorityQueue(thread_safe=False)
+        reference = {}
+        order = {}
+        sequence = 0
+        for _ in range(4000):
+            choice = rng.random()
+            item = rng.randrange(200)
+            sequence += 1
+            if choice < 0.4 and item not in reference:
+                queue.enqueue(item, rng.randrange(50))
+                reference[item] = queue.priority(item)
+                order[item] = sequence
+            elif choice < 0.6 and item in reference:
+                reference[item] = rng.randrange(50)
+                order[item] = sequence
+                queue.update_priority(item, reference[item])
+            elif choice < 0.75 and item in reference:
+                queue.remove(item)
+                del reference[item]
+            elif reference:
+                expected = min(reference, key=lambda key: (reference[key], order[key]))
+                self.assertEqual(queue.dequeue(), expected)
+                del reference[expected]
+            self.assertEqual(queue.size(), len(reference))
+        self.assertHeapValid(queue)
+
+    def test_threads_share_a_locked_queue(self):
+        def enqueue(start):
+            for item in range(start, start + 500):
+                self.queue.enqueue(item, item % 7)
+                if item % 3 == 0:
+                    self.queue.update_priority(item, -item)
+
+        threads = [threading.Thread(target=enqueue, args=(start,)) for start in range(0, 2000, 500)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertHeapValid(self.queue)
+        self.assertEqual(len(self.queue), 2000)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.linked_list import SinglyLinkedListWithoutTail, SinglyLinkedListWithTail, \
+    DoublyLinkedListWithoutTail, DoublyLinkedListWithTail, CircularSinglyLinkedListWithoutTail
+from data_structures.array_linked_list import ArrayDoublyLinkedList
+
+class TestIteration(unittest.TestCase):
+    classes = [SinglyLinkedListWithoutTail, SinglyLinkedListWithTail, DoublyLinkedListWithoutTail,
+               DoublyLinkedListWithTail, CircularSinglyLinkedListWithoutTail, ArrayDoublyLinkedList]
+
+    def test_iter_len_reversed(self):
+        for cls in self.classes:
+            linked_list = cls.from_iterable(range(6))
+            self.assertEqual(list(linked_list), list(range(6)))
+            self.assertEqual(list(reversed(linked_list)), list(range(5, -1, -1)))
+            self.assertEqual(len(linked_list), 6)
+            self.assertEqual(linked_list.length(), 6)
+            self.assertEqual(list(cls()), [])
+
+    def test_contains(self):
+        for cls in self.classes:
+            linked_list = cls.from_iterable([1, 2, 3])
+            self.assertIn(2, linked_list)
+            self.assertNotIn(4, linked_list)
+        indexed = DoublyLinkedListWithTail.from_iterable([1, 2], indexed=True)
+        self.assertIn(1, indexed)
+        self.assertNotIn([1], indexed)
+
+    def test_getitem_and_slices(self):
+        for cls in self.classes:
+            linked_list = cls.from_iterable(range(10))
+            self.assertEqual(linked_list[0], 0)
+            self.assertEqual(linked_list[8], 8)
+            self.assertEqual(linked_list[-1], 9)
+            with self.assertRaises(IndexError):
+                linked_list[10]
+            for index in [slice(2, 5), slice(None, None, 3), slice(None, None, -1), slice(8, 1, -2), slice(5, 2)]:
+                view = linked_list[index]
+                self.assertEqual(list(view), list(range(10))[index])
+                self.assertEqual(len(view), len(range(10)[index]))
+
+    def test_bounded_repr(self):
+        linked_list = SinglyLinkedListWithTail.from_iterable(range(1000))
+        self.assertEqual(repr(linked_list), "SinglyLinkedListWithTail([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ...], size=1000)")
+        self.assertEqual(repr(DoublyLinkedListWithTail.from_iterable("ab")), "DoublyLinkedListWithTail(['a', 'b'], size=2)")
+
+    def test_traverse_and_str_unchanged(self):
+        linked_list = DoublyLinkedListWithTail.from_iterable([1, 2])
+        self.assertEqual(linked_list.traverse(), ["1", "2"])
+        self.assertEqual(str(linked_list), "1 <--> 2")
+        circular = CircularSinglyLinkedListWithoutTail.from_iterable([1, 2])
+        self.assertEqual(str(circular), "(head) -> 1 -> 2 -> (head)")
+
+if __name__ == "__main__":
+    unittest.main()
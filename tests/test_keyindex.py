@@ -0,0 +1,179 @@
+import unittest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+from data_structures.linked_list import SinglyLinkedListWithTail, DoublyLinkedListWithTail, \
+    CircularSinglyLinkedListWithoutTail, CircularDoublyLinkedListWithTail
+
+class TestKeyIndex(unittest.TestCase):
+    classes = [SinglyLinkedListWithTail, DoublyLinkedListWithTail, CircularSinglyLinkedListWithoutTail]
+
+    def test_first_occurrence_semantics(self):
+        for cls in self.classes:
+            linked_list = cls(indexed=True)
+            for data in [1, 2, 1, 3]:
+                linked_list.append(data)
+            linked_list.insert_after(1, 9)
+            linked_list.delete_by_key(1)
+            self.assertEqual(linked_list.traverse(), ["9", "2", "1", "3"])
+            linked_list.insert_after(9, 1)
+            linked_list.delete_by_key(1)
+            linked_list.insert_after(1, 4)
+            self.assertEqual(linked_list.traverse(), ["9", "2", "1", "4", "3"])
+            with self.assertRaises(ValueError):
+                linked_list.delete_by_key(7)
+            with self.assertRaises(ValueError):
+                linked_list.insert_after(7, 8)
+
+    def test_matches_unindexed_list(self):
+        rng = random.Random(7)
+        for cls in self.classes:
+            plain = cls()
+            indexed = cls(indexed=True)
+            for _ in range(2000):
+                operation = rng.randrange(5)
+                data = rng.randrange(1, 20)
+                key = rng.randrange(1, 20)
+                if operation == 0:
+                    calls = [("append", data)]
+                elif operation == 1:
+                    calls = [("prepend", data)]
+                elif operation == 2:
+                    calls = [("insert_after", key, data)]
+                elif operation == 3:
+                    calls = [("delete_by_key", key)]
+                else:
+                    calls = [("delete_by_position", rng.randrange(-1, plain.size + 1))]
+                for name, *args in calls:
+                    results = []
+                    for linked_list in (plain, indexed):
+                        try:
+                            getattr(linked_list, name)(*args)
+                            results.append(None)
+                        except ValueError:
+                            results.append(ValueError)
+                    self.assertEqual(results[0], results[1])
+                self.assertEqual(plain.traverse(), indexed.traverse())
+                self.assertEqual(plain.size, indexed.size)
+            if hasattr(indexed, "tail") and indexed.size:
+                self.assertIsNone(indexed.tail.next)
+
+    def assertIndexMatches(self, linked_list):
+        index = linked_list._index
+        expected = {}
+        for node in self._nodes(linked_list):
+            expected.setdefault(node.data, []).append(node)
+        chains = {}
+        for key, (node, last) in index.buckets.items():
+            chain = []
+            while node is not None:
+                chain.append(node)
+                node = index.after[node]
+            self.assertIs(chain[-1], last)
+            chains[key] = chain
+        self.assertEqual(chains, expected)
+
+    def _nodes(self, linked_list):
+        node = linked_list.head
+        for _ in range(linked_list.size):
+            yield node
+            node = node.next
+
+    def test_duplicate_heavy_chains_stay_in_list_order(self):
+        rng = random.Random(3)
+        for cls in self.classes + [CircularDoublyLinkedListWithTail]:
+            plain = cls()
+            indexed = cls(indexed=True)
+            for _ in range(600):
+                operation = rng.randrange(5)
+                data = rng.randrange(1, 4)
+                key = rng.randrange(1, 4)
+                if operation == 0:
+                    call = ("append", data)
+                elif operation == 1:
+                    call = ("prepend", data)
+                elif operation == 2:
+                    call = ("insert_after", key, data)
+                elif operation == 3:
+                    call = ("delete_by_key", key)
+                elif hasattr(plain, "rotate"):
+                    call = ("rotate", rng.randrange(-5, 6))
+                else:
+                    call = ("delete_by_position", rng.randrange(plain.size + 1))
+                for linked_list in (plain, indexed):
+                    try:
+                        getattr(linked_list, call[0])(*call[1:])
+                    except ValueError:
+                        pass
+                self.assertEqual(plain.traverse(), indexed.traverse())
+                self.assertIndexMatches(indexed)
+            if hasattr(indexed, "split_at"):
+                suffix = indexed.split_at(indexed.size // 2)
+                self.assertIndexMatches(indexed)
+                self.assertIndexMatches(suffix)
+                indexed.concat(suffix)
+                self.assertIndexMatches(indexed)
+
+    def test_splicing_merges_indexes_in_list_order(self):
+        rng = random.Random(8)
+        for cls in (SinglyLinkedListWithTail, DoublyLinkedListWithTail):
+            target = cls(indexed=True)
+            expected = []
+            for _ in range(300):
+                items = [rng.randrange(1, 6) for _ in range(rng.randrange(4))]
+                donor = cls.from_iterable(items, indexed=rng.random() < 0.5)
+                nodes = list(self._nodes(target))
+                if not nodes or rng.random() < 0.2:
+                    target.concat(donor)
+                    expected.extend(items)
+                elif rng.random() < 0.5:
+                    position = rng.randrange(len(nodes))
+                    target.splice_after(nodes[position], donor)
+                    expected[position + 1:position + 1] = items
+                else:
+                    key = rng.choice(expected)
+                    target.splice_after(key, donor)
+                    position = expected.index(key) + 1
+                    expected[position:position] = items
+                if rng.random() < 0.3:
+                    key = rng.randrange(1, 6)
+                    if key in expected:
+                        target.delete_by_key(key)
+                        expected.remove(key)
+                self.assertEqual(list(target), expected)
+                self.assertIndexMatches(target)
+                if not hasattr(target.head, "prev"):
+                    previous_node = None
+                    for node in self._nodes(target):
+                        self.assertIs(target._index.prev[node], previous_node)
+                        previous_node = node
+
+    def test_splicing_into_the_middle_does_not_rebuild_the_index(self):
+        def run(count):
+            linked_list = DoublyLinkedListWithTail.from_iterable(range(count), indexed=True)
+            middle = count // 2
+            start = time.perf_counter()
+            for key in range(-1, -201, -1):
+                linked_list.splice_after(middle, DoublyLinkedListWithTail.from_iterable([key, middle, key]))
+            return time.perf_counter() - start
+        small, large = min(run(2000) for _ in range(3)), min(run(16000) for _ in range(3))
+        self.assertLess(large, small * 3)
+
+    def test_duplicates_scale_linearly(self):
+        def run(count):
+            linked_list = DoublyLinkedListWithTail(indexed=True)
+            start = time.perf_counter()
+            for _ in range(count):
+                linked_list.prepend(0)
+                linked_list.insert_after(0, 0)
+            while linked_list.size:
+                linked_list.delete_by_key(0)
+            return time.perf_counter() - start
+        small, large = min(run(5000) for _ in range(3)), min(run(40000) for _ in range(3))
+        self.assertLess(large, small * 8 * 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.linked_list import DoublyLinkedListNode, DoublyLinkedListWithTail
+from data_structures.lru_cache import LRUCache, cached
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestLRUCache(unittest.TestCase):
+    def test_node_helpers(self):
+        dllwt = DoublyLinkedListWithTail.from_iterable([1, 2, 3], indexed=True)
+        node = DoublyLinkedListNode(4)
+        dllwt.append_node(node)
+        dllwt.move_to_end(dllwt.head)
+        self.assertEqual(list(dllwt), [2, 3, 4, 1])
+        self.assertEqual(list(reversed(dllwt)), [1, 4, 3, 2])
+        dllwt.remove_node(node)
+        dllwt.delete_by_key(1)
+        self.assertEqual(list(dllwt), [2, 3])
+        self.assertIs(dllwt.tail.data, 3)
+
+    def test_entry_limit(self):
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertEqual(list(cache), ["a", "c"])
+        self.assertIsNone(cache.get("b"))
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.entries), (1, 1, 1, 2))
+        cache.delete("a")
+        with self.assertRaises(ValueError):
+            cache.delete("a")
+        with self.assertRaises(ValueError):
+            LRUCache(max_entries=0)
+
+    def test_byte_limit(self):
+        cache = LRUCache(max_bytes=10, sizeof=len)
+        cache.put("a", "xxxx")
+        cache.put("b", "yyyy")
+        cache.put("a", "xx")
+        self.assertEqual(cache.bytes, 6)
+        cache.put("c", "zzzzz")
+        self.assertEqual(list(cache), ["a", "c"])
+        self.assertEqual(cache.bytes, 7)
+        with self.assertRaises(ValueError):
+            cache.put("d", "z" * 11)
+
+    def test_ttl(self):
+        timer = FakeTimer()
+        cache = LRUCache(ttl=5, timer=timer)
+        cache.put("a", 1)
+        cache.put("b", 2, ttl=20)
+        timer.now = 4.9
+        self.assertEqual(cache.get("a"), 1)
+        timer.now = 5
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache.get("a", "missing"), "missing")
+        cache.put("c", 3)
+        timer.now = 10
+        self.assertEqual(cache.expire(), 1)
+        self.assertEqual(list(cache), ["b"])
+        self.assertEqual(cache.info().expirations, 2)
+
+    def test_cached(self):
+        calls = []
+
+        @cached(max_entries=2, typed=True)
+        def square(x, offset=0):
+            calls.append(x)
+            return x * x + offset
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3.0), 9.0)
+        self.assertEqual(square(3, offset=1), 10)
+        self.assertEqual(calls, [3, 3.0, 3])
+        self.assertEqual(square.cache_info().hits, 1)
+        self.assertEqual(square.__name__, "square")
+        square.cache_clear()
+        self.assertEqual(len(square.cache), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.linked_list import NodePool, SinglyLinkedListNode, DoublyLinkedListNode, \
+    SinglyLinkedListWithTail, DoublyLinkedListWithTail
+
+class TestNodePool(unittest.TestCase):
+    def test_nodes_have_no_dict(self):
+        self.assertFalse(hasattr(SinglyLinkedListNode(1), "__dict__"))
+        self.assertFalse(hasattr(DoublyLinkedListNode(1), "__dict__"))
+
+    def test_deleted_nodes_are_reused(self):
+        pool = NodePool(SinglyLinkedListNode)
+        sll = SinglyLinkedListWithTail(pool=pool)
+        sll.append(1)
+        sll.append(2)
+        node = sll.tail
+        sll.delete_by_key(2)
+        self.assertEqual(len(pool), 1)
+        self.assertIsNone(node.data)
+        sll.append(3)
+        self.assertIs(sll.tail, node)
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(str(sll), "(head) -> 1 -> 3 -> (tail)")
+
+    def test_doubly_release_clears_links(self):
+        pool = NodePool(DoublyLinkedListNode)
+        dll = DoublyLinkedListWithTail(pool=pool)
+        for i in range(3):
+            dll.append(i)
+        dll.delete_by_position(1)
+        dll.delete_by_key(2)
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(dll.size, 1)
+        self.assertIs(dll.tail, dll.head)
+        dll.prepend(5)
+        self.assertEqual(str(dll), "5 <--> 0")
+        self.assertIsNone(dll.head.prev)
+
+    def test_max_size(self):
+        pool = NodePool(SinglyLinkedListNode, max_size=1)
+        sll = SinglyLinkedListWithTail(pool=pool)
+        for i in range(3):
+            sll.append(i)
+        for i in range(3):
+            sll.delete_by_key(i)
+        self.assertEqual(len(pool), 1)
+
+    def test_pool_node_class_must_match(self):
+        with self.assertRaises(ValueError):
+            DoublyLinkedListWithTail(pool=NodePool(SinglyLinkedListNode))
+        with self.assertRaises(ValueError):
+            NodePool(SinglyLinkedListNode, max_size=-1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.persistent_linked_list import PersistentLinkedList
+
+class TestPersistentLinkedList(unittest.TestCase):
+    def test_versions_share_structure(self):
+        base = PersistentLinkedList.from_iterable([1, 2, 3])
+        changed = base.tail().prepend(0)
+        self.assertEqual(list(base), [1, 2, 3])
+        self.assertEqual(list(changed), [0, 2, 3])
+        self.assertIs(changed.head.next, base.head.next)
+        self.assertEqual(changed.length(), 3)
+        self.assertEqual(len(changed.tail()), 2)
+        self.assertEqual(base.traverse(), ["1", "2", "3"])
+        self.assertEqual(base[-1], 3)
+        self.assertEqual(base.first(), 1)
+
+    def test_take_and_drop(self):
+        linked_list = PersistentLinkedList.from_iterable(range(6))
+        self.assertEqual(list(linked_list.take(2)), [0, 1])
+        self.assertIs(linked_list.take(10), linked_list)
+        self.assertIs(linked_list.drop(4).head, linked_list.head.next.next.next.next)
+        self.assertEqual(len(linked_list.drop(10)), 0)
+        with self.assertRaises(ValueError):
+            linked_list.drop(-1)
+        with self.assertRaises(ValueError):
+            PersistentLinkedList().tail()
+
+    def test_immutable_and_hashable(self):
+        left = PersistentLinkedList.from_iterable("abc")
+        right = PersistentLinkedList().prepend("c").prepend("b").prepend("a")
+        self.assertEqual(left, right)
+        self.assertEqual(hash(left), hash(right))
+        self.assertNotEqual(left, left.tail())
+        with self.assertRaises(AttributeError):
+            left.head = None
+        self.assertFalse(hasattr(left, "__dict__"))
+        self.assertEqual(str(left), "(head) -> a -> b -> c -> (tail)")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import random
+import sys
+import os
+from collections import deque
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.queue import QueueUsingList
+
+class TestQueueUsingList(unittest.TestCase):
+    def setUp(self):
+        self.queue = QueueUsingList(compact_threshold=4)
+
+    def test_enqueue_dequeue(self):
+        self.queue.enqueue(1)
+        self.queue.enqueue(2)
+        self.assertEqual(str(self.queue), "[1, 2]")
+        self.assertEqual(self.queue.dequeue(), 1)
+        self.assertEqual(str(self.queue), "[2]")
+        self.assertEqual(self.queue.peek(), 2)
+        self.assertEqual(self.queue.size(), 1)
+        self.assertEqual(self.queue.dequeue(), 2)
+        self.assertTrue(self.queue.is_empty())
+        with self.assertRaises(ValueError):
+            self.queue.dequeue()
+        with self.assertRaises(ValueError):
+            self.queue.peek()
+
+    def test_compaction_bounds_dead_prefix(self):
+        self.queue.enqueue_many(range(100))
+        for expected in range(60):
+            self.assertEqual(self.queue.dequeue(), expected)
+            self.assertTrue(self.queue.head < 4 or 2 * self.queue.head < len(self.queue.queue))
+        self.assertEqual(self.queue.size(), 40)
+        self.assertEqual(str(self.queue), str(list(range(60, 100))))
+
+    def test_dequeued_slots_release_items(self):
+        self.queue = QueueUsingList(compact_threshold=1000)
+        self.queue.enqueue_many(range(10))
+        self.queue.dequeue()
+        self.queue.dequeue_many(3)
+        self.assertEqual(self.queue.queue[:4], [None] * 4)
+
+    def test_matches_deque_under_random_operations(self):
+        rng = random.Random(21)
+        reference = deque()
+        for _ in range(5000):
+            if reference and rng.random() < 0.5:
+                if rng.random() < 0.2:
+                    n = rng.randint(0, len(reference))
+                    self.assertEqual(self.queue.dequeue_many(n), [reference.popleft() for _ in range(n)])
+                else:
+                    self.assertEqual(self.queue.dequeue(), reference.popleft())
+            else:
+                item = rng.randint(0, 99)
+                self.queue.enqueue(item)
+                reference.append(item)
+            self.assertEqual(self.queue.size(), len(reference))
+        self.assertEqual(str(self.queue), str(list(reference)))
+
+    def test_threshold_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            QueueUsingList(compact_threshold=0)
+
+if __name__ == "__main__":
+    unittest.main()
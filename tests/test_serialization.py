@@ -0,0 +1,115 @@
+import unittest
+import os
+import pickle
+import sys
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.linked_list import (
+    SinglyLinkedListWithoutTail, SinglyLinkedListWithTail, UnrolledLinkedList,
+    DoublyLinkedListWithTail, CircularDoublyLinkedListWithTail,
+)
+from data_structures.array_linked_list import ArrayDoublyLinkedList
+from data_structures.skip_list import IndexableSkipList
+from data_structures.linked_list_io import dumps, loads
+from data_structures.mapped_linked_list import MappedDoublyLinkedList
+
+class TestSerialization(unittest.TestCase):
+    def test_pickle_long_lists(self):
+        items = list(range(50_000))
+        for linked_list in [
+            SinglyLinkedListWithoutTail.from_iterable(items),
+            DoublyLinkedListWithTail.from_iterable(items, indexed=True),
+            CircularDoublyLinkedListWithTail.from_iterable(items),
+            UnrolledLinkedList.from_iterable(items, block_size=16),
+        ]:
+            copy = pickle.loads(pickle.dumps(linked_list))
+            self.assertIs(type(copy), type(linked_list))
+            self.assertEqual(list(copy), items)
+        self.assertEqual(pickle.loads(pickle.dumps(linked_list)).block_size, 16)
+
+    def test_binary_format(self):
+        dllwt = DoublyLinkedListWithTail.from_iterable(range(1000), indexed=True)
+        data = dumps(dllwt, typecode="i")
+        self.assertLess(len(data), 4200)
+        copy = loads(data)
+        self.assertEqual(list(copy), list(range(1000)))
+        self.assertTrue(copy.indexed)
+        adll = ArrayDoublyLinkedList.from_iterable([1.5, 2.5], typecode="d")
+        self.assertEqual(loads(dumps(adll)).typecode, "d")
+        mixed = SinglyLinkedListWithTail.from_iterable(["a", (1, 2), 3.0])
+        self.assertEqual(list(loads(dumps(mixed))), ["a", (1, 2), 3.0])
+        self.assertEqual(list(loads(dumps(IndexableSkipList.from_iterable("xyz")))), list("xyz"))
+        with self.assertRaises(ValueError):
+            loads(data[:-4])
+        with self.assertRaises(ValueError):
+            loads(b"nope" + data[4:])
+
+class TestMappedDoublyLinkedList(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "list.bin")
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_persists_and_grows(self):
+        with MappedDoublyLinkedList(self.path, capacity=2) as mdll:
+            mdll.extend(range(10))
+            mdll.prepend(-1)
+            mdll.delete_by_key(4)
+            mdll.delete_by_position(0)
+            mdll.append(10)
+            expected = list(mdll)
+            self.assertEqual(mdll.capacity, 16)
+        with MappedDoublyLinkedList(self.path) as mdll:
+            self.assertEqual(list(mdll), expected)
+            self.assertEqual(list(reversed(mdll)), expected[::-1])
+            self.assertEqual(len(mdll), 10)
+            mdll.insert_after(3, 30)
+            for item in range(100, 120):
+                mdll.append(item)
+            self.assertEqual(mdll.capacity, 32)
+        with MappedDoublyLinkedList(self.path) as mdll:
+            self.assertEqual(list(mdll), expected[:4] + [30] + expected[4:] + list(range(100, 120)))
+            reopened = pickle.loads(pickle.dumps(mdll))
+            self.assertEqual(list(reopened), list(mdll))
+            reopened.close()
+
+    def test_typecode_checks(self):
+        MappedDoublyLinkedList(self.path, typecode="d").close()
+        with self.assertRaises(ValueError):
+            MappedDoublyLinkedList(self.path, typecode="q")
+        with self.assertRaises(ValueError):
+            MappedDoublyLinkedList(self.path, typecode=None)
+
+    def test_grows_through_insert_after_and_prepend(self):
+        with MappedDoublyLinkedList(self.path, capacity=4) as mdll:
+            mdll.extend([1, 2, 3, 4])
+            mdll.insert_after(2, 9)
+            self.assertEqual(mdll.capacity, 8)
+            mdll.extend([5, 6, 7])
+            mdll.prepend(0)
+            self.assertEqual(mdll.capacity, 16)
+            items = iter(mdll)
+            self.assertEqual(next(items), 0)
+            mdll.extend(range(10, 20))
+            self.assertEqual(next(items), 1)
+            expected = [0, 1, 2, 9, 3, 4, 5, 6, 7] + list(range(10, 20))
+            self.assertEqual((mdll.capacity, len(mdll), mdll._used), (32, 19, 19))
+        with MappedDoublyLinkedList(self.path) as mdll:
+            self.assertEqual(list(mdll), expected)
+            self.assertEqual(list(reversed(mdll)), expected[::-1])
+
+    def test_short_files_are_rejected(self):
+        with MappedDoublyLinkedList(self.path) as mdll:
+            mdll.extend(range(5))
+        with open(self.path, "rb") as file:
+            contents = file.read()
+        for length in (0, 10, 64, len(contents) - 8):
+            with open(self.path, "wb") as file:
+                file.write(contents[:length])
+            with self.assertRaises(ValueError):
+                MappedDoublyLinkedList(self.path)
+
+if __name__ == "__main__":
+    unittest.main()
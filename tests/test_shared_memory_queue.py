@@ -0,0 +1,107 @@
+import unittest
+import struct
+import sys
+import os
+from array import array
+from multiprocessing import get_context
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.shared_memory_queue import SharedMemoryQueue
+
+def produce(queue, start, count):
+    for value in range(start, start + count, 10):
+        queue.enqueue_many(array("q", range(value, value + 10)))
+
+def consume(queue, count, results):
+    total = 0
+    received = 0
+    while received < count:
+        with queue.read_batch(min(7, count - received), timeout=10) as views:
+            for view in views:
+                values = view.cast("q")
+                total += sum(values)
+                received += len(values)
+                values.release()
+    results.put(total)
+
+class TestSharedMemoryQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = SharedMemoryQueue(capacity=4, record_size=8)
+
+    def tearDown(self):
+        self.queue.close()
+
+    def test_fifo_with_wraparound(self):
+        self.queue.enqueue_many(array("q", [1, 2, 3]))
+        self.assertEqual(struct.unpack("=q", self.queue.dequeue()), (1,))
+        self.queue.enqueue_many(array("q", [4, 5]))
+        self.assertTrue(self.queue.is_full())
+        self.assertEqual(array("q", self.queue.dequeue_many(10)).tolist(), [2, 3, 4, 5])
+        self.assertTrue(self.queue.is_empty())
+
+    def test_read_batch_lends_two_views_when_wrapped(self):
+        self.queue.enqueue_many(array("q", [1, 2, 3]))
+        self.queue.dequeue_many(2)
+        self.queue.enqueue_many(array("q", [4, 5, 6]))
+        with self.queue.read_batch(4) as views:
+            self.assertEqual([view.cast("q").tolist() for view in views], [[3, 4], [5, 6]])
+        self.assertEqual(len(self.queue), 0)
+
+    def test_failed_read_batch_keeps_records(self):
+        self.queue.enqueue(struct.pack("=q", 9))
+        with self.assertRaises(KeyError):
+            with self.queue.read_batch(1):
+                raise KeyError
+        self.assertEqual(self.queue.dequeue(), struct.pack("=q", 9))
+
+    def test_write_batch_fills_slots_in_place(self):
+        self.queue.enqueue_many(array("q", [1, 2, 3]))
+        self.queue.dequeue_many(3)
+        with self.queue.write_batch(3) as views:
+            position = 7
+            for view in views:
+                values = view.cast("q")
+                for index in range(len(values)):
+                    values[index] = position
+                    position += 1
+                values.release()
+        self.assertEqual(array("q", self.queue.dequeue_many(3)).tolist(), [7, 8, 9])
+
+    def test_errors_and_timeouts(self):
+        with self.assertRaises(ValueError):
+            self.queue.enqueue(b"short")
+        with self.assertRaises(ValueError):
+            self.queue.enqueue_many(b"123456789")
+        with self.assertRaises(ValueError):
+            self.queue.dequeue(timeout=0.01)
+        self.assertEqual(self.queue.dequeue_many(2, timeout=0.01), b"")
+        self.queue.enqueue_many(bytes(32))
+        with self.assertRaises(ValueError):
+            self.queue.enqueue(bytes(8), timeout=0.01)
+        with self.assertRaises(ValueError):
+            self.queue.write_batch(5).__enter__()
+        with self.assertRaises(ValueError):
+            SharedMemoryQueue(0, 8)
+
+    def test_reduced_queue_attaches_to_the_same_block(self):
+        function, arguments = self.queue.__reduce__()
+        attached = function(*arguments)
+        attached.enqueue(struct.pack("=q", 5))
+        attached.close()
+        self.assertEqual(self.queue.dequeue(), struct.pack("=q", 5))
+
+    def test_many_producers_and_consumers(self):
+        context = get_context()
+        results = context.Queue()
+        producers = [context.Process(target=produce, args=(self.queue, start, 700)) for start in (0, 700, 1400)]
+        consumers = [context.Process(target=consume, args=(self.queue, 1050, results)) for _ in range(2)]
+        for process in producers + consumers:
+            process.start()
+        totals = [results.get(timeout=30) for _ in consumers]
+        for process in producers + consumers:
+            process.join(30)
+        self.assertEqual(sum(totals), sum(range(2100)))
+        self.assertTrue(self.queue.is_empty())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+import random
+import sys
+import os
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.skip_list import IndexableSkipList
+
+class TestIndexableSkipList(unittest.TestCase):
+    def setUp(self):
+        self.skiplist = IndexableSkipList(seed=3)
+
+    def test_list_api(self):
+        self.skiplist.append(1)
+        self.skiplist.append(2)
+        self.skiplist.prepend(0)
+        self.skiplist.insert_after(1, 1.5)
+        self.assertEqual(str(self.skiplist), "(head) -> 0 -> 1 -> 1.5 -> 2 -> (none)")
+        self.skiplist.delete_by_key(1)
+        self.skiplist.delete_by_position(0)
+        self.assertEqual(self.skiplist.traverse(), ["1.5", "2"])
+        self.assertEqual(self.skiplist.length(), 2)
+        with self.assertRaises(ValueError):
+            self.skiplist.delete_by_key(7)
+        with self.assertRaises(ValueError):
+            self.skiplist.delete_by_position(2)
+        with self.assertRaises(ValueError):
+            self.skiplist.append(None)
+
+    def test_positional_access(self):
+        self.skiplist.extend(range(100))
+        self.assertEqual(self.skiplist.get(42), 42)
+        self.skiplist.insert(42, "x")
+        self.assertEqual(self.skiplist.get(42), "x")
+        self.assertEqual(self.skiplist.get(43), 42)
+        self.assertEqual(self.skiplist.index_of("x"), 42)
+        self.assertEqual(self.skiplist[-1], 99)
+        self.assertEqual(list(self.skiplist[40:44]), [40, 41, "x", 42])
+
+    def test_duplicates_use_first_occurrence(self):
+        self.skiplist.extend([5, 1, 5, 2])
+        self.assertEqual(self.skiplist.index_of(5), 0)
+        self.skiplist.delete_by_key(5)
+        self.assertEqual(self.skiplist.index_of(5), 1)
+        self.skiplist.insert_after(5, 3)
+        self.assertEqual(list(self.skiplist), [1, 5, 3, 2])
+
+    def test_matches_python_list(self):
+        rng = random.Random(11)
+        expected = []
+        for _ in range(3000):
+            operation = rng.randrange(3)
+            if operation < 2 or not expected:
+                position = rng.randrange(len(expected) + 1)
+                data = rng.randrange(50)
+                self.skiplist.insert(position, data)
+                expected.insert(position, data)
+            else:
+                position = rng.randrange(len(expected))
+                self.skiplist.delete_by_position(position)
+                del expected[position]
+            probe = rng.randrange(50)
+            if probe in expected:
+                self.assertEqual(self.skiplist.index_of(probe), expected.index(probe))
+        self.assertEqual(list(self.skiplist), expected)
+        self.assertEqual([self.skiplist.get(i) for i in range(len(expected))], expected)
+
+    def assertCopiesChained(self, skiplist):
+        copies = {}
+        node = skiplist.head.next[0]
+        while node is not None:
+            copies.setdefault(node.data, []).append(node)
+            node = node.next[0]
+        self.assertEqual(set(skiplist._index), set(copies))
+        for data, (first, last) in skiplist._index.items():
+            chained = []
+            while first is not None:
+                chained.append(first)
+                first = first.same_next
+            self.assertEqual(chained, copies[data])
+            self.assertIs(last, chained[-1])
+
+    def test_many_duplicates(self):
+        rng = random.Random(6)
+        expected = []
+        for _ in range(3000):
+            operation = rng.randrange(4)
+            data = rng.randrange(3)
+            if operation == 0 or not expected:
+                position = rng.randrange(len(expected) + 1)
+                self.skiplist.insert(position, data)
+                expected.insert(position, data)
+            elif operation == 1 and data in expected:
+                self.skiplist.delete_by_key(data)
+                expected.remove(data)
+            elif operation == 2 and data in expected:
+                value = rng.randrange(3)
+                self.skiplist.insert_after(data, value)
+                expected.insert(expected.index(data) + 1, value)
+            else:
+                position = rng.randrange(len(expected))
+                self.skiplist.delete_by_position(position)
+                del expected[position]
+            for key in range(3):
+                if key in expected:
+                    self.assertEqual(self.skiplist.index_of(key), expected.index(key))
+                else:
+                    self.assertNotIn(key, self.skiplist)
+            self.assertCopiesChained(self.skiplist)
+        self.assertEqual(list(self.skiplist), expected)
+
+    def test_deleting_duplicates_scales(self):
+        def run(count):
+            skiplist = IndexableSkipList.from_iterable([7] * count, seed=1)
+            start = time.perf_counter()
+            for _ in range(count // 2):
+                skiplist.delete_by_key(7)
+            return time.perf_counter() - start
+        small, large = min(run(2000) for _ in range(3)), min(run(16000) for _ in range(3))
+        self.assertLess(large, small * 8 * 3)
+
+    def test_deleting_scattered_duplicates_scales(self):
+        def run(count):
+            skiplist = IndexableSkipList.from_iterable(list(range(count // 2)) * 2, seed=1)
+            start = time.perf_counter()
+            for _ in range(count // 4):
+                skiplist.delete_by_position(0)
+            return time.perf_counter() - start
+        small, large = min(run(2000) for _ in range(3)), min(run(16000) for _ in range(3))
+        self.assertLess(large, small * 8 * 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.linked_list import (
+    SinglyLinkedListWithoutTail, SinglyLinkedListWithTail, UnrolledLinkedList,
+    DoublyLinkedListWithoutTail, DoublyLinkedListWithTail, CircularSinglyLinkedListWithoutTail,
+    CircularSinglyLinkedListWithTail, CircularDoublyLinkedListWithTail, merge_sorted,
+)
+
+FACTORIES = [
+    SinglyLinkedListWithoutTail.from_iterable,
+    lambda items: SinglyLinkedListWithTail.from_iterable(items, indexed=True),
+    lambda items: UnrolledLinkedList.from_iterable(items, block_size=4),
+    DoublyLinkedListWithoutTail.from_iterable,
+    lambda items: DoublyLinkedListWithTail.from_iterable(items, indexed=True),
+    lambda items: CircularSinglyLinkedListWithoutTail.from_iterable(items, indexed=True),
+    CircularSinglyLinkedListWithTail.from_iterable,
+    CircularDoublyLinkedListWithTail.from_iterable,
+]
+
+class TestSort(unittest.TestCase):
+    def test_matches_sorted(self):
+        rng = random.Random(11)
+        for factory in FACTORIES:
+            for size in (0, 1, 2, 3, 17, 64, 100):
+                items = [(rng.randrange(5), i) for i in range(size)]
+                for reverse in (False, True):
+                    linked_list = factory(items)
+                    linked_list.sort(key=lambda item: item[0], reverse=reverse)
+                    expected = sorted(items, key=lambda item: item[0], reverse=reverse)
+                    self.assertEqual(list(linked_list), expected)
+                    self.assertEqual(list(reversed(linked_list)), expected[::-1])
+                    self.assertEqual(len(linked_list), size)
+                    linked_list.append((9, -1))
+                    linked_list.prepend((-1, -1))
+                    self.assertEqual(list(linked_list), [(-1, -1)] + expected + [(9, -1)])
+                    if expected:
+                        linked_list.delete_by_key(expected[-1])
+                        self.assertNotIn(expected[-1], linked_list)
+
+    def test_relinks_nodes(self):
+        dllwt = DoublyLinkedListWithTail.from_iterable([3, 1, 2])
+        nodes = {dllwt.head, dllwt.head.next, dllwt.tail}
+        dllwt.sort()
+        self.assertEqual({dllwt.head, dllwt.head.next, dllwt.tail}, nodes)
+        self.assertEqual(str(dllwt), "1 <--> 2 <--> 3")
+        self.assertIsNone(dllwt.head.prev)
+        self.assertIsNone(dllwt.tail.next)
+
+    def test_merge_sorted(self):
+        first = SinglyLinkedListWithTail.from_iterable([1, 4, 7])
+        second = DoublyLinkedListWithTail.from_iterable([2, 4, 8])
+        merged = merge_sorted(first, second, [0, 9])
+        self.assertEqual(next(merged), 0)
+        self.assertEqual(list(merged), [1, 2, 4, 4, 7, 8, 9])
+        descending = merge_sorted([(3, "a"), (1, "a")], [(3, "b"), (2, "b")], key=lambda item: item[0], reverse=True)
+        self.assertEqual(list(descending), [(3, "a"), (3, "b"), (2, "b"), (1, "a")])
+
+if __name__ == "__main__":
+    unittest.main()
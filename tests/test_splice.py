@@ -0,0 +1,79 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.linked_list import SinglyLinkedListWithTail, DoublyLinkedListWithTail
+
+class TestSpliceAndSplit(unittest.TestCase):
+    classes = [SinglyLinkedListWithTail, DoublyLinkedListWithTail]
+
+    def assertWellFormed(self, linked_list, expected):
+        self.assertEqual(list(linked_list), expected)
+        self.assertEqual(linked_list.size, len(expected))
+        if expected:
+            self.assertEqual(linked_list.tail.data, expected[-1])
+            self.assertIsNone(linked_list.tail.next)
+        else:
+            self.assertIsNone(linked_list.head)
+            self.assertIsNone(linked_list.tail)
+        if hasattr(linked_list.head, "prev"):
+            self.assertEqual(list(reversed(linked_list)), expected[::-1])
+
+    def test_concat(self):
+        for cls in self.classes:
+            for indexed in (False, True):
+                first = cls.from_iterable([1, 2], indexed=indexed)
+                second = cls.from_iterable([2, 3], indexed=indexed)
+                first.concat(second)
+                self.assertWellFormed(first, [1, 2, 2, 3])
+                self.assertWellFormed(second, [])
+                first.concat(cls())
+                empty = cls(indexed=indexed)
+                empty.concat(first)
+                self.assertWellFormed(empty, [1, 2, 2, 3])
+                empty.delete_by_key(2)
+                empty.delete_by_key(3)
+                self.assertWellFormed(empty, [1, 2])
+                with self.assertRaises(ValueError):
+                    empty.concat(empty)
+                with self.assertRaises(TypeError):
+                    empty.concat([4])
+
+    def test_splice_after(self):
+        for cls in self.classes:
+            for indexed in (False, True):
+                target = cls.from_iterable([1, 2, 3], indexed=indexed)
+                target.splice_after(1, cls.from_iterable([7, 3]))
+                self.assertWellFormed(target, [1, 7, 3, 2, 3])
+                target.splice_after(target.tail, cls.from_iterable([8]))
+                self.assertWellFormed(target, [1, 7, 3, 2, 3, 8])
+                target.delete_by_key(3)
+                target.insert_after(3, 9)
+                self.assertWellFormed(target, [1, 7, 2, 3, 9, 8])
+                with self.assertRaises(ValueError):
+                    target.splice_after(42, cls.from_iterable([1]))
+
+    def test_split(self):
+        for cls in self.classes:
+            for indexed in (False, True):
+                linked_list = cls.from_iterable([1, 2, 3, 1, 4], indexed=indexed)
+                suffix = linked_list.split_at(2)
+                self.assertWellFormed(linked_list, [1, 2])
+                self.assertWellFormed(suffix, [3, 1, 4])
+                rest = suffix.split_after(suffix.head)
+                self.assertWellFormed(suffix, [3])
+                self.assertWellFormed(rest, [1, 4])
+                rest.delete_by_key(1)
+                linked_list.delete_by_key(1)
+                self.assertWellFormed(rest, [4])
+                self.assertWellFormed(linked_list, [2])
+                everything = linked_list.split_at(0)
+                self.assertWellFormed(linked_list, [])
+                self.assertWellFormed(everything, [2])
+                self.assertWellFormed(everything.split_at(1), [])
+                with self.assertRaises(ValueError):
+                    everything.split_at(2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.queue import SPSCRingBuffer
+
+class TestSPSCRingBuffer(unittest.TestCase):
+    def test_single_thread_fifo_and_wraparound(self):
+        buffer = SPSCRingBuffer(3)
+        for item in (1, 2, 3):
+            buffer.enqueue(item)
+        self.assertTrue(buffer.is_full())
+        with self.assertRaises(ValueError):
+            buffer.try_enqueue(4)
+        self.assertEqual(buffer.dequeue(), 1)
+        buffer.enqueue(4)
+        self.assertEqual(str(buffer), "[2, 3, 4]")
+        self.assertEqual(buffer.dequeue_many(10), [2, 3, 4])
+        self.assertEqual(buffer.queue, [None] * 3)
+        self.assertIsNone(buffer.try_dequeue())
+        self.assertTrue(buffer.is_empty())
+
+    def test_timeouts(self):
+        buffer = SPSCRingBuffer(1, spin=2, max_sleep=0.001)
+        with self.assertRaises(ValueError):
+            buffer.dequeue(timeout=0.01)
+        buffer.enqueue(1)
+        with self.assertRaises(ValueError):
+            buffer.enqueue(2, timeout=0.01)
+        with self.assertRaises(ValueError):
+            buffer.enqueue_many([2, 3], timeout=0.01)
+        self.assertEqual(len(buffer), 1)
+
+    def test_rejects_none_and_bad_arguments(self):
+        buffer = SPSCRingBuffer(4)
+        with self.assertRaises(ValueError):
+            buffer.enqueue(None)
+        with self.assertRaises(ValueError):
+            buffer.enqueue_many([1, None])
+        self.assertTrue(buffer.is_empty())
+        with self.assertRaises(ValueError):
+            buffer.dequeue_many(-1)
+        with self.assertRaises(ValueError):
+            SPSCRingBuffer(0)
+
+    def test_close_lets_consumer_drain_then_stop(self):
+        buffer = SPSCRingBuffer(4)
+        buffer.enqueue(1)
+        buffer.close()
+        with self.assertRaises(ValueError):
+            buffer.enqueue(2)
+        self.assertEqual(buffer.dequeue(), 1)
+        with self.assertRaises(ValueError):
+            buffer.dequeue()
+
+    def test_producer_consumer_threads_keep_order(self):
+        buffer = SPSCRingBuffer(16, spin=10)
+        count = 20000
+        received = []
+
+        def produce():
+            for start in range(0, count, 500):
+                for item in range(start, start + 250):
+                    buffer.enqueue(item)
+                buffer.enqueue_many(range(start + 250, start + 500))
+            buffer.close()
+
+        def consume():
+            while True:
+                batch = buffer.dequeue_many(64)
+                if batch:
+                    received.extend(batch)
+                    continue
+                try:
+                    received.append(buffer.dequeue())
+                except ValueError:
+                    return
+
+        threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+        self.assertEqual(received, list(range(count)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import sys
+import os
+from array import array
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.imports import np
+from data_structures.stack import TypedStack
+
+class TestTypedStack(unittest.TestCase):
+    def check_backend(self, backend):
+        stack = TypedStack("q", backend=backend, capacity=2)
+        stack.push(1)
+        stack.push_many(range(2, 6))
+        stack.push_many(array("q", [6, 7]))
+        self.assertEqual(stack.size(), 7)
+        self.assertEqual(stack.peek(), 7)
+        popped = stack.pop_many(3)
+        self.assertEqual(popped.tolist(), [5, 6, 7])
+        self.assertEqual(stack.pop(), 4)
+        self.assertEqual(str(stack), "[1, 2, 3]")
+        stack.push_many(range(100))
+        self.assertEqual(popped.tolist(), [5, 6, 7])
+        self.assertEqual(len(stack), 103)
+        self.assertEqual(stack.pop_many(0).tolist(), [])
+        with self.assertRaises(ValueError):
+            stack.pop_many(104)
+        stack.pop_many(103)
+        self.assertTrue(stack.is_empty())
+        with self.assertRaises(ValueError):
+            stack.pop()
+        with self.assertRaises(ValueError):
+            stack.peek()
+
+    def test_array_backend(self):
+        self.check_backend("array")
+        floats = TypedStack("d")
+        floats.push_many([0.5, 1.5])
+        floats.push(2)
+        self.assertEqual(floats.pop_many(3).tolist(), [0.5, 1.5, 2.0])
+        with self.assertRaises(TypeError):
+            TypedStack("q").push("x")
+        with self.assertRaises(ValueError):
+            TypedStack("q", backend="list")
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_backend(self):
+        self.check_backend("numpy")
+        stack = TypedStack("q")
+        stack.push_many(np.arange(5))
+        self.assertEqual(stack.pop_many(2).tolist(), [3, 4])
+
+if __name__ == "__main__":
+    unittest.main()
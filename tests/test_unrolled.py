@@ -0,0 +1,67 @@
+import unittest
+import random
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_structures.linked_list import UnrolledLinkedList
+
+class TestUnrolledLinkedList(unittest.TestCase):
+    def setUp(self):
+        self.ull = UnrolledLinkedList(block_size=4)
+
+    def test_list_api(self):
+        for i in range(1, 6):
+            self.ull.append(i)
+        self.ull.prepend(0)
+        self.ull.insert_after(2, 2.5)
+        self.assertEqual(str(self.ull), "(head) -> 0 -> 1 -> 2 -> 2.5 -> 3 -> 4 -> 5 -> (tail)")
+        self.ull.delete_by_key(2.5)
+        self.ull.delete_by_position(0)
+        self.assertEqual(self.ull.traverse(), ["1", "2", "3", "4", "5"])
+        self.assertEqual(self.ull.length(), 5)
+        with self.assertRaises(ValueError):
+            self.ull.delete_by_key(9)
+        with self.assertRaises(ValueError):
+            self.ull.insert_after(9, 10)
+        with self.assertRaises(ValueError):
+            self.ull.delete_by_position(5)
+        with self.assertRaises(ValueError):
+            self.ull.append(None)
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(block_size=1)
+
+    def test_blocks_stay_balanced(self):
+        rng = random.Random(5)
+        expected = []
+        for _ in range(3000):
+            if expected and rng.random() < 0.45:
+                position = rng.randrange(len(expected))
+                self.ull.delete_by_position(position)
+                del expected[position]
+            elif expected and rng.random() < 0.5:
+                key = rng.choice(expected)
+                self.ull.insert_after(key, len(expected))
+                expected.insert(expected.index(key) + 1, len(expected))
+            else:
+                self.ull.append(len(expected))
+                expected.append(len(expected))
+            self.assertEqual(len(self.ull), len(expected))
+        self.assertEqual(list(self.ull), expected)
+        block = self.ull.head
+        while block:
+            self.assertTrue(0 < len(block.items) <= 4)
+            if block.next is None:
+                self.assertIs(block, self.ull.tail)
+            block = block.next
+
+    def test_bulk_and_indexing(self):
+        ull = UnrolledLinkedList.from_iterable(range(10), block_size=3)
+        ull.extend_left([-2, -1])
+        self.assertEqual(ull[0], -2)
+        self.assertEqual(ull[11], 9)
+        self.assertEqual(list(ull[3:6]), [1, 2, 3])
+        self.assertEqual(list(reversed(ull))[:2], [9, 8])
+
+if __name__ == "__main__":
+    unittest.main()